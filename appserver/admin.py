@@ -1,16 +1,42 @@
 import ujson
-from fastapi import status
+from fastapi import HTTPException, status
 from sqladmin import Admin
 from jose.exceptions import JWTError
 from sqladmin.authentication import AuthenticationBackend
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
 from starlette.requests import Request
 
-from appserver.apps.account.utils import decode_token
+from appserver.apps.account.utils import decode_token, discard_verified_token
+from appserver.apps.account.revocation import revocation_list, revoke_auth_token
 from appserver.apps.account.schemas import LoginPayload
 from appserver.apps.account.endpoints import login
-from appserver.apps.account.admin import OAuthAccountAdmin, UserAdmin
+from appserver.apps.account.admin import OAuthAccountAdmin, UserAdmin, UserImportAdmin
 from appserver.apps.calendar.admin import BookingAdmin, BookingFileAdmin, CalendarAdmin, TimeSlotAdmin
 from appserver.db import use_session
+from appserver.loader_profiles import loader_options
+
+class AdminSession(Session):
+    """관리자 화면 세션. 모델의 관계는 기본으로 읽지 않으므로 쿼리마다 `admin` 로더 프로필을 붙인다."""
+
+
+@event.listens_for(AdminSession, "do_orm_execute")
+def apply_admin_loader_profile(state: ORMExecuteState) -> None:
+    if not state.is_select or state.is_column_load or state.is_relationship_load:
+        return
+    # 모델 하나를 통째로 읽는 쿼리에만 붙인다. 개수 세기나 컬럼 조회에는 붙일 관계가 없다.
+    descriptions = state.statement.column_descriptions
+    if len(descriptions) != 1 or descriptions[0]["expr"] is not descriptions[0]["entity"]:
+        return
+    options = loader_options("admin", descriptions[0]["entity"])
+    if options:
+        state.statement = state.statement.options(*options)
+
+
+def create_admin_session(engine: AsyncEngine) -> sessionmaker:
+    return sessionmaker(bind=engine, class_=AsyncSession, sync_session_class=AdminSession)
+
 
 def include_admin_views(admin: Admin):
     admin.add_view(UserAdmin)
@@ -19,6 +45,7 @@ def include_admin_views(admin: Admin):
     admin.add_view(BookingAdmin)
     admin.add_view(BookingFileAdmin)
     admin.add_view(OAuthAccountAdmin)
+    admin.add_view(UserImportAdmin)
 
 
 class AdminAuthentication(AuthenticationBackend):
@@ -28,7 +55,11 @@ class AdminAuthentication(AuthenticationBackend):
         payload = LoginPayload(username=username, password=password)
 
         async for session in use_session():
-            res = await login(payload, session)
+            try:
+                res = await login(payload, session, request)
+            except HTTPException:
+                # 없는 사용자, 틀린 비밀번호, 시도 횟수 초과
+                return False
             if res.status_code == status.HTTP_200_OK:
                 try:
                     data = ujson.loads(res.body)
@@ -41,6 +72,10 @@ class AdminAuthentication(AuthenticationBackend):
         return False
 
     async def logout(self, request: Request) -> bool:
+        if token := request.session.get("token"):
+            async for session in use_session():
+                await revoke_auth_token(token, session)
+            discard_verified_token(token)
         request.session.clear()
         return True
 
@@ -51,6 +86,10 @@ class AdminAuthentication(AuthenticationBackend):
             return False
 
         try:
-            return not not decode_token(token)
+            decoded = decode_token(token)
         except JWTError:
-            return False
\ No newline at end of file
+            return False
+
+        async for session in use_session():
+            return not await revocation_list.is_revoked(decoded.get("jti"), session)
+        return False
\ No newline at end of file
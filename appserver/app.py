@@ -1,4 +1,7 @@
+import asyncio
 import os
+from contextlib import asynccontextmanager, suppress
+
 import sentry_sdk
 from sentry_sdk.integrations.starlette import StarletteIntegration
 from sentry_sdk.integrations.fastapi import FastApiIntegration
@@ -8,12 +11,47 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqladmin import Admin
 from sqlalchemy.ext.asyncio import AsyncEngine
 
-from appserver.apps.account.endpoints import router as account_router
-from appserver.apps.calendar.endpoints import router as calendar_router
-from appserver.admin import include_admin_views, AdminAuthentication
-from .db import engine
-
-app = FastAPI()
+from appserver.apps.account.endpoints import router as account_router, NEXT_CURSOR_HEADER
+from appserver.apps.account.bulk_import import import_password_hasher
+from appserver.apps.account.hashing import password_hasher
+from appserver.apps.account.revocation import REVOCATION_PURGE_INTERVAL, run_revocation_purge_scheduler
+from appserver.apps.calendar.endpoints import (
+    router as calendar_router,
+    GOOGLE_CALENDAR_STALE_HEADER,
+    PARTIAL_RESULT_HEADER,
+)
+from appserver.apps.calendar.channels import CHANNEL_WEBHOOK_URL, run_channel_scheduler
+from appserver.admin import create_admin_session, include_admin_views, AdminAuthentication
+from appserver.libs.google.calendar.deps import get_google_calendar_service
+from appserver.libs.google.calendar.transport import close_shared_transport
+from .db import engine, async_session_factory
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    tasks = []
+    # 만료된 토큰 철회 기록은 요청 세션이 아닌 별도 세션에서 주기적으로 지운다.
+    if REVOCATION_PURGE_INTERVAL > 0:
+        tasks.append(asyncio.create_task(run_revocation_purge_scheduler(async_session_factory)))
+    # google_event_id 보정(reconcile)은 워커마다 돌면 서로 일정을 만들고 지우므로 lifespan 에서 돌리지 않는다.
+    # `python -m appserver.apps.calendar.reconcile --interval` 프로세스 하나나 cron 으로 실행한다.
+    service = get_google_calendar_service() if CHANNEL_WEBHOOK_URL else None
+    if service is not None:
+        # GOOGLE_CALENDAR_WEBHOOK_URL 이 설정되어 있으면 캘린더마다 watch 채널을 등록·갱신한다.
+        tasks.append(asyncio.create_task(run_channel_scheduler(async_session_factory, service, CHANNEL_WEBHOOK_URL)))
+
+    yield
+
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await close_shared_transport()
+    password_hasher.shutdown()
+    import_password_hasher.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 @app.get("/health")
 async def health():
@@ -34,6 +72,7 @@ def init_middleware(_app: FastAPI):
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[GOOGLE_CALENDAR_STALE_HEADER, PARTIAL_RESULT_HEADER, NEXT_CURSOR_HEADER],
     )
 
 
@@ -45,7 +84,9 @@ def init_admin(_app: FastAPI, _engine: AsyncEngine):
     return Admin(
         _app,
         _engine,
+        session_maker=create_admin_session(_engine),
         base_url="/seungzzang/admin/",
+        templates_dir=os.path.join(os.path.dirname(__file__), "templates"),
         authentication_backend=AdminAuthentication("secret-key"),
     )
 
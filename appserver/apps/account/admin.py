@@ -5,13 +5,17 @@ from typing import Any, Type
 
 import wtforms as wtf
 from fastapi import Request
-from sqladmin import ModelView, fields
+from sqladmin import BaseView, ModelView, expose, fields
+from starlette.datastructures import UploadFile
 from sqlmodel import select
 from sqlalchemy.sql.expression import Select, select
 
+from appserver.apps.account.bulk_import import guess_format, import_users, read_binary_records
+from appserver.apps.account.cache import host_directory_cache, user_cache
 from appserver.apps.account.enums import AccountStatus
-from appserver.apps.account.utils import hash_password
+from appserver.apps.account.utils import hash_password_async
 from appserver.apps.account.models import User, OAuthAccount
+from appserver.db import use_session
 
 
 
@@ -82,7 +86,7 @@ class UserAdmin(ModelView, model=User):
     #             data["hashed_password"] = hash_password(data["hashed_password"])
 
     async def insert_model(self, request: Request, data: dict) -> Any:
-        data["hashed_password"] = hash_password(data["hashed_password"])
+        data["hashed_password"] = await hash_password_async(data["hashed_password"])
         return await super().insert_model(request, data)
 
     async def update_model(self, request: Request, pk: str, data: dict) -> Any:
@@ -90,8 +94,19 @@ class UserAdmin(ModelView, model=User):
             obj: User = await session.get(User, pk)
             
         if obj.hashed_password != data["hashed_password"]:
-            data["hashed_password"] = hash_password(data["hashed_password"])
-        return await super().update_model(request, pk, data)
+            data["hashed_password"] = await hash_password_async(data["hashed_password"])
+        # 권한이 바뀌면 토큰 버전을 올려서 이전에 발급한 토큰을 쓸 수 없게 한다.
+        if obj.is_host != data.get("is_host", obj.is_host) or obj.status != data.get("status", obj.status):
+            data["token_version"] = obj.token_version + 1
+        model = await super().update_model(request, pk, data)
+        # 사용자 계정 ID 가 바뀌었을 수 있으므로 이전 ID 로 캐시된 것도 지운다.
+        user_cache.invalidate(obj.username)
+        return model
+
+    async def after_model_change(self, data: dict, model: User, is_created: bool, request: Request) -> None:
+        user_cache.invalidate(model.username)
+        # 호스트 여부, 상태, 표시 이름 중 무엇이 바뀌었든 호스트 목록이 달라질 수 있다.
+        host_directory_cache.invalidate()
 
     async def on_model_delete(self, model: User, request: Request) -> None:
         random_string = "".join(random.choices(string.ascii_letters + string.digits, k=8))
@@ -103,12 +118,15 @@ class UserAdmin(ModelView, model=User):
     async def delete_model(self, request: Request, pk: Any) -> None:
         async with self.session_maker() as session:
             obj: User = await session.get(User, pk)
+            user_cache.invalidate(obj.username)
 
             await self.on_model_delete(obj, request)
 
             obj.status = AccountStatus.DELETED.value
+            obj.token_version += 1
             await session.commit()
             await session.refresh(obj)
+            host_directory_cache.invalidate()
 
             await self.after_model_delete(obj, request)
 
@@ -169,4 +187,34 @@ class OAuthAccountAdmin(ModelView, model=OAuthAccount):
             "fields": ["id", "username"],
             "order_by": "id",
         },
-    }
\ No newline at end of file
+    }
+
+
+class UserImportAdmin(BaseView):
+    category = "계정"
+    icon = "fa-solid fa-file-import"
+    name = "사용자 가져오기"
+
+    @expose("/users/import", methods=["GET", "POST"])
+    async def import_page(self, request: Request):
+        context = {"title": "사용자 가져오기", "subtitle": "CSV 또는 NDJSON 파일로 사용자와 호스트를 한꺼번에 만듭니다."}
+        if request.method == "POST":
+            form = await request.form()
+            upload = form.get("file")
+            if not isinstance(upload, UploadFile) or not upload.filename:
+                context["error"] = "가져올 파일을 선택해 주세요."
+                return await self.templates.TemplateResponse(request, "admin/user_import.html", context, status_code=400)
+            try:
+                # UTF-8 이 아닌 줄은 CLI 와 같이 그 행만 오류로 남긴다.
+                records = read_binary_records(upload.file, form.get("format") or guess_format(upload.filename))
+            except ValueError as e:
+                context["error"] = str(e)
+                return await self.templates.TemplateResponse(request, "admin/user_import.html", context, status_code=400)
+            async for session in use_session():
+                context["report"] = await import_users(
+                    session,
+                    records,
+                    create_calendars=form.get("create_calendars") == "on",
+                )
+        return await self.templates.TemplateResponse(request, "admin/user_import.html", context)
+
@@ -0,0 +1,391 @@
+"""
+사용자·호스트 일괄 가져오기
+
+단체 하나를 받을 때 `/account/signup` 을 사람 수만큼 부르면 argon2 해싱이 한 번에 하나씩 돌아 오래 걸린다.
+이 모듈은 CSV/NDJSON 파일을 한 번에 읽지 않고 `batch_size` 행씩 읽으며, 묶음마다
+- 행을 검증하고, 파일 안 중복과 이미 있는 사용자 계정 ID·이메일을 쿼리 한 번으로 걸러 낸 뒤
+- 비밀번호를 프로세스 풀에서 병렬로 해싱하고
+- users (와 호스트의 calendars) 를 executemany INSERT 로 넣고 묶음마다 커밋한다.
+잘못된 행은 건너뛰고 줄 번호와 이유를 보고서에 남긴다.
+
+파일 형식
+- CSV: 머리글 행에 username, email, display_name, password, is_host, calendar_topics(`|` 로 구분),
+  calendar_description, google_calendar_id. display_name 이 비어 있으면 username 을 쓴다.
+- NDJSON: 한 줄에 객체 하나. 필드는 CSV 와 같고 calendar_topics 는 문자열 목록.
+
+CLI: `python -m appserver.apps.account.bulk_import users.csv --batch-size 500 --workers 8 --create-calendars`
+관리자 화면: 계정 > 사용자 가져오기
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, BinaryIO, Iterable, Iterator, Literal, Sequence, TextIO
+
+from pydantic import ValidationError
+from sqlalchemy import insert, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.apps.calendar.models import Calendar
+from appserver.apps.calendar.schemas import CalendarCreateIn
+
+from .cache import host_directory_cache
+from .hashing import PasswordHashingService
+from .models import User
+from .schemas import ImportUserRow
+
+
+IMPORT_BATCH_SIZE = int(os.getenv("ACCOUNT_IMPORT_BATCH_SIZE", "500"))
+IMPORT_HASH_WORKERS = int(os.getenv("ACCOUNT_IMPORT_HASH_WORKERS", str(os.cpu_count() or 1)))
+
+ImportFormat = Literal["csv", "ndjson"]
+
+# 관리자 화면에서 쓰는 해싱 풀. 로그인용 풀과 따로 두어 가져오는 동안에도 로그인이 밀리지 않게 한다.
+# 프로세스는 처음 쓸 때 띄운다.
+import_password_hasher = PasswordHashingService(executor="process", max_workers=IMPORT_HASH_WORKERS)
+
+
+@dataclass
+class ImportRecord:
+    line: int
+    data: dict[str, Any] | None
+    error: str | None = None
+
+
+@dataclass
+class ImportRowError:
+    line: int
+    username: str | None
+    message: str
+
+    def __str__(self):
+        return f"line {self.line} ({self.username or '-'}): {self.message}"
+
+
+@dataclass
+class ImportReport:
+    processed: int = 0
+    created: int = 0
+    calendars_created: int = 0
+    errors: list[ImportRowError] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+    @property
+    def rows_per_second(self) -> float:
+        if not self.elapsed:
+            return 0.0
+        return self.processed / self.elapsed
+
+    def __str__(self):
+        return (
+            f"processed={self.processed} created={self.created} calendars={self.calendars_created} "
+            f"failed={self.failed} elapsed={self.elapsed:.2f}s throughput={self.rows_per_second:.1f} rows/s"
+        )
+
+
+def read_csv(stream: TextIO) -> Iterator[ImportRecord]:
+    """
+    >>> import io
+    >>> records = read_csv(io.StringIO("username,email,password,calendar_topics\\npuddingcamp,a@example.com,testtest,a|b\\n"))
+    >>> next(records)
+    ImportRecord(line=2, data={'username': 'puddingcamp', 'email': 'a@example.com', 'password': 'testtest', 'calendar_topics': ['a', 'b']}, error=None)
+    """
+    reader = csv.DictReader(stream)
+    for row in reader:
+        # 빈 칸은 값이 없는 것으로 본다.
+        data = {key: value for key, value in row.items() if key and value not in (None, "")}
+        if "calendar_topics" in data:
+            data["calendar_topics"] = [topic.strip() for topic in data["calendar_topics"].split("|") if topic.strip()]
+        yield ImportRecord(line=reader.line_num, data=data)
+
+
+def read_ndjson(stream: TextIO) -> Iterator[ImportRecord]:
+    """
+    >>> import io
+    >>> [record.error for record in read_ndjson(io.StringIO('{"username": "puddingcamp"}\\n\\n[1]\\n{'))]
+    [None, '한 줄에 JSON 객체 하나가 있어야 합니다.', 'JSON 형식이 아닙니다.']
+    """
+    for line, text in enumerate(stream, start=1):
+        if not text.strip():
+            continue
+        try:
+            data = json.loads(text)
+        except ValueError:
+            yield ImportRecord(line=line, data=None, error="JSON 형식이 아닙니다.")
+            continue
+        if not isinstance(data, dict):
+            yield ImportRecord(line=line, data=None, error="한 줄에 JSON 객체 하나가 있어야 합니다.")
+            continue
+        yield ImportRecord(line=line, data=data)
+
+
+def read_records(stream: TextIO, format: ImportFormat) -> Iterator[ImportRecord]:
+    match format:
+        case "csv":
+            return read_csv(stream)
+        case "ndjson":
+            return read_ndjson(stream)
+        case _:
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {format}")
+
+
+def decode_lines(stream: Iterable[bytes], undecodable: list[int]) -> Iterator[str]:
+    """
+    바이트 줄을 하나씩 UTF-8 로 푼다. 풀 수 없는 줄은 빈 줄로 바꾸고 줄 번호를 `undecodable` 에 남긴다.
+    CSV·NDJSON 모두 빈 줄은 건너뛰므로 나머지 행은 그대로 가져온다.
+
+    >>> undecodable = []
+    >>> list(decode_lines([b"\\xef\\xbb\\xbfa\\n", "나\\n".encode("cp949"), b"b"], undecodable)), undecodable
+    (['a\\n', '\\n', 'b'], [2])
+    """
+    for line, raw in enumerate(stream, start=1):
+        try:
+            yield raw.decode("utf-8-sig" if line == 1 else "utf-8")
+        except UnicodeDecodeError:
+            undecodable.append(line)
+            yield "\n"
+
+
+def read_binary_records(stream: BinaryIO, format: ImportFormat) -> Iterator[ImportRecord]:
+    """
+    바이너리 파일을 읽는다. UTF-8 이 아닌 줄은 파일 전체를 실패시키지 않고 그 행만 오류로 남긴다.
+    CLI 와 관리자 화면이 같이 쓴다.
+    """
+    undecodable: list[int] = []
+    records = read_records(decode_lines(stream, undecodable), format)
+
+    def _records() -> Iterator[ImportRecord]:
+        for record in records:
+            yield from _undecodable_records(undecodable)
+            yield record
+        yield from _undecodable_records(undecodable)
+
+    return _records()
+
+
+def _undecodable_records(undecodable: list[int]) -> Iterator[ImportRecord]:
+    while undecodable:
+        yield ImportRecord(line=undecodable.pop(0), data=None, error="UTF-8 로 읽을 수 없는 줄입니다.")
+
+
+def guess_format(filename: str) -> ImportFormat:
+    """
+    >>> guess_format("users.CSV"), guess_format("users.jsonl")
+    ('csv', 'ndjson')
+    """
+    if filename.lower().endswith(".csv"):
+        return "csv"
+    return "ndjson"
+
+
+@dataclass
+class _PendingRow:
+    line: int
+    row: ImportUserRow
+    calendar: CalendarCreateIn | None
+    hashed_password: str = ""
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, error['loc'])) or '-'}: {error['msg']}" for error in exc.errors())
+
+
+async def import_users(
+    session: AsyncSession,
+    records: Iterable[ImportRecord],
+    *,
+    hasher: PasswordHashingService = import_password_hasher,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    create_calendars: bool = False,
+) -> ImportReport:
+    report = ImportReport()
+    started_at = time.perf_counter()
+    # 파일 안에서 이미 나온 사용자 계정 ID·이메일
+    seen_usernames: set[str] = set()
+    seen_emails: set[str] = set()
+
+    iterator = iter(records)
+    while chunk := list(islice(iterator, batch_size)):
+        report.processed += len(chunk)
+        pending = _validate_chunk(chunk, report, seen_usernames, seen_emails, create_calendars)
+        pending = await _exclude_existing(session, pending, report)
+        if not pending:
+            continue
+
+        hashed_passwords = await asyncio.gather(*(hasher.ahash(item.row.password) for item in pending))
+        for item, hashed_password in zip(pending, hashed_passwords):
+            item.hashed_password = hashed_password
+
+        try:
+            created, calendars_created = await _insert_chunk(session, pending)
+        except IntegrityError:
+            # 그사이 다른 곳에서 같은 사용자를 만들었다. 이 묶음만 한 행씩 다시 넣어 실패한 행을 찾는다.
+            await session.rollback()
+            created, calendars_created = await _insert_one_by_one(session, pending, report)
+        report.created += created
+        report.calendars_created += calendars_created
+
+    if report.created:
+        host_directory_cache.invalidate()
+    report.errors.sort(key=lambda error: error.line)
+    report.elapsed = time.perf_counter() - started_at
+    return report
+
+
+def _validate_chunk(
+    chunk: Sequence[ImportRecord],
+    report: ImportReport,
+    seen_usernames: set[str],
+    seen_emails: set[str],
+    create_calendars: bool,
+) -> list[_PendingRow]:
+    pending = []
+    for record in chunk:
+        username = record.data.get("username") if record.data else None
+        if record.error is not None:
+            report.errors.append(ImportRowError(record.line, username, record.error))
+            continue
+
+        try:
+            row = ImportUserRow.model_validate(record.data)
+            calendar = None
+            if create_calendars and row.is_host and row.google_calendar_id is not None:
+                calendar = CalendarCreateIn(
+                    topics=row.calendar_topics or [],
+                    description=row.calendar_description or "",
+                    google_calendar_id=row.google_calendar_id,
+                )
+        except ValidationError as exc:
+            report.errors.append(ImportRowError(record.line, username, _validation_message(exc)))
+            continue
+
+        if row.username in seen_usernames:
+            report.errors.append(ImportRowError(record.line, row.username, "파일 안에 같은 사용자 계정 ID 가 있습니다."))
+            continue
+        if row.email in seen_emails:
+            report.errors.append(ImportRowError(record.line, row.username, "파일 안에 같은 이메일이 있습니다."))
+            continue
+        seen_usernames.add(row.username)
+        seen_emails.add(row.email)
+        pending.append(_PendingRow(record.line, row, calendar))
+    return pending
+
+
+async def _exclude_existing(session: AsyncSession, pending: list[_PendingRow], report: ImportReport) -> list[_PendingRow]:
+    if not pending:
+        return pending
+
+    stmt = select(User.username, User.email).where(or_(
+        User.username.in_([item.row.username for item in pending]),
+        User.email.in_([item.row.email for item in pending]),
+    ))
+    existing = (await session.execute(stmt)).all()
+    existing_usernames = {row.username for row in existing}
+    existing_emails = {row.email for row in existing}
+
+    remaining = []
+    for item in pending:
+        if item.row.username in existing_usernames:
+            report.errors.append(ImportRowError(item.line, item.row.username, "이미 있는 사용자 계정 ID 입니다."))
+        elif item.row.email in existing_emails:
+            report.errors.append(ImportRowError(item.line, item.row.username, "이미 있는 이메일입니다."))
+        else:
+            remaining.append(item)
+    return remaining
+
+
+def _user_values(item: _PendingRow) -> dict[str, Any]:
+    return {
+        "username": item.row.username,
+        "email": item.row.email,
+        "display_name": item.row.display_name,
+        "hashed_password": item.hashed_password,
+        "is_host": item.row.is_host,
+    }
+
+
+def _calendar_values(item: _PendingRow, host_id: int) -> dict[str, Any]:
+    return {
+        "host_id": host_id,
+        "topics": item.calendar.topics,
+        "description": item.calendar.description,
+        "google_calendar_id": item.calendar.google_calendar_id,
+    }
+
+
+async def _insert_chunk(session: AsyncSession, pending: list[_PendingRow]) -> tuple[int, int]:
+    # executemany 한 번으로 넣고, 캘린더를 만들 호스트의 id 는 RETURNING 으로 받는다.
+    stmt = insert(User).returning(User.id, sort_by_parameter_order=True)
+    user_ids = (await session.execute(stmt, [_user_values(item) for item in pending])).scalars().all()
+
+    calendars = [
+        _calendar_values(item, user_id)
+        for item, user_id in zip(pending, user_ids)
+        if item.calendar is not None
+    ]
+    if calendars:
+        await session.execute(insert(Calendar), calendars)
+    await session.commit()
+    return len(user_ids), len(calendars)
+
+
+async def _insert_one_by_one(session: AsyncSession, pending: list[_PendingRow], report: ImportReport) -> tuple[int, int]:
+    created = calendars_created = 0
+    for item in pending:
+        try:
+            user_id = (await session.execute(insert(User).returning(User.id), _user_values(item))).scalar_one()
+            if item.calendar is not None:
+                await session.execute(insert(Calendar), _calendar_values(item, user_id))
+            await session.commit()
+        except IntegrityError:
+            await session.rollback()
+            report.errors.append(ImportRowError(item.line, item.row.username, "이미 있는 사용자 계정 ID 또는 이메일입니다."))
+            continue
+        created += 1
+        calendars_created += item.calendar is not None
+    return created, calendars_created
+
+
+async def main(argv: Sequence[str] | None = None) -> ImportReport:
+    from appserver.db import async_session_factory
+
+    parser = argparse.ArgumentParser(description="CSV/NDJSON 파일로 사용자와 호스트를 한꺼번에 만든다.")
+    parser.add_argument("path", help="가져올 파일. 형식은 확장자로 정하며 .csv 가 아니면 NDJSON 으로 읽는다.")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default=None)
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=IMPORT_HASH_WORKERS, help="비밀번호 해싱 프로세스 수")
+    parser.add_argument("--create-calendars", action="store_true", help="google_calendar_id 가 있는 호스트의 캘린더도 만든다.")
+    args = parser.parse_args(argv)
+
+    hasher = PasswordHashingService(executor="process", max_workers=args.workers)
+    try:
+        with open(args.path, "rb") as stream:
+            async with async_session_factory() as session:
+                report = await import_users(
+                    session,
+                    read_binary_records(stream, args.format or guess_format(args.path)),
+                    hasher=hasher,
+                    batch_size=args.batch_size,
+                    create_calendars=args.create_calendars,
+                )
+    finally:
+        hasher.shutdown()
+
+    print(report)
+    for error in report.errors:
+        print(error)
+    return report
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,184 @@
+"""
+인증된 사용자 캐시
+
+인증이 필요한 요청마다 토큰의 `sub` 로 User 를 조회하는데, 캘린더까지 읽으므로(`detail` 로더 프로필) 매번 JOIN 쿼리가 나간다.
+(사용자 계정 ID, 토큰 발급 시각) 키로 조회 결과를 잠깐 캐시해 두고, 요청의 세션에 다시 붙여서 돌려준다.
+
+- 세션 간에 ORM 인스턴스를 공유하지 않도록 컬럼 값 스냅숏만 저장한다.
+- 사용자나 캘린더가 바뀌는 곳(`update_user`, `unregister`, 캘린더 생성·수정, 관리자 화면)에서 `invalidate` 를 호출한다.
+- 바뀐 시각도 기록해 두므로, 토큰 클레임만 쓰는 `CurrentPrincipalDep` 는 그 전에 발급된 토큰의 클레임을 믿지 않는다.
+
+호스트 목록(`GET /account/hosts`)의 페이지도 `HostDirectoryCache` 로 캐시한다.
+"""
+import os
+import time
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from appserver.apps.calendar.models import Calendar
+from appserver.libs.collections.cache import TTLCache
+
+from .models import User
+
+
+UserCacheKey = tuple[str, int]
+
+_MISSING = object()
+
+
+class CachedUser:
+    """User 와 캘린더의 컬럼 값 스냅숏"""
+
+    __slots__ = ("user_id", "user_values", "calendar_values")
+
+    def __init__(self, user_id: int, user_values: dict[str, Any], calendar_values: dict[str, Any] | None):
+        self.user_id = user_id
+        self.user_values = user_values
+        self.calendar_values = calendar_values
+
+    @classmethod
+    def from_user(cls, user: User) -> "CachedUser":
+        calendar = user.calendar
+        return cls(
+            user.id,
+            _column_values(user),
+            None if calendar is None else _column_values(calendar),
+        )
+
+
+def _column_values(instance: Any) -> dict[str, Any]:
+    return {attr.key: getattr(instance, attr.key) for attr in inspect(type(instance)).column_attrs}
+
+
+def _detached(model: type, values: dict[str, Any]) -> Any:
+    # DB 에서 막 읽어 온 것처럼 변경 이력이 없는 detached 인스턴스를 만든다.
+    instance = model(**values)
+    make_transient_to_detached(instance)
+    return instance
+
+
+class UserCache:
+    """
+    토큰으로 찾은 User 를 TTL + LRU 로 캐시
+
+    >>> cache = UserCache(maxsize=10, ttl=30)
+    >>> cache.stats()["hit_rate"]
+    0.0
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 30.0, changes_ttl: float = 30 * 60):
+        self._cache: TTLCache[UserCacheKey, CachedUser] = TTLCache(maxsize=maxsize, ttl=ttl)
+        # 사용자 계정 ID 별로 마지막으로 바뀐 시각(epoch). 토큰 수명보다 오래 기억할 필요는 없다.
+        self._changed_at: TTLCache[str, float] = TTLCache(maxsize=maxsize, ttl=changes_ttl)
+        self._all_changed_at = 0.0
+
+    @staticmethod
+    def make_key(decoded: dict) -> UserCacheKey:
+        # iat 가 없는 예전 토큰은 만료 시각으로 구분한다.
+        return (decoded["sub"], int(decoded.get("iat", decoded["exp"])))
+
+    async def get(self, key: UserCacheKey, session: AsyncSession) -> User | None:
+        entry = self._cache.get(key, _MISSING)
+        if entry is _MISSING:
+            return None
+
+        # 같은 세션이 이미 들고 있는 인스턴스가 있으면 그쪽이 더 최신이다.
+        existing = session.sync_session.identity_map.get(inspect(User).identity_key_from_primary_key((entry.user_id,)))
+        if existing is not None:
+            return existing
+
+        user = _detached(User, entry.user_values)
+        calendar = None
+        if entry.calendar_values is not None:
+            calendar = _detached(Calendar, entry.calendar_values)
+            set_committed_value(calendar, "host", user)
+        set_committed_value(user, "calendar", calendar)
+        # load=False 라서 쿼리 없이 세션에 붙는다. 이후 변경은 평소처럼 commit 으로 반영된다.
+        return await session.merge(user, load=False)
+
+    def set(self, key: UserCacheKey, user: User) -> None:
+        self._cache.set(key, CachedUser.from_user(user))
+
+    def invalidate(self, username: str) -> int:
+        self._changed_at.set(username, time.time())
+        return self._cache.discard_where(lambda key: key[0] == username)
+
+    def invalidate_all(self) -> int:
+        self._all_changed_at = time.time()
+        return self._cache.discard_where(lambda key: True)
+
+    def changed_since(self, username: str, issued_at: float) -> bool:
+        """`issued_at` 에 발급된 토큰 이후에 사용자나 캘린더가 바뀌었는지"""
+        changed_at = max(self._changed_at.get(username, 0.0, record=False), self._all_changed_at)
+        return changed_at >= issued_at
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._changed_at.clear()
+        self._all_changed_at = 0.0
+
+    def stats(self) -> dict[str, int | float]:
+        stats = self._cache.stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+HostDirectoryKey = tuple[str | None, str | None, int]
+
+
+class HostDirectoryCache:
+    """
+    호스트 목록 페이지 캐시. (검색어, 커서, 페이지 크기) 별로 한 페이지를 저장한다.
+
+    호스트 여부, 계정 상태, 표시 이름이 바뀌면 어느 페이지에 영향이 가는지 알 수 없으므로 `invalidate` 로 모두 지운다.
+    세대 번호를 함께 올려서, 무효화 전에 조회를 시작한 요청이 오래된 페이지를 다시 넣지 못하게 한다.
+
+    >>> cache = HostDirectoryCache(maxsize=10, ttl=60)
+    >>> generation = cache.generation
+    >>> cache.set(generation, (None, None, 20), ([], None))
+    >>> cache.get((None, None, 20))
+    ([], None)
+    >>> cache.invalidate()
+    1
+    >>> cache.set(generation, (None, None, 20), ([], None))
+    >>> cache.get((None, None, 20)) is None
+    True
+    """
+
+    def __init__(self, maxsize: int = 1000, ttl: float = 60.0):
+        self._cache: TTLCache[HostDirectoryKey, tuple[list, str | None]] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.generation = 0
+
+    def get(self, key: HostDirectoryKey) -> tuple[list, str | None] | None:
+        return self._cache.get(key)
+
+    def set(self, generation: int, key: HostDirectoryKey, page: tuple[list, str | None]) -> None:
+        # 조회하는 동안 무효화됐으면 저장하지 않는다.
+        if generation == self.generation:
+            self._cache.set(key, page)
+
+    def invalidate(self) -> int:
+        self.generation += 1
+        return self._cache.discard_where(lambda key: True)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.generation = 0
+
+    def stats(self) -> dict[str, int | float]:
+        return self._cache.stats()
+
+
+user_cache = UserCache(
+    maxsize=int(os.getenv("ACCOUNT_USER_CACHE_MAXSIZE", "10000")),
+    ttl=float(os.getenv("ACCOUNT_USER_CACHE_TTL", "30")),
+)
+host_directory_cache = HostDirectoryCache(
+    maxsize=int(os.getenv("ACCOUNT_HOST_DIRECTORY_CACHE_MAXSIZE", "1000")),
+    ttl=float(os.getenv("ACCOUNT_HOST_DIRECTORY_CACHE_TTL", "60")),
+)
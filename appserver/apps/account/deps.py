@@ -1,3 +1,4 @@
+import time
 from typing import Annotated
 from datetime import datetime, timezone, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -6,16 +7,18 @@ from sqlmodel import select
 from fastapi import Depends, Cookie, Request
 
 from appserver.db import DbSessionDep
+from appserver.loader_profiles import loader_options
+from appserver.loaders import LoadersDep
 
+from .cache import user_cache
 from .models import User
+from .principal import Principal, claims_are_fresh
+from .revocation import revocation_list
 from .utils import decode_token, ACCESS_TOKEN_EXPIRE_MINUTES
 from .exceptions import AuthNotProvidedError, InvalidTokenError, ExpiredTokenError, UserNotFoundError
 
 
-async def get_user(auth_token: str | None, db_session: AsyncSession) -> User | None:
-    if not auth_token:
-        return None
-
+def decode_auth_token(auth_token: str) -> dict:
     try:
         decoded = decode_token(auth_token)
     except Exception as e:
@@ -25,24 +28,60 @@ async def get_user(auth_token: str | None, db_session: AsyncSession) -> User | N
     now = datetime.now(timezone.utc)
     if now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES) < expires_at:
         raise ExpiredTokenError()
+    return decoded
+
+
+async def load_user(decoded: dict, db_session: AsyncSession) -> User | None:
+    cache_key = user_cache.make_key(decoded)
+    user = await user_cache.get(cache_key, db_session)
+    if user is None:
+        stmt = select(User).options(*loader_options("detail", User)).where(User.username == decoded["sub"])
+        result = await db_session.execute(stmt)
+        user = result.scalar_one_or_none()
+        if user is not None:
+            user_cache.set(cache_key, user)
+
+    # 권한이 바뀌어 토큰 버전이 올라갔으면 그 전에 발급된 토큰은 쓸 수 없다.
+    if user is not None and decoded.get("ver", 0) != user.token_version:
+        raise InvalidTokenError()
+    return user
+
 
-    stmt = select(User).where(User.username == decoded["sub"])
-    result = await db_session.execute(stmt)
+async def ensure_not_revoked(decoded: dict, db_session: AsyncSession) -> None:
+    if await revocation_list.is_revoked(decoded.get("jti"), db_session):
+        raise InvalidTokenError()
 
-    return result.scalar_one_or_none()
+
+async def get_user(auth_token: str | None, db_session: AsyncSession) -> User | None:
+    if not auth_token:
+        return None
+
+    decoded = decode_auth_token(auth_token)
+    await ensure_not_revoked(decoded, db_session)
+    return await load_user(decoded, db_session)
+
+
+def get_auth_token(request: Request) -> str | None:
+    raw_auth_token = request.cookies.get("auth_token") or request.headers.get("Authorization")
+    if not raw_auth_token:
+        return None
+    *__, auth_token = raw_auth_token.split(" ")
+    return auth_token
 
 
 async def get_current_user(
     request: Request,
     db_session: DbSessionDep,
+    loaders: LoadersDep,
 ):
-    raw_auth_token = request.cookies.get("auth_token") or request.headers.get("Authorization")
-    if not raw_auth_token:
+    auth_token = get_auth_token(request)
+    if auth_token is None:
         raise AuthNotProvidedError()
-    *__, auth_token = raw_auth_token.split(" ")
     user = await get_user(auth_token, db_session)
     if user is None:
         raise UserNotFoundError()
+    # 엔드포인트에서 같은 사용자나 캘린더를 찾으면 다시 조회하지 않도록 요청 로더에 넣어 둔다.
+    loaders.prime_user(user)
     return user
 
 
@@ -51,10 +90,44 @@ CurrentUserDep = Annotated[User, Depends(get_current_user)]
 
 async def get_current_user_optional(
     db_session: DbSessionDep,
+    loaders: LoadersDep,
     auth_token: Annotated[str | None, Cookie()] = None,
 ):
     user = await get_user(auth_token, db_session)
+    if user is not None:
+        loaders.prime_user(user)
     return user
 
 
-CurrentUserOptionalDep = Annotated[User | None, Depends(get_current_user_optional)]
\ No newline at end of file
+CurrentUserOptionalDep = Annotated[User | None, Depends(get_current_user_optional)]
+
+
+async def get_current_principal(
+    request: Request,
+    db_session: DbSessionDep,
+    loaders: LoadersDep,
+) -> Principal:
+    """
+    신선한 클레임이면 User 를 조회하지 않고 클레임으로 Principal 을 만든다.
+    신선도 정책은 `principal` 모듈 참고.
+    """
+    auth_token = get_auth_token(request)
+    if auth_token is None:
+        raise AuthNotProvidedError()
+
+    decoded = decode_auth_token(auth_token)
+    await ensure_not_revoked(decoded, db_session)
+    if (
+        claims_are_fresh(decoded, time.time())
+        and not user_cache.changed_since(decoded["sub"], decoded["iat"])
+    ):
+        return Principal.from_claims(decoded)
+
+    user = await load_user(decoded, db_session)
+    if user is None:
+        raise UserNotFoundError()
+    loaders.prime_user(user)
+    return Principal.from_user(user)
+
+
+CurrentPrincipalDep = Annotated[Principal, Depends(get_current_principal)]
\ No newline at end of file
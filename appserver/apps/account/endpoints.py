@@ -1,24 +1,44 @@
-from fastapi import APIRouter, HTTPException, status
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 from fastapi.responses import JSONResponse
-from sqlmodel import select, func, update, delete, true
+from sqlmodel import select, update, delete, true, and_, or_
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, timezone
 
 from appserver.db import DbSessionDep
+from appserver.loader_profiles import loader_options
 from .models import User
-from .exceptions import DuplicatedUsernameError, DuplicatedEmailError, PasswordMismatchError, UserNotFoundError
+from .exceptions import (
+    DuplicatedUsernameError,
+    DuplicatedEmailError,
+    InvalidCursorError,
+    PasswordMismatchError,
+    UserNotFoundError,
+)
 from .schemas import LoginPayload, SignupPayload, UpdateUserPayload, UserDetailOut, UserOut
 from .utils import (
-    verify_password,
+    verify_password_async,
     create_access_token,
     ACCESS_TOKEN_EXPIRE_MINUTES,
-    hash_password,
+    hash_password_async,
+    discard_verified_token,
+    encode_cursor,
+    decode_cursor,
 )
-from .deps import CurrentUserDep
+from .cache import host_directory_cache, user_cache
+from .deps import CurrentPrincipalDep, CurrentUserDep, get_auth_token
+from .principal import principal_claims
+from .revocation import revoke_auth_token
+from .throttle import login_throttle
 from .constants import AUTH_TOKEN_COOKIE_NAME
 
 router = APIRouter(prefix="/account")
 
+# 호스트 목록의 다음 페이지 커서. 본문은 예전처럼 목록 그대로 두고 헤더로 알려준다.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 @router.get("/users/{username}")
 async def user_detail(username: str, session: DbSessionDep) -> User:
@@ -34,55 +54,71 @@ async def user_detail(username: str, session: DbSessionDep) -> User:
 
 @router.post("/signup", status_code=status.HTTP_201_CREATED, response_model=UserOut)
 async def signup(payload: SignupPayload, session: DbSessionDep) -> User:
-    stmt = select(func.count()).select_from(User).where(User.username == payload.username)
-    result = await session.execute(stmt)
-    count = result.scalar_one()
-    if count > 0:
-        raise DuplicatedUsernameError()
-
     # SignupPayload에는 평문 비밀번호가 있기 때문에 여기에서 해시 값을 생성해 User를 만든다.
     user = User(
         username=payload.username,
         email=payload.email,
         display_name=payload.display_name,
-        hashed_password=hash_password(payload.password),
+        hashed_password=await hash_password_async(payload.password),
     )
 
+    # 중복 검사는 따로 조회하지 않고 DB 의 유니크 인덱스에 맡긴다. 동시에 가입해도 한 명만 성공한다.
     session.add(user)
     try:
         await session.commit()
-    except IntegrityError:
-        raise DuplicatedEmailError()
+    except IntegrityError as exc:
+        await session.rollback()
+        raise _duplicated_user_error(exc) from exc
     return user
 
 
+def _duplicated_user_error(exc: IntegrityError) -> HTTPException:
+    """
+    어느 유니크 제약에 걸렸는지로 예외를 고른다. 첫 줄만 보는 것은 PostgreSQL 의 DETAIL 줄에 입력 값이 들어 있기 때문.
+
+    >>> _duplicated_user_error(IntegrityError("INSERT", {}, Exception("UNIQUE constraint failed: users.username"))).detail
+    '중복된 계정 ID입니다.'
+    >>> _duplicated_user_error(IntegrityError("INSERT", {}, Exception('duplicate key value violates unique constraint "uq_email"'))).detail
+    '중복된 E-mail 주소입니다.'
+    """
+    message = str(exc.orig).splitlines()[0]
+    if "username" in message:
+        return DuplicatedUsernameError()
+    return DuplicatedEmailError()
+
+
 @router.post("/login", status_code=status.HTTP_200_OK)
-async def login(payload: LoginPayload, session: DbSessionDep) -> JSONResponse:
-    stmt = select(User).where(User.username == payload.username)
+async def login(payload: LoginPayload, session: DbSessionDep, request: Request) -> JSONResponse:
+    # DB 조회와 비밀번호 검증 전에 시도 횟수부터 제한한다.
+    await login_throttle.check(payload.username, request.client.host if request.client else None)
+
+    stmt = select(User).options(*loader_options("detail", User)).where(User.username == payload.username)
     result = await session.execute(stmt)
     user = result.scalar_one_or_none()
 
     if user is None:
         raise UserNotFoundError()
 
-    is_valid = verify_password(payload.password, user.hashed_password)
+    is_valid, updated_hash = await verify_password_async(payload.password, user.hashed_password)
     if not is_valid:
         raise PasswordMismatchError()
+    await login_throttle.succeeded(payload.username)
+    if updated_hash is not None:
+        # argon2 인자가 바뀌었으면 새 인자로 만든 해시로 바꿔 둔다.
+        user.hashed_password = updated_hash
+        await session.commit()
+        user_cache.invalidate(user.username)
 
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={
-            "sub": user.username,
-            "display_name": user.display_name,
-            "is_host": user.is_host,
-        },
+        data=principal_claims(user),
         expires_delta=access_token_expires
     )
 
     response_data = {
         "access_token": access_token,
         "token_type": "bearer",
-        "user": user.model_dump(mode="json", exclude={"hashed_password", "email"})
+        "user": user.model_dump(mode="json", exclude={"hashed_password", "email", "token_version"})
     }
 
     now = datetime.now(timezone.utc)
@@ -111,25 +147,40 @@ async def update_user(
     session: DbSessionDep
 ) -> User:
     updated_data = payload.model_dump(exclude_none=True, exclude={"password", "password_again"})
+    if payload.password:
+        updated_data["hashed_password"] = await hash_password_async(payload.password)
 
     stmt = update(User).where(User.username == user.username).values(**updated_data)
     await session.execute(stmt)
     await session.commit()
+    user_cache.invalidate(user.username)
+    if user.is_host:
+        host_directory_cache.invalidate()
     return user
 
 
 @router.delete("/logout", status_code=status.HTTP_200_OK)
-async def logout(user: CurrentUserDep) -> JSONResponse:
+async def logout(user: CurrentUserDep, request: Request, session: DbSessionDep) -> JSONResponse:
+    # 쿠키만 지우면 토큰을 가진 누구든 만료될 때까지 쓸 수 있으므로 토큰을 철회한다.
+    auth_token = get_auth_token(request)
+    await revoke_auth_token(auth_token, session)
+    discard_verified_token(auth_token)
     res = JSONResponse({})
     res.delete_cookie(AUTH_TOKEN_COOKIE_NAME)
     return res
 
 
 @router.delete("/unregister", status_code=status.HTTP_204_NO_CONTENT)
-async def unregister(user: CurrentUserDep, session: DbSessionDep) -> None:
+async def unregister(user: CurrentUserDep, session: DbSessionDep, request: Request) -> None:
     stmt = delete(User).where(User.username == user.username)
     await session.execute(stmt)
     await session.commit()
+    user_cache.invalidate(user.username)
+    if user.is_host:
+        host_directory_cache.invalidate()
+    auth_token = get_auth_token(request)
+    await revoke_auth_token(auth_token, session)
+    discard_verified_token(auth_token)
     return None
 
 
@@ -139,9 +190,60 @@ async def unregister(user: CurrentUserDep, session: DbSessionDep) -> None:
     response_model=list[UserOut],
 )
 async def get_hosts(
-    user: CurrentUserDep,
+    principal: CurrentPrincipalDep,
     session: DbSessionDep,
-) -> list[User]:
-    stmt = select(User).where(User.is_active.is_(true())).where(User.is_host.is_(true()))
-    result = await session.execute(stmt)
-    return result.scalars().all()
\ No newline at end of file
+    response: Response,
+    q: Annotated[str | None, Query(min_length=1, max_length=40, description="사용자 계정 ID 또는 표시 이름 앞부분")] = None,
+    cursor: Annotated[str | None, Query(description="이전 응답의 X-Next-Cursor 헤더 값")] = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+) -> list[UserOut]:
+    key = (q, cursor, limit)
+    page = host_directory_cache.get(key)
+    if page is None:
+        generation = host_directory_cache.generation
+        page = await _fetch_hosts_page(session, q, cursor, limit)
+        host_directory_cache.set(generation, key, page)
+
+    hosts, next_cursor = page
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return hosts
+
+
+async def _fetch_hosts_page(
+    session: AsyncSession,
+    q: str | None,
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[UserOut], str | None]:
+    # 응답에 필요한 컬럼만 읽는다. User 전체를 읽으면 캘린더까지 JOIN 한다.
+    stmt = (
+        select(User.id, User.username, User.display_name, User.is_host)
+        .where(User.is_active.is_(true()))
+        .where(User.is_host.is_(true()))
+    )
+    if q is not None:
+        # 앞부분 일치라서 ix_users_username, ix_users_display_name 인덱스를 쓸 수 있다.
+        stmt = stmt.where(or_(
+            User.username.startswith(q, autoescape=True),
+            User.display_name.startswith(q, autoescape=True),
+        ))
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        if position is None:
+            raise InvalidCursorError()
+        last_username, last_id = position
+        stmt = stmt.where(or_(
+            User.username > last_username,
+            and_(User.username == last_username, User.id > last_id),
+        ))
+    # 다음 페이지가 있는지 알기 위해 하나 더 읽는다.
+    stmt = stmt.order_by(User.username, User.id).limit(limit + 1)
+
+    rows = (await session.execute(stmt)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].username, rows[-1].id)
+    hosts = [UserOut(username=row.username, display_name=row.display_name, is_host=row.is_host) for row in rows]
+    return hosts, next_cursor
@@ -1,3 +1,5 @@
+import math
+
 from fastapi import HTTPException, status
 
 class DuplicatedUsernameError(HTTPException):
@@ -56,4 +58,21 @@ class AuthNotProvidedError(HTTPException):
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="로그인이 필요합니다.",
             headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+        )
+
+
+class TooManyLoginAttemptsError(HTTPException):
+    def __init__(self, retry_after: float):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="로그인 시도가 너무 많습니다. 잠시 후 다시 시도하세요.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+class InvalidCursorError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="유효하지 않은 페이지 커서입니다.",
+        )
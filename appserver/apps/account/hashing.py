@@ -0,0 +1,143 @@
+"""
+비밀번호 해싱 서비스
+
+argon2 해싱·검증은 한 번에 수십 ms 동안 CPU 를 쓰므로, async 엔드포인트에서 바로 호출하면 그동안 이벤트 루프가 멈춘다.
+- 해셔(`PasswordHash`)는 프로세스마다 한 번만 만든다.
+- 해싱·검증은 크기가 정해진 스레드 풀(argon2 는 GIL 을 놓는다) 또는 프로세스 풀에서 실행한다.
+- argon2 비용 인자는 환경 변수로 정한다. 인자를 바꾸면 로그인할 때 `verify_and_update` 로 새 인자로 다시 해싱된다.
+
+env
+- `ACCOUNT_PASSWORD_HASH_EXECUTOR`: `thread`(기본), `process`, `inline`(호출한 곳에서 바로 실행)
+- `ACCOUNT_PASSWORD_HASH_WORKERS`: 풀 크기, 기본 4
+- `ACCOUNT_ARGON2_TIME_COST`, `ACCOUNT_ARGON2_MEMORY_COST`(KiB), `ACCOUNT_ARGON2_PARALLELISM`
+"""
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Literal, TypeVar
+
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from pwdlib.hashers.bcrypt import BcryptHasher
+
+
+T = TypeVar("T")
+ExecutorKind = Literal["inline", "thread", "process"]
+
+PASSWORD_HASH_EXECUTOR: ExecutorKind = os.getenv("ACCOUNT_PASSWORD_HASH_EXECUTOR", "thread")  # type: ignore[assignment]
+PASSWORD_HASH_WORKERS = int(os.getenv("ACCOUNT_PASSWORD_HASH_WORKERS", "4"))
+
+
+@dataclass(frozen=True)
+class Argon2Params:
+    time_cost: int = 3
+    memory_cost: int = 65536
+    parallelism: int = 4
+
+    @classmethod
+    def from_env(cls) -> "Argon2Params":
+        default = cls()
+        return cls(
+            time_cost=int(os.getenv("ACCOUNT_ARGON2_TIME_COST", str(default.time_cost))),
+            memory_cost=int(os.getenv("ACCOUNT_ARGON2_MEMORY_COST", str(default.memory_cost))),
+            parallelism=int(os.getenv("ACCOUNT_ARGON2_PARALLELISM", str(default.parallelism))),
+        )
+
+
+def build_password_hash(params: Argon2Params) -> PasswordHash:
+    # 새 해시는 argon2 로 만들고, 예전 bcrypt 해시는 검증만 한다.
+    return PasswordHash((Argon2Hasher(**asdict(params)), BcryptHasher()))
+
+
+# 프로세스 풀 작업자는 각자 해셔를 한 번 만들어 둔다.
+_worker_password_hash: PasswordHash | None = None
+
+
+def _init_worker(params: Argon2Params) -> None:
+    global _worker_password_hash
+    _worker_password_hash = build_password_hash(params)
+
+
+def _worker_hash(password: str) -> str:
+    return _worker_password_hash.hash(password)
+
+
+def _worker_verify_and_update(password: str, hashed_password: str) -> tuple[bool, str | None]:
+    return _worker_password_hash.verify_and_update(password, hashed_password)
+
+
+class PasswordHashingService:
+    """
+    >>> service = PasswordHashingService(Argon2Params(time_cost=1, memory_cost=1024, parallelism=1), executor="inline")
+    >>> hashed = service.hash("testtest")
+    >>> service.verify("testtest", hashed), service.verify("wrong_password", hashed)
+    (True, False)
+    """
+
+    def __init__(
+        self,
+        params: Argon2Params | None = None,
+        *,
+        executor: ExecutorKind = PASSWORD_HASH_EXECUTOR,
+        max_workers: int = PASSWORD_HASH_WORKERS,
+    ):
+        if executor not in ("inline", "thread", "process"):
+            raise ValueError(f"지원하지 않는 실행 방식입니다: {executor}")
+        self.params = params or Argon2Params.from_env()
+        self.executor_kind = executor
+        self.max_workers = max_workers
+        self.password_hash = build_password_hash(self.params)
+        self._executor: Executor | None = None
+
+    def hash(self, password: str) -> str:
+        return self.password_hash.hash(password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self.password_hash.verify(password, hashed_password)
+
+    def verify_and_update(self, password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """검증 결과와, 해시 인자가 바뀌었으면 새 인자로 만든 해시를 돌려준다."""
+        return self.password_hash.verify_and_update(password, hashed_password)
+
+    async def ahash(self, password: str) -> str:
+        if self.executor_kind == "process":
+            return await self._run(_worker_hash, password)
+        return await self._run(self.hash, password)
+
+    async def averify(self, password: str, hashed_password: str) -> bool:
+        valid, _ = await self.averify_and_update(password, hashed_password)
+        return valid
+
+    async def averify_and_update(self, password: str, hashed_password: str) -> tuple[bool, str | None]:
+        if self.executor_kind == "process":
+            return await self._run(_worker_verify_and_update, password, hashed_password)
+        return await self._run(self.verify_and_update, password, hashed_password)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self.executor_kind == "inline":
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), func, *args)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.params,),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hash",
+                )
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hasher = PasswordHashingService()
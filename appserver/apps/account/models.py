@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from pydantic import AwareDatetime, EmailStr
 from sqlmodel import SQLModel, Field, Relationship, func, String
 from sqlmodel.main import SQLModelConfig
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy_utc import UtcDateTime
 
@@ -18,6 +18,10 @@ class User(SQLModel, table=True):
     __tablename__ = "users"
     __table_args__ = (
         UniqueConstraint("email", name="uq_email"),
+        # 사용자 계정 ID 중복은 이 인덱스로 막는다. 호스트 목록의 앞부분 검색(LIKE 'q%')에도 쓰며,
+        # PostgreSQL 에서는 로캘과 상관없이 LIKE 에 쓰이도록 text_pattern_ops 로 만든다.
+        Index("ix_users_username", "username", unique=True, postgresql_ops={"username": "text_pattern_ops"}),
+        Index("ix_users_display_name", "display_name", postgresql_ops={"display_name": "text_pattern_ops"}),
     )
 
     id: int = Field(default=None, primary_key=True)
@@ -31,6 +35,12 @@ class User(SQLModel, table=True):
         description="사용자 상태",
         sa_type=String,
     )
+    # 권한이 바뀌면 올려서 이전에 발급한 토큰을 무효화한다.
+    token_version: int = Field(
+        default=0,
+        description="토큰 버전",
+        sa_column_kwargs={"server_default": "0"},
+    )
 
     oauth_accounts: list["OAuthAccount"] = Relationship(
         back_populates="user",
@@ -38,7 +48,7 @@ class User(SQLModel, table=True):
     )
     calendar: Union["Calendar", None] = Relationship(
         back_populates="host",
-        sa_relationship_kwargs={"uselist": False, "single_parent": True, "lazy": "joined"},
+        sa_relationship_kwargs={"uselist": False, "single_parent": True, "lazy": "raise_on_sql"},
     )
     bookings: list["Booking"] = Relationship(
         back_populates="guest",
@@ -126,4 +136,25 @@ class OAuthAccount(SQLModel, table=True):
             "server_default": func.now(),
             "onupdate": lambda: datetime.now(timezone.utc),
         },
-    )
\ No newline at end of file
+    )
+
+class RevokedToken(SQLModel, table=True):
+    __tablename__ = "revoked_tokens"
+
+    # 워커들은 id 가 마지막으로 읽은 것보다 큰 행만 읽어서 철회 목록을 갱신한다.
+    id: int = Field(default=None, primary_key=True)
+    jti: str = Field(max_length=64, unique=True, description="철회한 토큰 ID")
+    expires_at: AwareDatetime = Field(
+        nullable=False,
+        sa_type=UtcDateTime,
+        description="토큰 만료 일시. 이후로는 철회 목록에 둘 필요가 없다.",
+    )
+
+    created_at: AwareDatetime = Field(
+        default=None,
+        nullable=False,
+        sa_type=UtcDateTime,
+        sa_column_kwargs={
+            "server_default": func.now(),
+        },
+    )
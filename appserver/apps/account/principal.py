@@ -0,0 +1,86 @@
+"""
+토큰 클레임만으로 만드는 현재 사용자 정보(Principal)
+
+사용자 ID 만 필요한 엔드포인트는 User 를 조회하지 않고, 서명 검증을 마친 토큰 클레임으로 Principal 을 만든다.
+
+신선도 정책
+- 클레임은 발급 후 `PRINCIPAL_MAX_STALENESS` 초 동안만 믿는다. 그보다 오래된 토큰은 DB(사용자 캐시 포함)에서 다시 읽는다.
+- 이 프로세스에서 사용자나 캘린더가 바뀐 뒤(`user_cache.invalidate`)에는 그 전에 발급된 토큰도 DB 에서 다시 읽는다.
+- 호스트인데 캘린더 ID 가 없는 클레임은 아직 캘린더를 만들기 전의 것일 수 있으므로 DB 에서 다시 읽는다.
+- 권한(호스트 여부, 계정 상태)이 바뀌면 `User.token_version` 을 올린다. DB 에서 읽을 때 토큰의 `ver` 와 다르면 토큰을 거부하므로,
+  다른 워커에서도 늦어도 `PRINCIPAL_MAX_STALENESS` 초 뒤에는 이전 토큰이 거부된다.
+"""
+import os
+from dataclasses import dataclass
+
+from .models import User
+
+
+PRINCIPAL_MAX_STALENESS = int(os.getenv("ACCOUNT_PRINCIPAL_MAX_STALENESS", "300"))
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    id: int
+    username: str
+    display_name: str
+    is_host: bool
+    calendar_id: int | None
+    token_version: int
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            username=user.username,
+            display_name=user.display_name,
+            is_host=user.is_host,
+            calendar_id=None if user.calendar is None else user.calendar.id,
+            token_version=user.token_version,
+        )
+
+    @classmethod
+    def from_claims(cls, claims: dict) -> "Principal":
+        """
+        >>> Principal.from_claims({"sub": "puddingcamp", "uid": 1, "display_name": "푸딩캠프", "is_host": True, "cid": 3, "ver": 0})
+        Principal(id=1, username='puddingcamp', display_name='푸딩캠프', is_host=True, calendar_id=3, token_version=0)
+        """
+        return cls(
+            id=claims["uid"],
+            username=claims["sub"],
+            display_name=claims["display_name"],
+            is_host=claims["is_host"],
+            calendar_id=claims.get("cid"),
+            token_version=claims["ver"],
+        )
+
+
+def principal_claims(user: User) -> dict:
+    """로그인할 때 토큰에 넣는 클레임"""
+    return {
+        "sub": user.username,
+        "uid": user.id,
+        "display_name": user.display_name,
+        "is_host": user.is_host,
+        "cid": None if user.calendar is None else user.calendar.id,
+        "ver": user.token_version,
+    }
+
+
+def claims_are_fresh(claims: dict, now: float) -> bool:
+    """
+    >>> claims = {"sub": "puddingcamp", "uid": 1, "display_name": "푸딩캠프", "is_host": False, "ver": 0, "iat": 1000}
+    >>> claims_are_fresh(claims, now=1000 + PRINCIPAL_MAX_STALENESS)
+    True
+    >>> claims_are_fresh(claims, now=1001 + PRINCIPAL_MAX_STALENESS)
+    False
+    >>> claims_are_fresh({**claims, "is_host": True, "cid": None}, now=1000)
+    False
+    """
+    if not {"uid", "ver", "iat", "display_name", "is_host"} <= claims.keys():
+        return False
+    if now - claims["iat"] > PRINCIPAL_MAX_STALENESS:
+        return False
+    if claims["is_host"] and claims.get("cid") is None:
+        return False
+    return True
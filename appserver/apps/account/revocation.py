@@ -0,0 +1,188 @@
+"""
+액세스 토큰 철회 목록
+
+로그아웃한 토큰의 `jti` 를 `revoked_tokens` 테이블(정본)에 기록하고, 워커마다 블룸 필터를 앞에 둔다.
+- 철회되지 않은 토큰(대부분의 요청)은 블룸 필터에서 "없다"가 나오므로 메모리에서 해시 몇 번으로 끝난다.
+- 블룸 필터가 "있다"고 할 때만 테이블을 조회해 확인한다(거짓 양성은 `error_rate` 정도).
+- 다른 워커가 철회한 토큰은 `refresh_interval` 초마다 마지막으로 읽은 id 이후의 행만 읽어 반영한다.
+  그래서 다른 워커의 철회가 반영되기까지 최대 `refresh_interval` 초가 걸린다.
+- 토큰은 ACCESS_TOKEN_EXPIRE_MINUTES 가 지나면 만료되므로, 그 주기로 만료되지 않은 행만 다시 읽어 필터를 새로 만든다.
+- `refresh` 는 요청의 세션으로 읽기만 한다. 만료된 행은 `run_revocation_purge_scheduler`(lifespan) 나
+  CLI(`python -m appserver.apps.account.revocation`)가 따로 연 세션에서 지운다.
+"""
+import argparse
+import asyncio
+import math
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Sequence
+
+from sqlalchemy import delete, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlmodel import select
+
+from appserver.libs.collections.bloom import BloomFilter
+
+from .models import RevokedToken
+from .utils import ACCESS_TOKEN_EXPIRE_MINUTES, decode_token
+
+
+REVOCATION_REFRESH_INTERVAL = float(os.getenv("ACCOUNT_REVOCATION_REFRESH_INTERVAL", "5"))
+REVOCATION_BLOOM_CAPACITY = int(os.getenv("ACCOUNT_REVOCATION_BLOOM_CAPACITY", "100000"))
+REVOCATION_BLOOM_ERROR_RATE = float(os.getenv("ACCOUNT_REVOCATION_BLOOM_ERROR_RATE", "0.001"))
+# 0 이면 앱 실행 중 만료된 철회 기록을 지우지 않는다(CLI 를 cron 으로 돌리는 경우).
+REVOCATION_PURGE_INTERVAL = float(os.getenv("ACCOUNT_REVOCATION_PURGE_INTERVAL", str(ACCESS_TOKEN_EXPIRE_MINUTES * 60)))
+
+# id 는 커밋 순서와 다를 수 있으므로, 최근에 기록된 행은 id 와 상관없이 한 번 더 읽는다.
+REFRESH_OVERLAP = timedelta(seconds=60)
+
+
+class RevocationList:
+    def __init__(
+        self,
+        capacity: int = REVOCATION_BLOOM_CAPACITY,
+        error_rate: float = REVOCATION_BLOOM_ERROR_RATE,
+        refresh_interval: float = REVOCATION_REFRESH_INTERVAL,
+        rebuild_interval: float = ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh_interval = refresh_interval
+        self.rebuild_interval = rebuild_interval
+        self.timer = timer
+        self.reset()
+
+    def reset(self) -> None:
+        self._lock = asyncio.Lock()
+        self._bloom = BloomFilter(self.capacity, self.error_rate)
+        self._last_id = 0
+        self._last_refreshed_at: datetime | None = None
+        self._refreshed_at = -math.inf
+        self._rebuilt_at = self.timer()
+        self.probes = 0
+        self.lookups = 0
+        self.revoked = 0
+
+    async def refresh(self, session: AsyncSession, *, force: bool = False) -> int:
+        """다른 워커가 철회한 토큰을 블룸 필터에 더한다. 새로 더한 수를 돌려준다."""
+        if not force and self.timer() - self._refreshed_at < self.refresh_interval:
+            return 0
+
+        async with self._lock:
+            if not force and self.timer() - self._refreshed_at < self.refresh_interval:
+                return 0
+
+            now = datetime.now(timezone.utc)
+            # 만료된 행은 아래 조회에서 빠지므로, 다시 만든 필터에는 아직 유효한 철회만 들어간다.
+            if len(self._bloom) >= self.capacity or self.timer() - self._rebuilt_at >= self.rebuild_interval:
+                self._bloom = BloomFilter(self.capacity, self.error_rate)
+                self._last_id = 0
+                self._last_refreshed_at = None
+                self._rebuilt_at = self.timer()
+
+            newer = RevokedToken.id > self._last_id
+            if self._last_refreshed_at is not None:
+                newer = or_(newer, RevokedToken.created_at >= self._last_refreshed_at - REFRESH_OVERLAP)
+            stmt = (
+                select(RevokedToken.id, RevokedToken.jti)
+                .where(newer, RevokedToken.expires_at > now)
+                .order_by(RevokedToken.id)
+            )
+            added = 0
+            for row in (await session.execute(stmt)).all():
+                if row.jti not in self._bloom:
+                    self._bloom.add(row.jti)
+                    added += 1
+                self._last_id = max(self._last_id, row.id)
+
+            self._last_refreshed_at = now
+            self._refreshed_at = self.timer()
+            return added
+
+    async def is_revoked(self, jti: str | None, session: AsyncSession) -> bool:
+        # jti 가 없는 예전 토큰은 철회할 수 없다.
+        if jti is None:
+            return False
+
+        await self.refresh(session)
+        self.probes += 1
+        if jti not in self._bloom:
+            return False
+
+        self.lookups += 1
+        stmt = select(RevokedToken.id).where(RevokedToken.jti == jti)
+        revoked = (await session.execute(stmt)).first() is not None
+        if revoked:
+            self.revoked += 1
+        return revoked
+
+    async def revoke(self, session: AsyncSession, jti: str, expires_at: datetime) -> None:
+        session.add(RevokedToken(jti=jti, expires_at=expires_at))
+        try:
+            await session.commit()
+        except IntegrityError:
+            # 이미 철회된 토큰
+            await session.rollback()
+        self._bloom.add(jti)
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "probes": self.probes,
+            "lookups": self.lookups,
+            "revoked": self.revoked,
+            "size": len(self._bloom),
+            "bloom_bytes": (self._bloom.size + 7) // 8,
+        }
+
+
+async def revoke_auth_token(auth_token: str, session: AsyncSession) -> None:
+    """토큰을 만료 시각까지 철회한다. jti 가 없는 예전 토큰은 철회할 수 없으므로 무시한다."""
+    claims = decode_token(auth_token)
+    if "jti" not in claims:
+        return
+    expires_at = datetime.fromtimestamp(claims["exp"], tz=timezone.utc)
+    await revocation_list.revoke(session, claims["jti"], expires_at)
+
+
+async def purge_expired_revocations(session: AsyncSession) -> int:
+    """만료된 토큰의 철회 기록을 지우고 커밋한다. 지운 행 수를 돌려준다."""
+    now = datetime.now(timezone.utc)
+    result = await session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+    await session.commit()
+    return result.rowcount
+
+
+async def run_revocation_purge_scheduler(
+    session_factory: async_sessionmaker,
+    interval: float = REVOCATION_PURGE_INTERVAL,
+) -> None:
+    """`interval` 초마다 요청과 상관없는 세션으로 만료된 철회 기록을 지운다. 한 번 실패해도 다음 주기에 다시 시도한다."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with session_factory() as session:
+                await purge_expired_revocations(session)
+        except Exception as e:
+            print("purge expired revocations error", e)
+
+
+revocation_list = RevocationList()
+
+
+async def main(argv: Sequence[str] | None = None) -> int:
+    from appserver.db import async_session_factory
+
+    parser = argparse.ArgumentParser(description="만료된 토큰의 철회 기록을 지운다.")
+    parser.parse_args(argv)
+
+    async with async_session_factory() as session:
+        purged = await purge_expired_revocations(session)
+    print(f"purged={purged}")
+    return purged
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
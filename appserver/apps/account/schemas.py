@@ -1,8 +1,7 @@
 import random, string
 from typing import Self
-from pydantic import EmailStr, model_validator, AwareDatetime, computed_field
+from pydantic import EmailStr, model_validator, AwareDatetime
 from sqlmodel import SQLModel, Field
-from appserver.apps.account.utils import hash_password
 
 class SignupPayload(SQLModel):
     username: str = Field(unique=True, min_length=4, max_length=40, description="사용자 계정 ID")
@@ -61,9 +60,22 @@ class UpdateUserPayload(SQLModel):
             raise ValueError("비밀번호가 일치하지 않습니다.")
         return self
 
-    @computed_field
-    @property
-    def hashed_password(self) -> Self | None:
-        if self.password:
-            return hash_password(self.password)
-        return None
+
+class ImportUserRow(SQLModel):
+    """사용자 일괄 가져오기 파일의 한 행"""
+    username: str = Field(min_length=4, max_length=40, description="사용자 계정 ID")
+    email: EmailStr = Field(max_length=128, description="사용자 이메일")
+    display_name: str = Field(min_length=4, max_length=40, description="사용자 표시 이름")
+    password: str = Field(min_length=8, max_length=128, description="사용자 비밀번호")
+    is_host: bool = Field(default=False, description="사용자가 호스트인지 여부")
+    # 호스트의 캘린더. 가져올 때 캘린더 만들기를 선택하면 CalendarCreateIn 으로 검증해 만든다.
+    calendar_topics: list[str] | None = Field(default=None, description="게스트와 나눌 주제들")
+    calendar_description: str | None = Field(default=None, description="게스트에게 보여줄 설명")
+    google_calendar_id: str | None = Field(default=None, description="Google Calendar ID")
+
+    @model_validator(mode="before")
+    @classmethod
+    def default_display_name(cls, data: dict):
+        if isinstance(data, dict) and not data.get("display_name"):
+            data["display_name"] = data.get("username")
+        return data
@@ -0,0 +1,248 @@
+"""
+로그인 시도 제한 (토큰 버킷)
+
+argon2 비밀번호 검증은 이 서비스에서 CPU 를 가장 많이 쓰는 작업이라, 틀린 비밀번호를 계속 보내면 워커 하나가 쉽게 포화된다.
+사용자 계정 ID 별, 클라이언트 IP 별로 토큰 버킷을 두고, 버킷이 비면 DB 조회나 해싱 전에 429 로 거절한다.
+
+- 버킷에는 최대 `burst` 개의 토큰이 있고, 초당 `rate` 개씩 다시 찬다. 로그인 시도마다 하나씩 쓴다.
+- 로그인에 성공하면 계정 버킷에서 쓴 토큰을 돌려준다. 여러 기기에서 로그인해도 틀린 시도만 계정 제한에 쌓인다.
+- IP 버킷은 `request.client.host` 를 쓴다. 리버스 프록시 뒤에서는 uvicorn 을 `--proxy-headers --forwarded-allow-ips=<프록시 IP>`
+  로 실행해 신뢰하는 프록시의 X-Forwarded-For 로 클라이언트 IP 를 받아야 한다. 그렇지 않으면 모든 요청이 프록시 IP 하나로 묶인다.
+- 기본 저장소는 프로세스 메모리다. 워커가 여러 개면 `ACCOUNT_LOGIN_THROTTLE_BACKEND=sqlite` 로
+  같은 서버의 워커들이 로컬 SQLite 파일(`ACCOUNT_LOGIN_THROTTLE_PATH`)을 함께 쓰게 할 수 있다.
+"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Protocol
+
+from appserver.libs.collections.cache import TTLCache
+
+from .exceptions import TooManyLoginAttemptsError
+
+
+@dataclass(frozen=True)
+class BucketPolicy:
+    burst: float
+    rate: float
+
+    @property
+    def refill_seconds(self) -> float:
+        """빈 버킷이 가득 차는 데 걸리는 시간"""
+        return self.burst / self.rate
+
+
+USERNAME_POLICY = BucketPolicy(
+    burst=float(os.getenv("ACCOUNT_LOGIN_USERNAME_BURST", "5")),
+    rate=float(os.getenv("ACCOUNT_LOGIN_USERNAME_RATE", str(5 / 60))),
+)
+IP_POLICY = BucketPolicy(
+    burst=float(os.getenv("ACCOUNT_LOGIN_IP_BURST", "20")),
+    rate=float(os.getenv("ACCOUNT_LOGIN_IP_RATE", str(20 / 60))),
+)
+
+
+def refill(tokens: float, updated_at: float, policy: BucketPolicy, now: float) -> float:
+    """
+    >>> policy = BucketPolicy(burst=5, rate=1)
+    >>> refill(0, 100, policy, now=102)
+    2
+    >>> refill(4, 100, policy, now=110)
+    5
+    """
+    return min(policy.burst, tokens + (now - updated_at) * policy.rate)
+
+
+class TokenBucketStore(Protocol):
+    # True 면 이벤트 루프 밖(스레드)에서 호출한다.
+    blocking: bool
+
+    def take(self, key: str, policy: BucketPolicy, now: float) -> float:
+        """토큰을 하나 쓴다. 쓸 수 있었으면 0, 아니면 다음 토큰까지 기다려야 하는 초를 돌려준다."""
+
+    def refund(self, key: str, policy: BucketPolicy, now: float) -> None:
+        """`take` 로 쓴 토큰을 하나 돌려준다. 버킷은 `burst` 를 넘지 않는다."""
+
+    def clear(self) -> None:
+        ...
+
+
+class MemoryTokenBucketStore:
+    """
+    >>> store = MemoryTokenBucketStore()
+    >>> policy = BucketPolicy(burst=2, rate=0.5)
+    >>> [store.take("user:puddingcamp", policy, now=0) for _ in range(3)]
+    [0.0, 0.0, 2.0]
+    >>> store.take("user:puddingcamp", policy, now=2)
+    0.0
+    >>> store.refund("user:puddingcamp", policy, now=2)
+    >>> store.take("user:puddingcamp", policy, now=2)
+    0.0
+    """
+
+    blocking = False
+
+    def __init__(self, maxsize: int = 100_000, timer: Callable[[], float] = time.monotonic):
+        # 버킷이 다시 가득 찰 때까지만 기억하면 된다. 가득 찬 버킷은 없는 버킷과 같다.
+        self._buckets: TTLCache[str, tuple[float, float]] = TTLCache(maxsize=maxsize, timer=timer)
+
+    def take(self, key: str, policy: BucketPolicy, now: float) -> float:
+        tokens, updated_at = self._buckets.get(key, (policy.burst, now), record=False)
+        tokens = refill(tokens, updated_at, policy, now)
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / policy.rate
+        self._buckets.set(key, (tokens, now), ttl=policy.refill_seconds)
+        return retry_after
+
+    def refund(self, key: str, policy: BucketPolicy, now: float) -> None:
+        bucket = self._buckets.get(key, None, record=False)
+        if bucket is None:
+            return
+        tokens = min(policy.burst, refill(*bucket, policy, now) + 1)
+        self._buckets.set(key, (tokens, now), ttl=policy.refill_seconds)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+
+class SqliteTokenBucketStore:
+    """
+    같은 서버의 여러 워커 프로세스가 함께 쓰는 버킷 저장소.
+    `BEGIN IMMEDIATE` 로 쓰기 잠금을 잡고 읽고-고치고-쓰므로 워커 사이에서도 원자적이다.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str, retention: float = 3600.0):
+        self.path = path
+        self.retention = retention
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS login_buckets ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def take(self, key: str, policy: BucketPolicy, now: float) -> float:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tokens, updated_at FROM login_buckets WHERE key = ?", (key,)).fetchone()
+            tokens = policy.burst if row is None else refill(row[0], row[1], policy, now)
+            retry_after = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                retry_after = (1 - tokens) / policy.rate
+            conn.execute(
+                "INSERT INTO login_buckets (key, tokens, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at",
+                (key, tokens, now),
+            )
+            # 오래 쓰지 않아 이미 가득 찼을 버킷은 지워서 파일이 계속 커지지 않게 한다.
+            conn.execute("DELETE FROM login_buckets WHERE updated_at < ?", (now - self.retention,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return retry_after
+
+    def refund(self, key: str, policy: BucketPolicy, now: float) -> None:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tokens, updated_at FROM login_buckets WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                tokens = min(policy.burst, refill(row[0], row[1], policy, now) + 1)
+                conn.execute(
+                    "UPDATE login_buckets SET tokens = ?, updated_at = ? WHERE key = ?",
+                    (tokens, now, key),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM login_buckets")
+
+
+class LoginThrottle:
+    def __init__(
+        self,
+        store: TokenBucketStore,
+        *,
+        username_policy: BucketPolicy = USERNAME_POLICY,
+        ip_policy: BucketPolicy = IP_POLICY,
+        timer: Callable[[], float] = time.time,
+    ):
+        self.store = store
+        self.username_policy = username_policy
+        self.ip_policy = ip_policy
+        self.timer = timer
+        self.rejected = 0
+
+    async def check(self, username: str, client_ip: str | None) -> None:
+        """버킷이 비었으면 TooManyLoginAttemptsError 를 낸다."""
+        if self.store.blocking:
+            retry_after = await asyncio.to_thread(self._take, username, client_ip)
+        else:
+            retry_after = self._take(username, client_ip)
+
+        if retry_after > 0:
+            self.rejected += 1
+            raise TooManyLoginAttemptsError(retry_after)
+
+    async def succeeded(self, username: str) -> None:
+        """비밀번호가 맞았으면 계정 버킷에서 쓴 토큰을 돌려준다. 계정 버킷에는 틀린 시도만 남는다."""
+        key = self._username_key(username)
+        if self.store.blocking:
+            await asyncio.to_thread(self.store.refund, key, self.username_policy, self.timer())
+        else:
+            self.store.refund(key, self.username_policy, self.timer())
+
+    @staticmethod
+    def _username_key(username: str) -> str:
+        return f"user:{username.lower()}"
+
+    def _take(self, username: str, client_ip: str | None) -> float:
+        now = self.timer()
+        # IP 버킷이 비었으면 계정 버킷은 쓰지 않는다. 남의 계정을 잠그는 데 쓰이지 않도록.
+        if client_ip is not None:
+            retry_after = self.store.take(f"ip:{client_ip}", self.ip_policy, now)
+            if retry_after > 0:
+                return retry_after
+        return self.store.take(self._username_key(username), self.username_policy, now)
+
+    def reset(self) -> None:
+        self.store.clear()
+        self.rejected = 0
+
+
+def build_login_throttle() -> LoginThrottle:
+    backend = os.getenv("ACCOUNT_LOGIN_THROTTLE_BACKEND", "memory")
+    match backend:
+        case "memory":
+            store = MemoryTokenBucketStore()
+        case "sqlite":
+            store = SqliteTokenBucketStore(os.getenv("ACCOUNT_LOGIN_THROTTLE_PATH", "login_throttle.sqlite3"))
+        case _:
+            raise ValueError(f"지원하지 않는 로그인 제한 저장소입니다: {backend}")
+    return LoginThrottle(store)
+
+
+login_throttle = build_login_throttle()
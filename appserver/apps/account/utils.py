@@ -1,24 +1,39 @@
-from pwdlib import PasswordHash
-from pwdlib.hashers.argon2 import Argon2Hasher
-from pwdlib.hashers.bcrypt import BcryptHasher
-
+import base64
+import binascii
+import hashlib
+import json
+import os
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
 from jose import jwt
 from typing import Any, Union
 
+from appserver.libs.collections.cache import TTLCache
+
+from .hashing import password_hasher
+
 SECRET_KEY = "test_secret_key"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 
 def hash_password(password: str) -> str:
-    password_hash = PasswordHash((Argon2Hasher(), BcryptHasher()))
-    return password_hash.hash(password)
+    return password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    password_hash = PasswordHash((Argon2Hasher(), BcryptHasher()))
-    return password_hash.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
+
+
+# async 코드에서는 이벤트 루프를 막지 않도록 아래 함수를 쓴다.
+async def hash_password_async(password: str) -> str:
+    return await password_hasher.ahash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """검증 결과와, argon2 인자가 바뀌어 다시 해싱했으면 새 해시를 돌려준다."""
+    return await password_hasher.averify_and_update(plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None) -> str:
@@ -29,10 +44,60 @@ def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None
     else:
         expire = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": now, "jti": uuid.uuid4().hex})
     encode_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encode_jwt
 
 
+# 서명 검증을 마친 토큰의 클레임. 키는 토큰의 SHA-256 이고, 토큰의 exp 에 맞춰 만료된다.
+verified_token_cache: TTLCache[str, dict] = TTLCache(
+    maxsize=int(os.getenv("ACCOUNT_TOKEN_CACHE_MAXSIZE", "10000")),
+    ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
+def _token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
 def decode_token(token: str) -> dict:
-    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
\ No newline at end of file
+    digest = _token_digest(token)
+    claims = verified_token_cache.get(digest)
+    if claims is None:
+        claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        ttl = claims["exp"] - time.time() if "exp" in claims else None
+        if ttl is None or ttl > 0:
+            verified_token_cache.set(digest, claims, ttl=ttl)
+    # 호출한 쪽에서 클레임을 고쳐도 캐시된 값은 바뀌지 않도록 복사해서 돌려준다.
+    return dict(claims)
+
+
+def discard_verified_token(token: str) -> None:
+    """로그아웃이나 탈퇴한 토큰은 다음 요청에서 처음부터 다시 검증하도록 캐시에서 뺀다."""
+    verified_token_cache.pop(_token_digest(token))
+
+def encode_cursor(username: str, user_id: int) -> str:
+    """
+    키셋 페이지네이션 커서. 마지막으로 돌려준 행의 정렬 키(사용자 계정 ID, id)를 담는다.
+
+    >>> encode_cursor("puddingcamp", 3)
+    'WyJwdWRkaW5nY2FtcCIsM10'
+    >>> decode_cursor(encode_cursor("puddingcamp", 3))
+    ('puddingcamp', 3)
+    >>> decode_cursor("invalid") is None
+    True
+    """
+    raw = json.dumps([username, user_id], separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int] | None:
+    """잘못된 커서면 None 을 돌려준다."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        username, user_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        return None
+    if not isinstance(username, str) or type(user_id) is not int:
+        return None
+    return username, user_id
@@ -5,9 +5,11 @@ from datetime import datetime
 from sqlalchemy import String
 from sqlmodel import Unicode, or_, cast, union
 from sqlalchemy.sql.expression import Select, select
+from appserver.apps.account.cache import user_cache
 from appserver.db import engine
 from appserver.libs.query import exact_match_list_json
 import wtforms as wtf
+from fastapi import Request
 from appserver.apps.calendar.models import Calendar, TimeSlot, Booking, BookingFile
 
 class CalendarAdmin(ModelView, model=Calendar):
@@ -61,6 +63,13 @@ class CalendarAdmin(ModelView, model=Calendar):
         },
     }
 
+    # 호스트가 바뀔 수도 있으므로 캐시된 사용자를 모두 지운다. 관리자 화면에서의 변경은 드물다.
+    async def after_model_change(self, data: dict, model: Calendar, is_created: bool, request: Request) -> None:
+        user_cache.invalidate_all()
+
+    async def after_model_delete(self, model: Calendar, request: Request) -> None:
+        user_cache.invalidate_all()
+
     def search_query(self, stmt: Select, term: str) -> Select:
         # 원래 search_query의 구현에서 따온 부분
         join_expressions = []
@@ -0,0 +1,221 @@
+"""
+Google Calendar watch 채널(푸시 알림) 등록·갱신과 증분 동기화
+
+캘린더마다 watch 채널을 하나 등록해 두면, 이벤트가 바뀔 때 Google 이 웹훅(`/google-calendar/notifications`)을 호출한다.
+알림을 받은 캘린더만 sync token 으로 바뀐 이벤트를 받아와 event_list 캐시를 무효화하므로,
+변경이 없는 캘린더는 캐시를 오래(`watched_ttl`) 유지하고 Google 을 거의 호출하지 않는다.
+알림은 워커 하나에만 오므로, 다른 워커는 `revalidate_event_cache` 로 DB 의 sync token 을 보고 캐시를 버린다.
+
+채널은 만료되므로 `renew_channels` 를 주기적으로 실행한다.
+CLI: `python -m appserver.apps.calendar.channels` (env `GOOGLE_CALENDAR_WEBHOOK_URL` 필요)
+"""
+import asyncio
+import os
+import secrets
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlmodel import select, update
+
+from appserver.apps.calendar.models import Calendar, GoogleCalendarChannel
+from appserver.libs.google.calendar.services import GoogleCalendarService, SyncTokenExpiredError
+
+
+# Google 이 알림을 보낼 공개 HTTPS 주소. 설정되어 있지 않으면 채널을 등록하지 않는다.
+CHANNEL_WEBHOOK_URL = os.getenv("GOOGLE_CALENDAR_WEBHOOK_URL")
+CHANNEL_TTL_SECONDS = int(os.getenv("GOOGLE_CALENDAR_CHANNEL_TTL", str(7 * 24 * 60 * 60)))
+# 만료까지 이만큼 남으면 새 채널로 갈아탄다.
+CHANNEL_RENEW_BEFORE = timedelta(seconds=int(os.getenv("GOOGLE_CALENDAR_CHANNEL_RENEW_BEFORE", str(24 * 60 * 60))))
+CHANNEL_RENEW_INTERVAL_SECONDS = float(os.getenv("GOOGLE_CALENDAR_CHANNEL_RENEW_INTERVAL", "3600"))
+
+
+@dataclass
+class RenewReport:
+    registered: int = 0
+    failed: int = 0
+    watching: int = 0
+
+
+async def register_channel(
+    session: AsyncSession,
+    service: GoogleCalendarService,
+    google_calendar_id: str,
+    address: str,
+) -> GoogleCalendarChannel:
+    """
+    새 watch 채널을 등록하고 저장한다. 이미 채널이 있으면 새 채널이 등록된 다음 이전 채널을 중지하므로
+    갈아타는 동안 알림이 끊기지 않는다. sync token 은 이전 것을 이어 쓰고, 없으면 새로 받는다.
+
+    그사이 다른 프로세스가 같은 캘린더의 채널을 먼저 저장했다면 그쪽을 남긴다.
+    방금 등록한 채널은 어디에도 저장되지 않아 알림을 받아도 거부되므로 바로 중지한다.
+    """
+    stmt = select(GoogleCalendarChannel).where(GoogleCalendarChannel.google_calendar_id == google_calendar_id)
+    channel = (await session.execute(stmt)).scalar_one_or_none()
+    previous = None if channel is None else (channel.channel_id, channel.resource_id)
+
+    resource = await service.watch_events(
+        channel_id=uuid.uuid4().hex,
+        address=address,
+        token=secrets.token_urlsafe(32),
+        google_calendar_id=google_calendar_id,
+        ttl_seconds=CHANNEL_TTL_SECONDS,
+    )
+    values = {
+        "channel_id": resource["id"],
+        "resource_id": resource["resourceId"],
+        "token": resource["token"],
+        "expires_at": datetime.fromtimestamp(int(resource["expiration"]) / 1000, tz=timezone.utc),
+    }
+
+    if previous is None:
+        _, sync_token = await service.sync_events(None, google_calendar_id)
+        session.add(GoogleCalendarChannel(google_calendar_id=google_calendar_id, sync_token=sync_token, **values))
+        try:
+            await session.commit()
+            saved = True
+        except IntegrityError:
+            await session.rollback()
+            saved = False
+    else:
+        # 읽어 둔 채널이 그대로일 때만 바꿔서, 먼저 갈아탄 다른 프로세스의 채널을 덮어쓰지 않는다.
+        stmt_update = (
+            update(GoogleCalendarChannel)
+            .where(
+                GoogleCalendarChannel.google_calendar_id == google_calendar_id,
+                GoogleCalendarChannel.channel_id == previous[0],
+            )
+            .values(**values)
+        )
+        saved = (await session.execute(stmt_update)).rowcount == 1
+        await session.commit()
+
+    if not saved:
+        await service.stop_channel(resource["id"], resource["resourceId"])
+    elif previous is not None:
+        await service.stop_channel(*previous)
+
+    channel = (await session.execute(stmt.execution_options(populate_existing=True))).scalar_one()
+    if service.event_cache is not None:
+        service.event_cache.watch(google_calendar_id, channel.sync_token)
+    return channel
+
+
+async def renew_channels(
+    session: AsyncSession,
+    service: GoogleCalendarService,
+    address: str,
+    *,
+    now: datetime | None = None,
+) -> RenewReport:
+    """채널이 없거나 곧 만료되는 캘린더에 채널을 등록한다."""
+    now = now or datetime.now(timezone.utc)
+    report = RenewReport()
+
+    calendar_ids = (await session.execute(select(Calendar.google_calendar_id).distinct())).scalars().all()
+    stmt = select(
+        GoogleCalendarChannel.google_calendar_id,
+        GoogleCalendarChannel.expires_at,
+        GoogleCalendarChannel.sync_token,
+    )
+    channels = {row.google_calendar_id: row for row in (await session.execute(stmt)).all()}
+
+    for google_calendar_id in calendar_ids:
+        channel = channels.get(google_calendar_id)
+        if channel is not None and channel.expires_at - now > CHANNEL_RENEW_BEFORE:
+            if service.event_cache is not None:
+                service.event_cache.watch(google_calendar_id, channel.sync_token)
+            report.watching += 1
+            continue
+        try:
+            await register_channel(session, service, google_calendar_id, address)
+        except Exception as e:
+            await session.rollback()
+            print("register channel error", google_calendar_id, e)
+            report.failed += 1
+            continue
+        report.registered += 1
+        report.watching += 1
+    return report
+
+
+async def sync_calendar(
+    session: AsyncSession,
+    service: GoogleCalendarService,
+    channel: GoogleCalendarChannel,
+) -> int:
+    """
+    알림을 받은 캘린더의 변경분만 받아와 event_list 캐시를 무효화하고 다음 sync token 을 저장한다.
+    sync token 이 만료되었으면 새 token 을 받아 처음부터 다시 시작한다. 바뀐 이벤트 수를 돌려준다.
+    """
+    google_calendar_id = channel.google_calendar_id
+    try:
+        changes, sync_token = await service.sync_events(channel.sync_token, google_calendar_id)
+    except SyncTokenExpiredError:
+        changes, sync_token = [], (await service.sync_events(None, google_calendar_id))[1]
+        service.invalidate_events(google_calendar_id)
+
+    if changes:
+        service.invalidate_events(google_calendar_id)
+    channel.sync_token = sync_token
+    await session.commit()
+    if service.event_cache is not None:
+        service.event_cache.watch(google_calendar_id, sync_token)
+    return len(changes)
+
+
+async def revalidate_event_cache(
+    session: AsyncSession,
+    service: GoogleCalendarService,
+    google_calendar_id: str,
+) -> None:
+    """
+    캐시된 일정을 쓰기 전에 DB 의 sync token 을 확인한다. 변경 알림은 워커 하나에만 오므로,
+    다른 워커가 알림을 받아 sync token 이 바뀌었으면 이 워커의 캐시도 버린다.
+    채널이 없는 캘린더는 알림을 받지 못하므로 기본 TTL 로 캐시한다.
+    """
+    if service.event_cache is None:
+        return
+    stmt = select(GoogleCalendarChannel.sync_token).where(GoogleCalendarChannel.google_calendar_id == google_calendar_id)
+    row = (await session.execute(stmt)).first()
+    if row is None:
+        service.event_cache.unwatch(google_calendar_id)
+    else:
+        service.event_cache.watch(google_calendar_id, row.sync_token)
+
+
+async def run_channel_scheduler(
+    session_factory: async_sessionmaker,
+    service: GoogleCalendarService,
+    address: str,
+    interval: float = CHANNEL_RENEW_INTERVAL_SECONDS,
+) -> None:
+    while True:
+        try:
+            async with session_factory() as session:
+                report = await renew_channels(session, service, address)
+            if report.registered or report.failed:
+                print("renew google calendar channels:", report)
+        except Exception as e:
+            print("renew google calendar channels error", e)
+        await asyncio.sleep(interval)
+
+
+async def main() -> RenewReport:
+    from appserver.db import async_session_factory
+    from appserver.libs.google.calendar.deps import get_google_calendar_service
+
+    service = get_google_calendar_service()
+    if service is None or not CHANNEL_WEBHOOK_URL:
+        raise SystemExit("GOOGLE_CALENDAR_ID 와 GOOGLE_CALENDAR_WEBHOOK_URL 이 필요합니다.")
+
+    async with async_session_factory() as session:
+        report = await renew_channels(session, service, CHANNEL_WEBHOOK_URL)
+    print(report)
+    return report
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,27 +1,38 @@
 import asyncio
 import calendar
-from typing import Annotated
+import os
+import secrets
+from contextlib import aclosing
+from typing import Annotated, AsyncIterator
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
-from fastapi import APIRouter, BackgroundTasks, File, UploadFile, status, Query, HTTPException
+from fastapi import APIRouter, BackgroundTasks, File, Header, UploadFile, status, Query, HTTPException
 from fastapi.responses import StreamingResponse
-from sqlmodel import select, and_, func, true, extract
+from sqlmodel import select, and_, func, extract
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from appserver.apps.account.models import User
-from appserver.apps.account.deps import CurrentUserDep, CurrentUserOptionalDep
-from appserver.db import DbSessionDep
+from appserver.apps.account.cache import user_cache
+from appserver.apps.account.deps import CurrentPrincipalDep, CurrentUserDep, CurrentUserOptionalDep
+from appserver.db import DbSessionDep, DbSessionFactoryDep
+from appserver.loader_profiles import loader_options
+from appserver.loaders import LoadersDep
 from appserver.libs.google.calendar.deps import GoogleCalendarServiceDep
+from appserver.libs.google.calendar.services import GoogleCalendarUnavailableError
+from appserver.libs.responses import TypedJSONResponse, dump_json
+from appserver.libs.streams import interleave
 
-from .enums import AttendanceStatus
+from .channels import revalidate_event_cache, sync_calendar
+from .enums import AttendanceStatus, BookingListFormat
 from .exceptions import (
     BookingAlreadyExistsError,
     CalendarAlreadyExistsError,
     CalendarNotFoundError,
+    ChannelNotFoundError,
     GuestPermissionError,
     HostNotFoundError,
+    InvalidChannelTokenError,
     PastBookingError,
     SelfBookingError,
     TimeSlotNotFoundError,
@@ -29,14 +40,17 @@ from .exceptions import (
 )
 
 from .deps import UtcNow
-from .models import Booking, BookingFile, Calendar, TimeSlot
+from .models import Booking, BookingFile, Calendar, GoogleCalendarChannel, TimeSlot
 from .schemas import (
     BookingCreateIn,
     BookingOut,
+    CalendarBookingOut,
     CalendarCreateIn,
     CalendarDetailOut,
     CalendarOut,
     CalendarUpdateIn,
+    CompactBookingListOut,
+    CompactPaginatedBookingOut,
     GoogleCalendarEventOut,
     GuestBookingUpdateIn,
     HostBookingStatusUpdateIn,
@@ -45,32 +59,136 @@ from .schemas import (
     SimpleBookingOut,
     TimeSlotCreateIn,
     TimeSlotOut,
+    convert_event_list,
 )
 
 
 KST = ZoneInfo("Asia/Seoul")
 
+# Google Calendar 장애로 캐시에 남은(또는 빈) 일정을 대신 내려줬음을 알리는 응답 헤더
+GOOGLE_CALENDAR_STALE_HEADER = "X-Google-Calendar-Stale"
+# 마감 시간 안에 끝나지 않아 빠진 데이터(bookings, google)를 알리는 응답 헤더
+PARTIAL_RESULT_HEADER = "X-Partial-Result"
+
+# 월별 부킹 목록에서 DB 부킹과 Google 일정을 함께 기다리는 최대 시간(초)
+CALENDAR_BOOKINGS_DEADLINE = float(os.getenv("CALENDAR_BOOKINGS_DEADLINE", "2.5"))
+
+# 월별 부킹 스트림: 서버 측 커서에서 한 번에 가져오는 행 수, DB 부킹과 Google 이벤트를 모아 두는 큐 크기
+MONTH_BOOKINGS_BATCH_SIZE = 500
+BOOKING_STREAM_BUFFER_SIZE = 64
+
 router = APIRouter()
 
 def check_overlap_sqlite(existing_weekdays: list[int], new_weekdays: list[int]) -> bool:
     return any(day in existing_weekdays for day in new_weekdays)
 
 
+async def fetch_time_slot_outs(session: AsyncSession, calendar_id: int) -> dict[int, TimeSlotOut]:
+    stmt = select(
+        TimeSlot.id,
+        TimeSlot.start_time,
+        TimeSlot.end_time,
+        TimeSlot.weekdays,
+        TimeSlot.created_at,
+        TimeSlot.updated_at,
+    ).where(TimeSlot.calendar_id == calendar_id)
+    result = await session.execute(stmt)
+    return {row.id: TimeSlotOut.model_validate(row._asdict()) for row in result}
+
+
+def month_bookings_stmt(time_slot_ids, year: int, month: int):
+    return (
+        select(Booking.id, Booking.when, Booking.time_slot_id)
+        .where(Booking.time_slot_id.in_(time_slot_ids))
+        .where(extract('year', Booking.when) == year)
+        .where(extract('month', Booking.when) == month)
+        .order_by(Booking.when.desc())
+    )
+
+
+async def fetch_month_bookings(session: AsyncSession, calendar_id: int, year: int, month: int) -> list[SimpleBookingOut]:
+    """
+    캘린더의 한 달 치 부킹을 SimpleBookingOut 으로 만든다.
+
+    ORM 인스턴스 대신 필요한 컬럼만 튜플로 읽으므로 identity map 에 부킹이 올라가지 않는다.
+    타임슬롯은 캘린더의 것을 먼저 한 번 읽어 두고, 같은 타임슬롯의 부킹끼리 같은 TimeSlotOut 을 공유한다.
+    """
+    time_slots = await fetch_time_slot_outs(session, calendar_id)
+    if not time_slots:
+        return []
+
+    result = await session.execute(month_bookings_stmt(time_slots, year, month))
+    # DB 에서 읽은 값이라 다시 검증하지 않는다.
+    return [
+        SimpleBookingOut.model_construct(id=row.id, when=row.when, time_slot=time_slots[row.time_slot_id])
+        for row in result
+    ]
+
+
+async def stream_month_bookings(
+    session: AsyncSession,
+    calendar_id: int,
+    year: int,
+    month: int,
+    *,
+    batch_size: int = MONTH_BOOKINGS_BATCH_SIZE,
+) -> AsyncIterator[SimpleBookingOut]:
+    """
+    `fetch_month_bookings` 와 같은 부킹을 서버 측 커서로 `batch_size` 행씩 읽으며 하나씩 내보낸다.
+    멈추면(취소·`aclose`) 커서를 바로 닫는다.
+    """
+    time_slots = await fetch_time_slot_outs(session, calendar_id)
+    if not time_slots:
+        return
+
+    stmt = month_bookings_stmt(time_slots, year, month).execution_options(yield_per=batch_size)
+    result = await session.stream(stmt)
+    try:
+        async for row in result:
+            yield SimpleBookingOut.model_construct(id=row.id, when=row.when, time_slot=time_slots[row.time_slot_id])
+    finally:
+        await result.close()
+
+
+def compact_bookings(bookings: list[Booking]) -> dict:
+    """
+    부킹 목록을 compact 형식으로 바꾼다. 부킹은 time_slot_id, host_id 로 관련 객체를 가리키고,
+    타임슬롯과 호스트는 처음 나온 순서대로 `included` 에 한 번씩만 넣는다. 관계는 미리 읽어 두어야 한다.
+    """
+    time_slots = {}
+    hosts = {}
+    for booking in bookings:
+        time_slots.setdefault(booking.time_slot.id, booking.time_slot)
+        hosts.setdefault(booking.host_id, booking.host)
+    return {
+        "bookings": bookings,
+        "included": {"time_slots": list(time_slots.values()), "hosts": list(hosts.values())},
+    }
+
+
+async def reload_booking_detail(session: AsyncSession, booking: Booking) -> Booking:
+    # 변경한 부킹을 응답(BookingOut)에 필요한 관계까지 다시 읽는다.
+    # 부킹만 만료시키므로 세션에 있는 타임슬롯, 캘린더, 호스트 인스턴스는 그대로 둔다.
+    booking_id = booking.id
+    session.expire(booking)
+    stmt = select(Booking).options(*loader_options("detail", Booking)).where(Booking.id == booking_id)
+    result = await session.execute(stmt)
+    return result.unique().scalar_one()
+
+
 @router.get("/calendar/{host_username}", status_code=status.HTTP_200_OK)
 async def host_calendar_detail(
     host_username: str,
     user: CurrentUserOptionalDep,
-    session: DbSessionDep
+    session: DbSessionDep,
+    loaders: LoadersDep,
 ) -> CalendarOut | CalendarDetailOut:
-    stmt = select(User).where(User.username == host_username)
-    result = await session.execute(stmt)
-    host = result.scalar_one_or_none()
+    # 로그인한 호스트가 자기 캘린더를 보면 인증할 때 읽은 사용자를 그대로 쓴다.
+    host = await loaders.users_by_username.load(host_username)
     if host is None:
         raise HostNotFoundError()
-    
-    stmt = select(Calendar).where(Calendar.host_id == host.id)
-    result = await session.execute(stmt)
-    calendar = result.scalar_one_or_none()
+
+    calendar = host.calendar
     if calendar is None:
         raise CalendarNotFoundError()
 
@@ -83,42 +201,89 @@ async def host_calendar_detail(
 @router.get(
     "/calendar/{host_username}/bookings",
     status_code=status.HTTP_200_OK,
-    response_model=list[SimpleBookingOut | GoogleCalendarEventOut],
+    response_model=list[CalendarBookingOut],
 )
 async def host_calendar_bookings(
     host_username: str,
-    session: DbSessionDep,
+    session_factory: DbSessionFactoryDep,
     year: Annotated[int, Query(ge=2026)],
     month: Annotated[int, Query(ge=1, le=12)],
     service: GoogleCalendarServiceDep,
-) -> list[SimpleBookingOut | GoogleCalendarEventOut]:
-    stmt = select(User).where(User.username == host_username)
-    result = await session.execute(stmt)
-    host = result.scalar_one_or_none()
+    loaders: LoadersDep,
+) -> TypedJSONResponse:
+    host = await loaders.users_by_username.load(host_username)
 
     if host is None or host.calendar is None:
         raise HostNotFoundError()
 
-    stmt = (
-        select(Booking)
-        .where(Booking.time_slot.has(TimeSlot.calendar_id == host.calendar.id))
-        .where(extract('year', Booking.when) == year)
-        .where(extract('month', Booking.when) == month)
-        .order_by(Booking.when.desc())
-    )
-    result = await session.execute(stmt)
-    bookings = result.unique().scalars().all()
-
     last_day = calendar.monthrange(year, month)[1]
-    events = await service.event_list(
-        time_min=datetime(year, month, 1).astimezone(timezone.utc),
-        time_max=datetime(year, month, last_day).astimezone(timezone.utc),
-        google_calendar_id=host.calendar.google_calendar_id,
-    )
-    for event in events:
-        bookings.append(GoogleCalendarEventOut.model_validate(event))
+    time_min = datetime(year, month, 1).astimezone(timezone.utc)
+    time_max = datetime(year, month, last_day).astimezone(timezone.utc)
+    google_calendar_id = host.calendar.google_calendar_id
+
+    async def _bookings() -> list:
+        # 마감 시간에 쿼리 도중 취소될 수 있으므로, 인증·로더가 쓰는 요청 세션 대신 이 조회만의 세션을 쓴다.
+        # 취소되면 이 세션과 연결만 버려진다.
+        async with session_factory() as bookings_session:
+            return await fetch_month_bookings(bookings_session, host.calendar.id, year, month)
+
+    async def _google_events() -> list | None:
+        if service is None:
+            return []
+        async with session_factory() as channel_session:
+            await revalidate_event_cache(channel_session, service, google_calendar_id)
+        try:
+            return await service.event_list(
+                time_min=time_min,
+                time_max=time_max,
+                google_calendar_id=google_calendar_id,
+            )
+        except GoogleCalendarUnavailableError:
+            return None
+        except Exception as e:
+            # TaskGroup 은 한 작업이 실패하면 나머지를 취소하므로, Google 쪽 오류가 DB 조회까지 취소하지 않게 여기서 받는다.
+            print("google calendar event_list error", e)
+            return None
+
+    # DB 부킹과 Google 일정을 동시에 읽고, 둘 다 CALENDAR_BOOKINGS_DEADLINE 안에 끝나야 한다.
+    # 시간이 지나면 끝나지 않은 쪽을 취소하고, 끝난 쪽만으로 응답하며 빠진 쪽을 헤더로 알린다.
+    try:
+        async with asyncio.timeout(CALENDAR_BOOKINGS_DEADLINE):
+            async with asyncio.TaskGroup() as group:
+                bookings_task = group.create_task(_bookings())
+                events_task = group.create_task(_google_events())
+    except* TimeoutError:
+        pass
+    except* Exception as errors:
+        # 여기까지 오는 것은 DB 오류뿐이다. ExceptionGroup 대신 원래 예외로 올려서 예외 처리·로깅이 그대로 되게 한다.
+        raise errors.exceptions[0]
+
+    headers = {}
+    partial = []
+    if bookings_task.cancelled():
+        bookings = []
+        partial.append("bookings")
+    else:
+        bookings = bookings_task.result()
+
+    if events_task.cancelled():
+        events = None
+        partial.append("google")
+    else:
+        events = events_task.result()
 
-    return bookings
+    if events is None:
+        events = []
+        if service is not None:
+            # Google 이 응답하지 않거나 늦으면 DB 부킹과 캐시에 남아 있는 일정만으로 응답한다.
+            events = service.cached_event_list(time_min, time_max, google_calendar_id) or []
+            headers[GOOGLE_CALENDAR_STALE_HEADER] = "true"
+    if partial:
+        headers[PARTIAL_RESULT_HEADER] = ",".join(partial)
+
+    bookings.extend(convert_event_list(events))
+
+    return TypedJSONResponse(bookings, list[CalendarBookingOut], headers=headers)
 
 
 @router.get(
@@ -131,36 +296,51 @@ async def host_calendar_bookings_stream(
     year: Annotated[int, Query(ge=2026)],
     month: Annotated[int, Query(ge=1, le=12)],
     service: GoogleCalendarServiceDep,
+    loaders: LoadersDep,
 ) -> StreamingResponse:
-    stmt = select(User).where(User.username == host_username)
-    result = await session.execute(stmt)
-    host = result.scalar_one_or_none()
+    host = await loaders.users_by_username.load(host_username)
 
     if host is None or host.calendar is None:
         raise HostNotFoundError()
 
-    stmt = (
-        select(Booking)
-        .where(Booking.time_slot.has(TimeSlot.calendar_id == host.calendar.id))
-        .where(extract('year', Booking.when) == year)
-        .where(extract('month', Booking.when) == month)
-        .order_by(Booking.when.desc())
-    )
-    result = await session.execute(stmt)
-    bookings = result.unique().scalars().all()
+    calendar_id = host.calendar.id
+    google_calendar_id = host.calendar.google_calendar_id
+    last_day = calendar.monthrange(year, month)[1]
+    time_min = datetime(year, month, 1).astimezone(timezone.utc)
+    time_max = datetime(year, month, last_day).astimezone(timezone.utc)
+
+    async def _google_events():
+        if service is None:
+            return
+
+        # 페이지 단위로 받아서 바로 내보내므로 한 달 치 이벤트를 메모리에 모아두지 않는다.
+        events = service.iter_events(
+            time_min=time_min,
+            time_max=time_max,
+            google_calendar_id=google_calendar_id,
+        )
+        sent = 0
+        try:
+            async for event in events:
+                yield GoogleCalendarEventOut.model_validate(event)
+                sent += 1
+        except GoogleCalendarUnavailableError:
+            # 이미 응답을 보내기 시작했으므로, 아직 아무 일정도 못 보낸 경우에만 캐시로 대신한다.
+            if sent == 0:
+                for item in convert_event_list(service.cached_event_list(time_min, time_max, google_calendar_id) or []):
+                    yield item
+
     async def _stream_bookings():
-        for booking in bookings:
-            yield f"{SimpleBookingOut.model_validate(booking).model_dump_json()}\n"
-
-        await asyncio.sleep(3)
-        last_day = calendar.monthrange(year, month)[1]
-        events = await service.event_list(
-            time_min=datetime(year, month, 1).astimezone(timezone.utc),
-            time_max=datetime(year, month, last_day).astimezone(timezone.utc),
-            google_calendar_id=host.calendar.google_calendar_id,
+        # DB 부킹과 Google 이벤트를 동시에 읽고, 어느 쪽이든 도착하는 대로 한 줄씩 보낸다.
+        # 클라이언트가 끊으면 interleave 가 남은 쪽을 취소하고 DB 커서를 닫는다.
+        items = interleave(
+            stream_month_bookings(session, calendar_id, year, month),
+            _google_events(),
+            maxsize=BOOKING_STREAM_BUFFER_SIZE,
         )
-        for event in events:
-            yield f"{GoogleCalendarEventOut.model_validate(event).model_dump_json()}\n"
+        async with aclosing(items):
+            async for item in items:
+                yield dump_json(CalendarBookingOut, item) + b"\n"
 
     return StreamingResponse(
         _stream_bookings(),
@@ -172,29 +352,40 @@ async def host_calendar_bookings_stream(
 @router.get(
     "/guest-calendar/bookings",
     status_code=status.HTTP_200_OK,
-    response_model=PaginatedBookingOut,
+    response_model=PaginatedBookingOut | CompactPaginatedBookingOut,
 )
 async def guest_calendar_bookings(
-    user: CurrentUserDep,
+    principal: CurrentPrincipalDep,
     session: DbSessionDep,
+    loaders: LoadersDep,
     page: Annotated[int, Query(ge=1)],
     page_size: Annotated[int, Query(ge=1, le=50)],
-) -> PaginatedBookingOut:
+    response_format: Annotated[BookingListFormat, Query(alias="format")] = BookingListFormat.FULL,
+) -> TypedJSONResponse:
     stmt = (
         select(Booking)
-        .options(selectinload(Booking.files))
-        .where(Booking.guest_id == user.id)
+        .options(*loader_options("list", Booking))
+        .where(Booking.guest_id == principal.id)
         .order_by(Booking.when.desc(), Booking.created_at.desc())
         .offset((page - 1) * page_size)
         .limit(page_size)
     )
     result = await session.execute(stmt)
-    count_stmt = select(func.count()).select_from(Booking).where(Booking.guest_id == user.id)
+    bookings = result.scalars().all()
+    count_stmt = select(func.count()).select_from(Booking).where(Booking.guest_id == principal.id)
     count_result = await session.execute(count_stmt)
-    
-    return PaginatedBookingOut(
-        bookings=result.unique().scalars().all(),
-        total_count=count_result.scalar_one_or_none() or 0,
+    await loaders.attach_bookings(bookings)
+
+    total_count = count_result.scalar_one_or_none() or 0
+
+    if response_format == BookingListFormat.COMPACT:
+        return TypedJSONResponse(
+            {**compact_bookings(bookings), "total_count": total_count},
+            CompactPaginatedBookingOut,
+        )
+    return TypedJSONResponse(
+        {"bookings": bookings, "total_count": total_count},
+        PaginatedBookingOut,
     )
 
 
@@ -222,6 +413,7 @@ async def create_calendar(
         await session.commit()
     except IntegrityError as exc:
         raise CalendarAlreadyExistsError() from exc
+    user_cache.invalidate(user.username)
     return calendar
 
 
@@ -255,6 +447,7 @@ async def update_calendar(
 
     # 데이터베이스에 반영한다.
     await session.commit()
+    user_cache.invalidate(user.username)
 
     return user.calendar
 
@@ -330,15 +523,10 @@ async def create_booking(
     payload: BookingCreateIn,
     service: GoogleCalendarServiceDep,
     background_tasks: BackgroundTasks,
+    loaders: LoadersDep,
 ) -> BookingOut:
-    stmt = (
-        select(User)
-        .where(User.username == host_username)
-        .where(User.is_host.is_(true()))
-    )
-    result = await session.execute(stmt)
-    host = result.scalar_one_or_none()
-    if host is None or host.calendar is None:
+    host = await loaders.users_by_username.load(host_username)
+    if host is None or not host.is_host or host.calendar is None:
         raise HostNotFoundError()
 
     if user.id == host.id:
@@ -347,14 +535,8 @@ async def create_booking(
     if payload.when < datetime.now(timezone.utc).date():
         raise PastBookingError()
 
-    stmt = (
-        select(TimeSlot)
-        .where(TimeSlot.id == payload.time_slot_id)
-        .where(TimeSlot.calendar_id == host.calendar.id)
-    )
-    result = await session.execute(stmt)
-    time_slot = result.scalar_one_or_none()
-    if time_slot is None:
+    time_slot = await loaders.time_slots_by_id.load(payload.time_slot_id)
+    if time_slot is None or time_slot.calendar_id != host.calendar.id:
         raise TimeSlotNotFoundError()
     if payload.when.weekday() not in time_slot.weekdays:
         raise TimeSlotNotFoundError()
@@ -379,7 +561,7 @@ async def create_booking(
     )
     session.add(booking)
     await session.commit()
-    await session.refresh(booking, ["files", "time_slot"])
+    booking = await reload_booking_detail(session, booking)
 
     start_datetime = datetime.combine(
         booking.when,
@@ -400,6 +582,9 @@ async def create_booking(
             description=booking.description,
             google_calendar_id=host.calendar.google_calendar_id,
         )
+        # 실패하면 google_event_id 를 비워 두고, reconcile 작업이 나중에 다시 만든다.
+        if event is None:
+            return
         booking.google_event_id = event["id"]
         await session.commit()
 
@@ -411,27 +596,34 @@ async def create_booking(
 @router.get(
     "/bookings",
     status_code=status.HTTP_200_OK,
-    response_model=list[BookingOut],
+    response_model=list[BookingOut] | CompactBookingListOut,
 )
 async def get_host_bookings_by_month(
     user: CurrentUserDep,
     session: DbSessionDep,
+    loaders: LoadersDep,
     page: Annotated[int, Query(ge=1)],
     page_size: Annotated[int, Query(ge=1, le=50)],
-) -> list[BookingOut]:
+    response_format: Annotated[BookingListFormat, Query(alias="format")] = BookingListFormat.FULL,
+) -> TypedJSONResponse:
     if not user.is_host or user.calendar is None:
         raise HostNotFoundError()
     
     stmt = (
         select(Booking)
+        .options(*loader_options("list", Booking))
         .where(Booking.time_slot.has(TimeSlot.calendar_id == user.calendar.id))
         .order_by(Booking.when.desc())
         .offset((page - 1) * page_size)
         .limit(page_size)
     )
     result = await session.execute(stmt)
-
-    return result.scalars().all()    
+    bookings = result.scalars().all()
+    # 캘린더와 호스트는 인증할 때 로더에 들어갔으므로 타임슬롯, 게스트, 첨부파일만 읽는다.
+    await loaders.attach_bookings(bookings)
+    if response_format == BookingListFormat.COMPACT:
+        return TypedJSONResponse(compact_bookings(bookings), CompactBookingListOut)
+    return TypedJSONResponse(bookings, list[BookingOut])
 
 
 @router.get(
@@ -440,20 +632,19 @@ async def get_host_bookings_by_month(
     response_model=BookingOut,
 )
 async def get_booking_by_id(
-    user: CurrentUserDep,
+    principal: CurrentPrincipalDep,
     session: DbSessionDep,
     booking_id: int
 ) -> BookingOut:
-    stmt = select(Booking).where(Booking.id == booking_id)
-    if user.is_host and user.calendar is not None:
+    stmt = select(Booking).options(*loader_options("detail", Booking)).where(Booking.id == booking_id)
+    if principal.is_host and principal.calendar_id is not None:
         stmt = (
             stmt
             .join(Booking.time_slot)
-            .options(selectinload(Booking.files))
-            .where((TimeSlot.calendar_id == user.calendar.id) | (Booking.guest_id == user.id))
+            .where((TimeSlot.calendar_id == principal.calendar_id) | (Booking.guest_id == principal.id))
         )
     else:
-        stmt = stmt.where(Booking.guest_id == user.id).options(selectinload(Booking.files))
+        stmt = stmt.where(Booking.guest_id == principal.id)
 
     result = await session.execute(stmt)
     booking = result.unique().scalar_one_or_none()
@@ -481,6 +672,7 @@ async def host_update_booking(
 
     stmt = (
         select(Booking)
+        .options(*loader_options("detail", Booking))
         .join(Booking.time_slot)
         .where(Booking.id == booking_id)
         .where(TimeSlot.calendar_id == user.calendar.id)
@@ -512,7 +704,7 @@ async def host_update_booking(
         booking.when = payload.when
 
     await session.commit()
-    await session.refresh(booking)
+    booking = await reload_booking_detail(session, booking)
  
     start_datetime = datetime.combine(
         booking.when,
@@ -557,6 +749,7 @@ async def guest_update_booking(
 ) -> BookingOut:
     stmt = (
         select(Booking)
+        .options(*loader_options("detail", Booking))
         .where(Booking.id == booking_id)
         .where(Booking.guest_id == user.id)
     )
@@ -589,7 +782,7 @@ async def guest_update_booking(
             raise TimeSlotNotFoundError()
         booking.when = payload.when
     await session.commit()
-    await session.refresh(booking)
+    booking = await reload_booking_detail(session, booking)
 
     if booking.google_event_id:
         start_datetime = datetime.combine(
@@ -635,12 +828,13 @@ async def update_booking_status(
 
     stmt = (
         select(Booking)
+        .options(*loader_options("detail", Booking))
         .join(Booking.time_slot)
         .where(Booking.id == booking_id)
         .where(TimeSlot.calendar_id == user.calendar.id)
     )
     result = await session.execute(stmt)
-    booking = result.scalar_one_or_none()
+    booking = result.unique().scalar_one_or_none()
     if booking is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="예약 내역이 없습니다.")
     
@@ -649,7 +843,7 @@ async def update_booking_status(
     
     booking.attendance_status = payload.attendance_status
     await session.commit()
-    await session.refresh(booking)
+    booking = await reload_booking_detail(session, booking)
     return booking
 
 
@@ -658,7 +852,7 @@ async def update_booking_status(
     status_code=status.HTTP_204_NO_CONTENT,
 )
 async def cancel_guest_booking(
-    user: CurrentUserDep,
+    principal: CurrentPrincipalDep,
     session: DbSessionDep,
     booking_id: int,
     now: UtcNow,
@@ -667,8 +861,9 @@ async def cancel_guest_booking(
 ) -> None:
     stmt = (
         select(Booking)
+        .options(*loader_options("detail", Booking))
         .where(Booking.id == booking_id)
-        .where(Booking.guest_id == user.id)
+        .where(Booking.guest_id == principal.id)
     )
     result = await session.execute(stmt)
     booking = result.unique().scalar_one_or_none()
@@ -681,7 +876,7 @@ async def cancel_guest_booking(
     if booking.attendance_status != AttendanceStatus.CANCELLED.value:
         booking.attendance_status = AttendanceStatus.CANCELLED.value
         await session.commit()
-        await session.refresh(booking)
+        booking = await reload_booking_detail(session, booking)
 
     if booking.google_event_id:
         async def _cancel_google_calendar_event():
@@ -706,6 +901,7 @@ async def upload_booking_files(
 ) -> BookingOut:
     stmt = (
         select(Booking)
+        .options(*loader_options("detail", Booking))
         .where(Booking.id == booking_id)
         .where(Booking.guest_id == user.id)
     )
@@ -720,8 +916,7 @@ async def upload_booking_files(
     for file in files:
         session.add(BookingFile(booking_id=booking.id, file=file))
     await session.commit()
-    await session.refresh(booking, ["files"])
-    return booking
+    return await reload_booking_detail(session, booking)
 
 
 @router.get(
@@ -732,18 +927,43 @@ async def upload_booking_files(
 async def get_host_timeslots(
     host_username: str,
     session: DbSessionDep,
+    loaders: LoadersDep,
 ) -> list[TimeSlotOut]:
-    stmt = (
-        select(User)
-        .where(User.username == host_username)
-        .where(User.is_active.is_(true()))
-        .where(User.is_host.is_(true()))
-    )
-    result = await session.execute(stmt)
-    host = result.scalar_one_or_none()
-    if host is None or host.calendar is None:
+    host = await loaders.users_by_username.load(host_username)
+    if host is None or not host.is_active or not host.is_host or host.calendar is None:
         raise HostNotFoundError()
     
     stmt = select(TimeSlot).where(TimeSlot.calendar_id == host.calendar.id)
     result = await session.execute(stmt)
-    return result.scalars().all()
\ No newline at end of file
+    return result.scalars().all()
+
+
+@router.post(
+    "/google-calendar/notifications",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def google_calendar_notification(
+    session: DbSessionDep,
+    service: GoogleCalendarServiceDep,
+    background_tasks: BackgroundTasks,
+    channel_id: Annotated[str, Header(alias="X-Goog-Channel-ID")],
+    resource_state: Annotated[str, Header(alias="X-Goog-Resource-State")],
+    channel_token: Annotated[str | None, Header(alias="X-Goog-Channel-Token")] = None,
+) -> None:
+    """Google Calendar watch 채널 알림을 받아 해당 캘린더만 증분 동기화한다."""
+    stmt = select(GoogleCalendarChannel).where(GoogleCalendarChannel.channel_id == channel_id)
+    result = await session.execute(stmt)
+    channel = result.scalar_one_or_none()
+    if channel is None:
+        raise ChannelNotFoundError()
+    if channel_token is None or not secrets.compare_digest(channel_token, channel.token):
+        raise InvalidChannelTokenError()
+
+    # "sync" 는 채널 등록 직후 오는 확인용 알림이라 바뀐 것이 없다.
+    if resource_state == "sync" or service is None:
+        return
+
+    if service.event_cache is not None:
+        service.event_cache.watch(channel.google_calendar_id, channel.sync_token)
+    # Google 은 응답이 늦으면 알림을 다시 보내므로, 동기화는 응답한 뒤에 한다.
+    background_tasks.add_task(sync_calendar, session, service, channel)
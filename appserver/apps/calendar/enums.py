@@ -16,4 +16,14 @@ class AttendanceStatus(enum.StrEnum):
     NO_SHOW = enum.auto()
     CANCELLED = enum.auto()
     SAME_DAY_CANCEL = enum.auto()
-    LATE = enum.auto()
\ No newline at end of file
+    LATE = enum.auto()
+
+
+class BookingListFormat(enum.StrEnum):
+    """
+    부킹 목록 응답 형식
+    - FULL: 부킹마다 타임슬롯과 호스트를 통째로 넣음
+    - COMPACT: 부킹은 time_slot_id, host_id 로 가리키고 관련 객체는 included 에 한 번씩만 넣음
+    """
+    FULL = enum.auto()
+    COMPACT = enum.auto()
@@ -79,4 +79,19 @@ class InvalidYearMonthError(HTTPException):
         super().__init__(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="유효하지 않은 년도 또는 월입니다.",
-        )
\ No newline at end of file
+        )
+
+class ChannelNotFoundError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="알림 채널이 없습니다.",
+        )
+
+
+class InvalidChannelTokenError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="알림 채널 토큰이 올바르지 않습니다.",
+        )
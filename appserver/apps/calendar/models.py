@@ -32,7 +32,8 @@ class Calendar(SQLModel, table=True):
         sa_relationship_kwargs={
             "uselist":False, 
             "single_parent":True, 
-            "lazy":"joined"
+            # 관계는 기본으로 읽지 않는다. 엔드포인트마다 `appserver.loader_profiles` 의 프로필로 필요한 것만 읽는다.
+            "lazy":"raise_on_sql"
             },
         )
 
@@ -78,7 +79,7 @@ class TimeSlot(SQLModel, table=True):
     calendar_id: int = Field(foreign_key="calendars.id")
     calendar: Calendar = Relationship(
         back_populates="time_slots",
-        sa_relationship_kwargs={"lazy":"joined"}
+        sa_relationship_kwargs={"lazy":"raise_on_sql"}
         )
 
     bookings: list["Booking"] = Relationship(
@@ -123,19 +124,19 @@ class Booking(SQLModel, table=True):
     time_slot_id: int = Field(foreign_key="time_slots.id")
     time_slot: TimeSlot = Relationship(
         back_populates="bookings",
-        sa_relationship_kwargs={"lazy":"joined"}
+        sa_relationship_kwargs={"lazy":"raise_on_sql"}
         )
 
     guest_id: int = Field(foreign_key="users.id")
     guest: "User" = Relationship(
         back_populates="bookings",
-        sa_relationship_kwargs={"lazy":"joined"},
+        sa_relationship_kwargs={"lazy":"raise_on_sql"},
         )
 
     files: list["BookingFile"] = Relationship(
         back_populates="booking",
         sa_relationship_kwargs={
-            "lazy": "joined",
+            "lazy": "raise_on_sql",
             # 부킹을 삭제할 때 관련 첨부파일도 함께 삭제하고,
             # 더 이상 어떤 부킹에도 속하지 않는 BookingFile은 고아 레코드로 남지 않도록 설정
             "cascade": "all, delete-orphan",
@@ -177,6 +178,10 @@ class Booking(SQLModel, table=True):
     def host(self) -> "User":
         return self.time_slot.calendar.host
 
+    @property
+    def host_id(self) -> int:
+        return self.time_slot.calendar.host_id
+
 
 
 class BookingFile(SQLModel, table=True):
@@ -199,3 +204,35 @@ class BookingFile(SQLModel, table=True):
         arbitrary_types_allowed=True,
     )
 
+
+
+class GoogleCalendarChannel(SQLModel, table=True):
+    __tablename__ = "google_calendar_channels"
+
+    id: int = Field(default=None, primary_key=True)
+    # 캘린더마다 활성 채널은 하나만 둔다. 갱신할 때 새 채널을 만들고 이전 채널은 중지한다.
+    google_calendar_id: str = Field(max_length=1024, unique=True, description="Google Calendar ID")
+    channel_id: str = Field(max_length=64, unique=True, description="watch 채널 ID (알림의 X-Goog-Channel-ID)")
+    resource_id: str = Field(max_length=255, description="Google 이 정한 감시 대상 리소스 ID, 채널 중지에 필요")
+    token: str = Field(max_length=255, description="알림의 X-Goog-Channel-Token 으로 돌아오는 검증용 비밀 값")
+    sync_token: str | None = Field(default=None, max_length=255, description="증분 동기화용 nextSyncToken")
+    expires_at: AwareDatetime = Field(sa_type=UtcDateTime, description="채널 만료 시각")
+
+    created_at: AwareDatetime = Field(
+        default=None,
+        nullable=False,
+        sa_type=UtcDateTime,
+        sa_column_kwargs={
+            "server_default": func.now(),
+        },
+    )
+
+    updated_at: AwareDatetime = Field(
+        default=None,
+        nullable=False,
+        sa_type=UtcDateTime,
+        sa_column_kwargs={
+            "server_default": func.now(),
+            "onupdate": lambda: datetime.now(timezone.utc),
+        },
+    )
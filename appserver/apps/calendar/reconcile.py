@@ -0,0 +1,285 @@
+"""
+google_event_id 가 비어 있는 부킹을 찾아 Google Calendar 일정을 다시 만드는 보정 작업
+
+부킹 생성 직후의 백그라운드 작업(`_apply_event_id`)이 실패하면 google_event_id 가 NULL 로 남는다.
+이 모듈은 그런 부킹을 id 기준 keyset 페이지네이션으로 훑으며, 페이지마다
+- batch 요청(최대 BATCH_MAX_REQUESTS 개)으로 일정을 만들고, batch 들은 `concurrency` 개까지 동시에 보낸 뒤
+- 받은 이벤트 ID 를 google_event_id 가 아직 비어 있는 행에만 executemany UPDATE 한 번으로 기록한다.
+
+방금 만든 부킹은 백그라운드 작업이 아직 일정을 만드는 중일 수 있으므로 `grace` 보다 오래된 부킹만 훑는다.
+그래도 그사이 다른 쪽이 먼저 기록했다면, 이번에 만든 일정은 중복이므로 지운다.
+
+CLI: `python -m appserver.apps.calendar.reconcile --batch-size 200 --concurrency 4`
+워커마다 돌면 같은 부킹의 일정을 서로 만들고 지우게 되므로, 주기적으로 돌릴 때도 앱 lifespan 이 아니라
+cron 이나 `--interval` 을 준 이 CLI 프로세스 하나에서만 실행한다.
+"""
+import argparse
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import Row, bindparam, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlmodel import select
+
+from appserver.apps.calendar.endpoints import KST
+from appserver.apps.calendar.enums import AttendanceStatus
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+from appserver.libs.datetime.datetime import utcnow
+from appserver.libs.google.calendar.services import BATCH_MAX_REQUESTS, GoogleCalendarService
+
+
+RECONCILE_BATCH_SIZE = int(os.getenv("GOOGLE_RECONCILE_BATCH_SIZE", "200"))
+RECONCILE_CONCURRENCY = int(os.getenv("GOOGLE_RECONCILE_CONCURRENCY", "4"))
+# CLI `--interval` 의 기본값. 0 이면 한 번만 실행하고 끝낸다.
+RECONCILE_INTERVAL_SECONDS = float(os.getenv("GOOGLE_RECONCILE_INTERVAL", "0"))
+# 생성된 지 이만큼 지나지 않은 부킹은 `_apply_event_id` 가 아직 처리 중일 수 있으므로 건너뛴다.
+RECONCILE_GRACE = timedelta(minutes=float(os.getenv("GOOGLE_RECONCILE_GRACE_MINUTES", "5")))
+
+# 취소된 부킹은 일정을 만들 필요가 없다.
+SKIPPED_STATUSES = (AttendanceStatus.CANCELLED, AttendanceStatus.SAME_DAY_CANCEL)
+
+
+@dataclass
+class ReconcileReport:
+    scanned: int = 0
+    created: int = 0
+    # 다른 쪽이 먼저 google_event_id 를 기록해 지운 중복 일정 수
+    duplicated: int = 0
+    failed_booking_ids: list[int] = field(default_factory=list)
+    # 지우지 못해 호스트 캘린더에 남은 중복 일정 ID
+    undeleted_event_ids: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def failed(self) -> int:
+        return len(self.failed_booking_ids)
+
+    @property
+    def throughput(self) -> float:
+        """초당 생성한 일정 수"""
+        if not self.elapsed:
+            return 0.0
+        return self.created / self.elapsed
+
+    def __str__(self):
+        return (
+            f"scanned={self.scanned} created={self.created} duplicated={self.duplicated} failed={self.failed} "
+            f"undeleted={len(self.undeleted_event_ids)} "
+            f"elapsed={self.elapsed:.2f}s throughput={self.throughput:.1f}/s"
+        )
+
+
+async def iter_unsynced_bookings(
+    session: AsyncSession,
+    *,
+    since: date,
+    created_before: datetime,
+    batch_size: int = RECONCILE_BATCH_SIZE,
+) -> AsyncIterator[Sequence[Row]]:
+    """
+    `since` 이후 예정되고 `created_before` 전에 만든, google_event_id 가 없는 부킹을 id 순으로 `batch_size` 개씩 내보낸다.
+    OFFSET 대신 마지막 id 를 기준으로 다음 페이지를 읽으므로, 훑는 도중 행이 갱신돼도 건너뛰거나 중복되지 않는다.
+    관계 로딩(joined) 없이 일정을 만드는 데 필요한 컬럼만 읽는다.
+    """
+    last_id = 0
+    while True:
+        stmt = (
+            select(
+                Booking.id,
+                Booking.when,
+                Booking.topic,
+                Booking.description,
+                TimeSlot.start_time,
+                TimeSlot.end_time,
+                Calendar.google_calendar_id,
+            )
+            .join(TimeSlot, TimeSlot.id == Booking.time_slot_id)
+            .join(Calendar, Calendar.id == TimeSlot.calendar_id)
+            .where(
+                Booking.id > last_id,
+                Booking.google_event_id.is_(None),
+                Booking.when >= since,
+                Booking.created_at < created_before,
+                Booking.attendance_status.not_in(SKIPPED_STATUSES),
+            )
+            .order_by(Booking.id)
+            .limit(batch_size)
+        )
+        rows = (await session.execute(stmt)).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+async def reconcile_missing_events(
+    session: AsyncSession,
+    service: GoogleCalendarService,
+    *,
+    since: date | None = None,
+    batch_size: int = RECONCILE_BATCH_SIZE,
+    concurrency: int = RECONCILE_CONCURRENCY,
+    grace: timedelta = RECONCILE_GRACE,
+) -> ReconcileReport:
+    now = utcnow()
+    if since is None:
+        since = now.astimezone(KST).date()
+
+    report = ReconcileReport()
+    semaphore = asyncio.Semaphore(concurrency)
+    started_at = time.perf_counter()
+
+    async def _create(rows: Sequence[Row]) -> list[dict | None]:
+        async with semaphore:
+            return await service.create_events_batch([
+                (
+                    row.google_calendar_id,
+                    service.make_event_body(
+                        datetime.combine(row.when, row.start_time, tzinfo=KST),
+                        datetime.combine(row.when, row.end_time, tzinfo=KST),
+                        summary=row.topic,
+                        description=row.description,
+                    ),
+                )
+                for row in rows
+            ])
+
+    pages = iter_unsynced_bookings(session, since=since, created_before=now - grace, batch_size=batch_size)
+    async for rows in pages:
+        report.scanned += len(rows)
+        chunks = [rows[start:start + BATCH_MAX_REQUESTS] for start in range(0, len(rows), BATCH_MAX_REQUESTS)]
+        results = await asyncio.gather(*[_create(chunk) for chunk in chunks])
+
+        created: dict[int, tuple[Row, str]] = {}
+        for chunk, events in zip(chunks, results):
+            for row, event in zip(chunk, events):
+                if event is None:
+                    report.failed_booking_ids.append(row.id)
+                else:
+                    created[row.id] = (row, event["id"])
+
+        if created:
+            duplicates = await store_event_ids(
+                session,
+                {booking_id: event_id for booking_id, (_, event_id) in created.items()},
+            )
+            # 다른 쪽이 먼저 기록한 부킹의 일정은 호스트 캘린더에 중복으로 남지 않게 지운다.
+            # 하나를 지우지 못해도 나머지 삭제와 다음 페이지는 계속하고, 남은 일정은 보고서에 모은다.
+            deleted = await asyncio.gather(
+                *[
+                    service.delete_event(created[booking_id][1], created[booking_id][0].google_calendar_id)
+                    for booking_id in duplicates
+                ],
+                return_exceptions=True,
+            )
+            for booking_id, result in zip(duplicates, deleted):
+                if result is not True:
+                    print("delete duplicated google event error", booking_id, result)
+                    report.undeleted_event_ids.append(created[booking_id][1])
+            report.created += len(created) - len(duplicates)
+            report.duplicated += len(duplicates)
+
+    report.elapsed = time.perf_counter() - started_at
+    return report
+
+
+async def store_event_ids(session: AsyncSession, event_ids: dict[int, str]) -> list[int]:
+    """
+    부킹 id → 이벤트 ID 를 google_event_id 가 비어 있는 행에만 기록하고 커밋한다.
+    이미 다른 이벤트 ID 가 들어 있어 기록하지 못한 부킹 id 목록을 돌려준다.
+    """
+    table = Booking.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("booking_id"), table.c.google_event_id.is_(None))
+        .values(google_event_id=bindparam("event_id"))
+    )
+    await session.execute(stmt, [
+        {"booking_id": booking_id, "event_id": event_id}
+        for booking_id, event_id in event_ids.items()
+    ])
+    await session.commit()
+
+    # executemany 는 행마다 결과를 돌려주지 않으므로, 기록된 값을 다시 읽어 누가 먼저였는지 확인한다.
+    stored = await session.execute(
+        select(Booking.id, Booking.google_event_id).where(Booking.id.in_(event_ids))
+    )
+    return [booking_id for booking_id, event_id in stored.all() if event_id != event_ids[booking_id]]
+
+
+async def run_reconcile_scheduler(
+    session_factory: async_sessionmaker,
+    service: GoogleCalendarService,
+    interval: float = RECONCILE_INTERVAL_SECONDS,
+    *,
+    batch_size: int = RECONCILE_BATCH_SIZE,
+    concurrency: int = RECONCILE_CONCURRENCY,
+) -> None:
+    """`interval` 초마다 보정을 실행한다. 한 번 실패해도 다음 주기에 다시 시도한다."""
+    while True:
+        try:
+            async with session_factory() as session:
+                report = await reconcile_missing_events(
+                    session,
+                    service,
+                    batch_size=batch_size,
+                    concurrency=concurrency,
+                )
+            if report.scanned:
+                print("reconcile google events:", report)
+        except Exception as e:
+            print("reconcile google events error", e)
+        await asyncio.sleep(interval)
+
+
+async def main(argv: Sequence[str] | None = None) -> ReconcileReport:
+    from appserver.db import async_session_factory
+    from appserver.libs.google.calendar.deps import get_google_calendar_service
+
+    parser = argparse.ArgumentParser(description="google_event_id 가 없는 부킹의 Google Calendar 일정을 만든다.")
+    parser.add_argument("--batch-size", type=int, default=RECONCILE_BATCH_SIZE)
+    parser.add_argument("--concurrency", type=int, default=RECONCILE_CONCURRENCY)
+    parser.add_argument("--since", type=date.fromisoformat, default=None, help="YYYY-MM-DD, 기본값은 오늘")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=RECONCILE_INTERVAL_SECONDS,
+        help="0 보다 크면 이 간격(초)마다 계속 실행한다. 이 프로세스 하나에서만 돌린다.",
+    )
+    args = parser.parse_args(argv)
+
+    service = get_google_calendar_service()
+    if service is None:
+        parser.error("GOOGLE_CALENDAR_ID 가 설정되어 있지 않습니다.")
+
+    if args.interval > 0:
+        await run_reconcile_scheduler(
+            async_session_factory,
+            service,
+            args.interval,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+        )
+
+    async with async_session_factory() as session:
+        report = await reconcile_missing_events(
+            session,
+            service,
+            since=args.since,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+        )
+    print(report)
+    if report.failed_booking_ids:
+        print("failed booking ids:", report.failed_booking_ids)
+    if report.undeleted_event_ids:
+        print("undeleted duplicated event ids:", report.undeleted_event_ids)
+    return report
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
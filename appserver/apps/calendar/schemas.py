@@ -1,12 +1,15 @@
+import os
 from datetime import date, datetime, time
-from typing import Annotated
+from typing import Annotated, NamedTuple
 
 from fastapi_storages import StorageFile
-from pydantic import AwareDatetime, EmailStr, AfterValidator, computed_field, model_validator
+from pydantic import AwareDatetime, EmailStr, AfterValidator, model_validator
 from sqlmodel import SQLModel, Field
 from sqlmodel.main import SQLModelConfig
 from appserver.apps.account.schemas import UserOut
+from appserver.libs.collections.cache import TTLCache
 from appserver.libs.collections.sort import deduplicate_and_sort
+from appserver.libs.responses import type_adapter
 
 from .enums import AttendanceStatus
 
@@ -117,6 +120,38 @@ class PaginatedBookingOut(SQLModel):
     total_count: int
 
 
+class CompactBookingOut(SQLModel):
+    id: int
+    when: date
+    topic: str
+    description: str
+    time_slot_id: int
+    host_id: int
+    attendance_status: AttendanceStatus
+    google_event_id: str | None
+    files: list[BookingFileOut]
+    created_at: AwareDatetime
+    updated_at: AwareDatetime
+
+
+class IncludedHostOut(UserOut):
+    id: int
+
+
+class BookingIncludedOut(SQLModel):
+    time_slots: list[TimeSlotOut]
+    hosts: list[IncludedHostOut]
+
+
+class CompactBookingListOut(SQLModel):
+    bookings: list[CompactBookingOut]
+    included: BookingIncludedOut
+
+
+class CompactPaginatedBookingOut(CompactBookingListOut):
+    total_count: int
+
+
 class SimpleBookingOut(SQLModel):
     id: int
     when: date
@@ -146,36 +181,92 @@ class GoogleCalendarTimeSlot(SQLModel):
     weekdays: list[int]
 
 
+class GoogleCalendarEventSpan(NamedTuple):
+    """Google Calendar 이벤트의 start/end 를 한 번 해석한 결과"""
+    when: date
+    start_time: time
+    end_time: time
+
+
+def parse_event_span(start: dict, end: dict) -> GoogleCalendarEventSpan:
+    """
+    이벤트의 start/end 를 해석한다. 종일 일정은 00:00 ~ 23:59 로 본다.
+
+    >>> parse_event_span({"date": "2026-03-05"}, {"date": "2026-03-06"})
+    GoogleCalendarEventSpan(when=datetime.date(2026, 3, 5), start_time=datetime.time(0, 0), end_time=datetime.time(23, 59))
+    >>> parse_event_span({"dateTime": "2026-03-05T10:00:00+09:00"}, {"dateTime": "2026-03-05T11:30:00+09:00"})
+    GoogleCalendarEventSpan(when=datetime.date(2026, 3, 5), start_time=datetime.time(10, 0), end_time=datetime.time(11, 30))
+    """
+    if start_date := start.get("date"):
+        return GoogleCalendarEventSpan(date.fromisoformat(start_date), time(0, 0), time(23, 59))
+
+    start_at = datetime.fromisoformat(start["dateTime"])
+    end_at = datetime.fromisoformat(end["dateTime"])
+    return GoogleCalendarEventSpan(start_at.date(), start_at.time(), end_at.time())
+
+
+def compact_event(event: dict) -> dict:
+    """원본 이벤트를 GoogleCalendarEventOut 의 필드만 남긴 dict 로 바꾼다. start/end 는 여기서 한 번만 해석한다."""
+    span = parse_event_span(event["start"], event["end"])
+    return {
+        "id": event["id"],
+        "time_slot": {
+            "start_time": span.start_time,
+            "end_time": span.end_time,
+            "weekdays": [span.when.weekday()],
+        },
+        "when": span.when,
+    }
+
+
 class GoogleCalendarEventOut(SQLModel):
     id: str
-    start: dict = Field(exclude=True)
-    end: dict = Field(exclude=True)
-
-    @computed_field
-    @property
-    def time_slot(self) -> GoogleCalendarTimeSlot:
-        if start_date := self.start.get("date"):
-            start_time = time(0, 0)
-            end_time = time(23, 59)
-            start_date = date.fromisoformat(start_date)
-        else:
-            start = datetime.fromisoformat(self.start["dateTime"])
-            start_time = start.time()
-            start_date = start.date()
-            end_time = datetime.fromisoformat(self.end["dateTime"]).time()
-
-        weekdays = [start_date.weekday()]
-
-        return GoogleCalendarTimeSlot(
-            start_time=start_time,
-            end_time=end_time,
-            weekdays=weekdays,
+    time_slot: GoogleCalendarTimeSlot
+    when: date
+
+    @model_validator(mode="before")
+    @classmethod
+    def parse_start_end(cls, data):
+        if isinstance(data, dict) and "start" in data:
+            return compact_event(data)
+        return data
+
+
+def event_key(event: dict) -> tuple[str, str, str]:
+    """
+    변환 결과를 결정하는 값(id, 시작, 종료). 이 값이 같으면 GoogleCalendarEventOut 도 같다.
+
+    >>> event_key({"id": "a", "start": {"date": "2026-03-05"}, "end": {"date": "2026-03-06"}})
+    ('a', '2026-03-05', '2026-03-06')
+    """
+    start, end = event["start"], event["end"]
+    return event["id"], start.get("date") or start["dateTime"], end.get("date") or end["dateTime"]
+
+
+# 변환한 이벤트. 키가 결과를 결정하므로 값이 낡지 않고, 같은 달을 다시 조회할 때 그대로 쓴다.
+event_out_cache: TTLCache[tuple[str, str, str], GoogleCalendarEventOut] = TTLCache(
+    maxsize=int(os.getenv("CALENDAR_EVENT_OUT_CACHE_MAXSIZE", "10000")),
+    ttl=float(os.getenv("CALENDAR_EVENT_OUT_CACHE_TTL", "3600")),
+)
+
+
+def convert_event_list(events: list[dict]) -> list[GoogleCalendarEventOut]:
+    """
+    `event_list` 결과 전체를 GoogleCalendarEventOut 목록으로 바꾼다.
+    캐시에 없는 이벤트만 미리 해석해 두고 TypeAdapter 한 번으로 검증한다. 돌려준 객체는 여러 응답이 같이 쓰므로 고치지 않는다.
+    """
+    keys = [event_key(event) for event in events]
+    items = [event_out_cache.get(key) for key in keys]
+    missing = [index for index, item in enumerate(items) if item is None]
+    if missing:
+        converted = type_adapter(list[GoogleCalendarEventOut]).validate_python(
+            [compact_event(events[index]) for index in missing],
         )
+        for index, item in zip(missing, converted):
+            event_out_cache.set(keys[index], item)
+            items[index] = item
+    return items
+
 
-    @computed_field
-    @property
-    def when(self) -> date:
-        if start_date := self.start.get("date"):
-            return date.fromisoformat(start_date)
-        return datetime.fromisoformat(self.start.get("dateTime")).date()
-    
\ No newline at end of file
+# 호스트 캘린더 월별 목록의 항목: DB 부킹 또는 Google Calendar 이벤트
+CalendarBookingOut = SimpleBookingOut | GoogleCalendarEventOut
@@ -46,4 +46,12 @@ async def use_session():
         yield session
 
 
-DbSessionDep = Annotated[AsyncSession, Depends(use_session)]
\ No newline at end of file
+DbSessionDep = Annotated[AsyncSession, Depends(use_session)]
+
+
+def use_session_factory() -> async_sessionmaker:
+    return async_session_factory
+
+
+# 요청 세션과 따로, 취소될 수 있는 동시 조회에 쓸 짧은 세션을 여는 데 쓴다.
+DbSessionFactoryDep = Annotated[async_sessionmaker, Depends(use_session_factory)]
\ No newline at end of file
@@ -0,0 +1,47 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    거짓 음성이 없는 집합 소속 검사. "없다"는 답은 확실하고, "있다"는 답은 `error_rate` 확률로 틀릴 수 있다.
+
+    원소를 저장하지 않고 `capacity` 와 `error_rate` 로 정한 크기의 비트 배열만 쓴다.
+
+    >>> bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    >>> bloom.add("a1b2c3")
+    >>> "a1b2c3" in bloom
+    True
+    >>> "d4e5f6" in bloom
+    False
+    >>> len(bloom), bloom.hash_count
+    (1, 7)
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """추가한 횟수. 같은 값을 여러 번 추가하면 여러 번 센다."""
+        return self._count
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(item))
+
+    def add(self, item: str) -> None:
+        for index in self._indexes(item):
+            self._bits[index >> 3] |= 1 << (index & 7)
+        self._count += 1
+
+    def _indexes(self, item: str):
+        # 다이제스트 하나에서 두 해시를 뽑아 k 개의 위치를 만든다 (Kirsch–Mitzenmacher).
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
@@ -0,0 +1,100 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """
+    TTL 만료와 LRU 축출을 함께 하는 프로세스 내 캐시
+
+    만료된 항목은 바로 지우지 않고 LRU 순서에 맡긴다.
+    그래서 장애 상황에서는 `get_stale` 로 오래된 값이라도 꺼내 쓸 수 있다.
+
+    >>> now = [0.0]
+    >>> cache = TTLCache(maxsize=2, ttl=10, timer=lambda: now[0])
+    >>> cache.set("a", 1)
+    >>> cache.set("b", 2)
+    >>> cache.get("a")
+    1
+    >>> cache.set("c", 3)  # 가장 오래 쓰이지 않은 "b" 가 축출됨
+    >>> cache.get("b") is None
+    True
+    >>> now[0] = 11
+    >>> cache.get("a") is None
+    True
+    >>> cache.get_stale("a")
+    1
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key, _MISSING, record=False) is not _MISSING
+
+    def get(self, key: K, default: Any = None, *, record: bool = True) -> V | Any:
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= self.timer():
+            if record:
+                self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        if record:
+            self.hits += 1
+        return entry[1]
+
+    def get_stale(self, key: K, default: Any = None) -> V | Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        return entry[1]
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        expires_at = self.timer() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K, default: Any = None) -> V | Any:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return default
+        return entry[1]
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> int:
+        keys = [key for key in self._data if predicate(key)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+        }
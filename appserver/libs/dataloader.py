@@ -0,0 +1,95 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Iterable, Mapping, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """
+    키로 값을 읽는 요청을 모아 한 번에 읽고, 읽은 값을 기억해 두는 로더
+
+    같은 이벤트 루프 차례(tick)에 요청된 키들은 `batch_load` 한 번으로 읽는다. 한 번 읽은(또는 `prime` 한) 키는 다시 읽지 않는다.
+    `batch_load` 는 키 목록을 받아 {키: 값} 을 돌려주고, 없는 키는 빼면 된다(None 으로 채워진다).
+    `batch_load` 는 별도 태스크에서 돌므로, 같은 세션을 쓰는 로더들은 쿼리를 잠금으로 감싸 겹치지 않게 해야 한다.
+
+    >>> async def batch_load(keys):
+    ...     calls.append(sorted(keys))
+    ...     return {key: key * 10 for key in keys if key != 3}
+    >>> async def main():
+    ...     loader = DataLoader(batch_load)
+    ...     first = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+    ...     second = await loader.load_many([2, 3])
+    ...     return first, second
+    >>> calls = []
+    >>> asyncio.run(main())
+    ([10, 20, 10], [20, None])
+    >>> calls
+    [[1, 2], [3]]
+    """
+
+    def __init__(self, batch_load: Callable[[list[K]], Awaitable[Mapping[K, V]]]):
+        self._batch_load = batch_load
+        self._memo: dict[K, asyncio.Future] = {}
+        self._queue: list[tuple[K, asyncio.Future]] = []
+        self._tasks: set[asyncio.Task] = set()
+        self.batches = 0
+
+    async def load(self, key: K) -> V | None:
+        return await self._future(key)
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        return list(await asyncio.gather(*(self._future(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """이미 가진 값을 기억해 둔다. 이미 읽었거나 읽는 중인 키는 바꾸지 않는다."""
+        if key in self._memo:
+            return
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._memo[key] = future
+
+    def clear(self, key: K | None = None) -> None:
+        if key is None:
+            self._memo.clear()
+        else:
+            self._memo.pop(key, None)
+
+    def _future(self, key: K) -> asyncio.Future:
+        future = self._memo.get(key)
+        # 기다리던 쪽이 취소되면 퓨처도 취소되므로 다시 읽는다.
+        if future is None or future.cancelled():
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._memo[key] = future
+            self._queue.append((key, future))
+            # 이번 차례에 들어오는 키를 모두 모은 뒤에 읽는다.
+            if len(self._queue) == 1:
+                loop.call_soon(self._dispatch)
+        return future
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        task = asyncio.get_running_loop().create_task(self._run(queue))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, queue: list[tuple[K, asyncio.Future]]) -> None:
+        keys = [key for key, _ in queue]
+        self.batches += 1
+        try:
+            values = await self._batch_load(keys)
+        except BaseException as exc:
+            # 실패한 키는 기억하지 않아서 다음에 다시 읽을 수 있게 한다.
+            for key, future in queue:
+                if self._memo.get(key) is future:
+                    del self._memo[key]
+                if not future.done():
+                    future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        for key, future in queue:
+            if not future.done():
+                future.set_result(values.get(key))
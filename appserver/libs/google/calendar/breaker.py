@@ -0,0 +1,139 @@
+import asyncio
+import enum
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class CircuitState(enum.StrEnum):
+    """
+    회로 상태
+    - CLOSED: 정상. 모든 호출을 통과시키며 실패율을 집계한다.
+    - OPEN: 차단. 호출하지 않고 바로 CircuitOpenError 를 낸다.
+    - HALF_OPEN: 시험. 제한된 수의 호출만 통과시켜 복구 여부를 확인한다.
+    """
+    CLOSED = enum.auto()
+    OPEN = enum.auto()
+    HALF_OPEN = enum.auto()
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, retry_after: float):
+        super().__init__(f"circuit is open, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    최근 `window_size` 번 호출의 실패율로 회로를 여닫는 서킷 브레이커
+
+    - 최소 `minimum_calls` 번 이상 호출된 상태에서 실패율이 `failure_rate_threshold` 이상이면 OPEN.
+    - OPEN 후 `open_seconds` 가 지나면 HALF_OPEN 으로 바뀌고 `half_open_max_calls` 개의 시험 호출만 허용.
+    - 시험 호출이 성공하면 CLOSED, 실패하면 다시 OPEN.
+    - 모든 호출은 `call_timeout` 초 안에 끝나야 하며, 넘기면 실패로 집계한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        minimum_calls: int = 5,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        call_timeout: float | None = 3.0,
+        is_failure: Callable[[BaseException], bool] = lambda exc: True,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.call_timeout = call_timeout
+        self.is_failure = is_failure
+        self.timer = timer
+
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and self.timer() - self._opened_at >= self.open_seconds:
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_calls = 0
+        return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        probing = self._acquire()
+        try:
+            if self.call_timeout is None:
+                result = await func()
+            else:
+                result = await asyncio.wait_for(func(), timeout=self.call_timeout)
+        except asyncio.CancelledError:
+            # 호출한 쪽이 취소한 것은 업스트림 상태와 무관하므로 집계하지 않는다.
+            if probing:
+                self._half_open_calls -= 1
+            raise
+        except Exception as exc:
+            if isinstance(exc, TimeoutError) or self.is_failure(exc):
+                self._on_failure()
+            else:
+                self._on_success()
+            raise
+        self._on_success()
+        return result
+
+    def reset(self) -> None:
+        self._outcomes.clear()
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+    def stats(self) -> dict[str, float | str]:
+        return {
+            "state": self.state.value,
+            "failure_rate": self.failure_rate,
+            "calls": len(self._outcomes),
+        }
+
+    def _acquire(self) -> bool:
+        state = self.state
+        if state == CircuitState.OPEN:
+            raise CircuitOpenError(self.open_seconds - (self.timer() - self._opened_at))
+        if state == CircuitState.HALF_OPEN:
+            if self._half_open_calls >= self.half_open_max_calls:
+                raise CircuitOpenError(0.0)
+            self._half_open_calls += 1
+            return True
+        return False
+
+    def _on_success(self) -> None:
+        if self._state == CircuitState.HALF_OPEN:
+            self.reset()
+            return
+        self._outcomes.append(True)
+
+    def _on_failure(self) -> None:
+        if self._state == CircuitState.HALF_OPEN:
+            self._trip()
+            return
+        self._outcomes.append(False)
+        if len(self._outcomes) >= self.minimum_calls and self.failure_rate >= self.failure_rate_threshold:
+            self._trip()
+
+    def _trip(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self.timer()
+        self._half_open_calls = 0
+        self._outcomes.clear()
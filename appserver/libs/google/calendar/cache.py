@@ -0,0 +1,119 @@
+import asyncio
+import os
+from datetime import datetime
+from typing import Awaitable, Callable, Hashable
+
+from appserver.libs.collections.cache import TTLCache
+
+from .schemas import CalendarEvent
+
+
+EventListKey = tuple[str, str, str]
+
+_MISSING = object()
+
+
+class EventListCache:
+    """
+    `event_list` 결과를 (캘린더 ID, 조회 구간) 단위로 캐시
+
+    - TTL 만료 + LRU 축출은 `TTLCache` 에 맡긴다.
+    - 같은 키로 동시에 들어온 미스는 하나의 업스트림 호출을 함께 기다린다(single-flight).
+    - `invalidate` 는 캘린더 단위 세대(generation)를 올려서,
+      무효화 전에 시작된 조회 결과가 뒤늦게 캐시에 저장되지 않게 한다.
+    - watch 채널로 변경 알림을 받는 캘린더는 `watched_ttl` 만큼 오래 캐시한다.
+      알림은 워커 하나에만 오므로, `watch` 에 넘긴 동기화 상태(version)가 바뀌면 그 캘린더를 무효화한다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, watched_ttl: float = 3600.0):
+        self._cache: TTLCache[EventListKey, list[CalendarEvent]] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: dict[EventListKey, asyncio.Task] = {}
+        self._generations: dict[str, int] = {}
+        self._watched: dict[str, Hashable] = {}
+        self.watched_ttl = watched_ttl
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(google_calendar_id: str, time_min: datetime, time_max: datetime) -> EventListKey:
+        return (google_calendar_id, time_min.isoformat(), time_max.isoformat())
+
+    async def get_or_fetch(
+        self,
+        key: EventListKey,
+        fetch: Callable[[], Awaitable[list[CalendarEvent]]],
+    ) -> list[CalendarEvent]:
+        # 진행 중인 조회에 합류하는 요청은 미스가 아니라 `coalesced` 로 센다.
+        task = self._inflight.get(key)
+        cached = self._cache.get(key, _MISSING, record=task is None)
+        if cached is not _MISSING:
+            return cached
+
+        if task is None:
+            generation = self._generations.get(key[0], 0)
+            task = asyncio.create_task(self._load(key, fetch, generation))
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+
+        # 먼저 요청한 쪽이 취소되어도 함께 기다리는 요청들은 결과를 받을 수 있도록 shield 한다.
+        return await asyncio.shield(task)
+
+    async def _load(
+        self,
+        key: EventListKey,
+        fetch: Callable[[], Awaitable[list[CalendarEvent]]],
+        generation: int,
+    ) -> list[CalendarEvent]:
+        google_calendar_id = key[0]
+        try:
+            events = await fetch()
+            if self._generations.get(google_calendar_id, 0) == generation:
+                ttl = self.watched_ttl if google_calendar_id in self._watched else None
+                self._cache.set(key, events, ttl=ttl)
+            return events
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+    def get_stale(self, key: EventListKey) -> list[CalendarEvent] | None:
+        return self._cache.get_stale(key)
+
+    def invalidate(self, google_calendar_id: str) -> int:
+        self._generations[google_calendar_id] = self._generations.get(google_calendar_id, 0) + 1
+        # 무효화 이후의 요청은 이전에 시작된 조회에 합류하지 않고 새로 조회한다.
+        for key in [key for key in self._inflight if key[0] == google_calendar_id]:
+            del self._inflight[key]
+        return self._cache.discard_where(lambda key: key[0] == google_calendar_id)
+
+    def watch(self, google_calendar_id: str, version: Hashable = None) -> None:
+        """
+        변경 알림을 받는 캘린더로 표시한다. `version` 에는 워커들이 함께 보는 동기화 상태(DB 의 sync token)를 넘긴다.
+        기억해 둔 값과 다르면 다른 워커가 받은 알림으로 일정이 바뀐 것이므로 이 캘린더의 캐시를 버린다.
+        """
+        if google_calendar_id in self._watched and self._watched[google_calendar_id] != version:
+            self.invalidate(google_calendar_id)
+        self._watched[google_calendar_id] = version
+
+    def unwatch(self, google_calendar_id: str) -> None:
+        self._watched.pop(google_calendar_id, None)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._generations.clear()
+        self._watched.clear()
+        self.coalesced = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            **self._cache.stats(),
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+            "watched": len(self._watched),
+        }
+
+
+event_list_cache = EventListCache(
+    maxsize=int(os.getenv("GOOGLE_EVENT_CACHE_MAXSIZE", "1024")),
+    ttl=float(os.getenv("GOOGLE_EVENT_CACHE_TTL", "60")),
+    watched_ttl=float(os.getenv("GOOGLE_EVENT_CACHE_WATCHED_TTL", "3600")),
+)
@@ -2,7 +2,12 @@ import os
 from typing import Annotated
 from fastapi import Depends
 
-from .services import GoogleCalendarService
+from .services import GOOGLE_SERVICE_ACCOUNT_CREDENTIAL_PATH, GoogleCalendarService
+from .transport import get_shared_transport
+
+
+# httplib2(기본) 또는 httpx. httpx 는 스레드 없이 연결 풀을 공유하는 비동기 전송을 쓴다.
+GOOGLE_CALENDAR_TRANSPORT = os.getenv("GOOGLE_CALENDAR_TRANSPORT", "httplib2")
 
 
 def get_google_calendar_service(google_calendar_id: str | None = None) -> GoogleCalendarService | None:
@@ -10,6 +15,10 @@ def get_google_calendar_service(google_calendar_id: str | None = None) -> Google
     if google_calendar_id is None:
         return None
 
+    if GOOGLE_CALENDAR_TRANSPORT == "httpx":
+        transport, request_builder = get_shared_transport(GOOGLE_SERVICE_ACCOUNT_CREDENTIAL_PATH)
+        return GoogleCalendarService(google_calendar_id, service=request_builder, transport=transport)
+
     return GoogleCalendarService(google_calendar_id)
 
 
@@ -0,0 +1,666 @@
+"""
+테스트·벤치마크용 Google Calendar v3 가짜 서버
+
+GoogleCalendarService 가 쓰는 엔드포인트(events insert/list/get/update/delete, batch, freeBusy)를
+프로세스 안에서 흉내낸다. 자격 증명이나 네트워크 없이 서비스 코드를 그대로 실행할 수 있다.
+
+- `FakeGoogleCalendarBackend`: 상태(캘린더별 이벤트)와 요청 처리. 지연·오류 주입·요청률 제한 설정.
+- `FakeHttp`: httplib2.Http 대신 googleapiclient 에 넘기는 인프로세스 어댑터.
+- `FakeGoogleCalendarServer`: 실제 소켓이 필요한 경우(연결 풀링 벤치마크 등)를 위한 localhost HTTP 서버.
+- `build_fake_service`: 위 둘 중 하나를 쓰는 googleapiclient Resource 생성.
+- watch 채널이 등록된 캘린더가 바뀌면 Google 이 보냈을 알림을 `pop_notifications` 로 꺼낼 수 있다(로컬 알림 발송자).
+
+>>> backend = FakeGoogleCalendarBackend()
+>>> service = GoogleCalendarService("host@example.com", service=build_fake_service(backend), event_cache=None, breaker=None)
+"""
+import asyncio
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from email.parser import FeedParser
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Mapping
+from urllib.parse import parse_qs, unquote, urlsplit
+from zoneinfo import ZoneInfo
+
+import httplib2
+import httpx
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
+
+from .services import FREEBUSY_MAX_CALENDARS, GoogleCalendarService  # noqa: F401 (doctest 용)
+
+
+GOOGLE_ROOT_URL = "https://www.googleapis.com/"
+SERVICE_PATH = "/calendar/v3"
+BATCH_PATH = "/batch/calendar/v3"
+MAX_PAGE_SIZE = 2500
+DEFAULT_PAGE_SIZE = 250
+DEFAULT_CHANNEL_TTL = 604800
+
+
+@dataclass
+class FakeNotification:
+    """Google 이 watch 채널 주소로 보내는 알림 요청. 본문은 없고 헤더만 있다."""
+    address: str
+    headers: dict[str, str]
+
+
+@dataclass
+class FakeResponse:
+    status: int
+    body: bytes = b""
+    headers: dict[str, str] = field(default_factory=lambda: {"content-type": "application/json; charset=UTF-8"})
+
+
+class FakeGoogleCalendarBackend:
+    """
+    가짜 Google Calendar 의 상태와 요청 처리
+
+    - `latency`: 요청마다 어댑터가 기다릴 시간(초). 배치는 배치 전체에 한 번.
+    - `error_rate`: 요청이 `error_status` 로 실패할 확률. `fail_next` 로 정확한 횟수도 지정 가능.
+    - `rate_limit`, `burst`: 초당 요청 수 토큰 버킷. 넘치면 429 rateLimitExceeded.
+    - `strict_calendars`: True 면 등록되지 않은 캘린더에 대한 요청은 404.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        rate_limit: float | None = None,
+        burst: int = 10,
+        strict_calendars: bool = False,
+        seed: int | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.strict_calendars = strict_calendars
+        self.timer = timer
+
+        self.calendars: dict[str, dict[str, dict]] = {}
+        self.channels: dict[str, dict] = {}
+        self.notifications: list[FakeNotification] = []
+        self.request_counts: Counter[str] = Counter()
+        self._event_seq: dict[tuple[str, str], int] = {}
+        self._seq = 0
+        self._sync_epoch = 0
+        self._forced_failures: list[int] = []
+        self._random = random.Random(seed)
+        self._tokens = float(burst)
+        self._refilled_at = timer()
+        self._lock = threading.RLock()
+
+    # 테스트에서 상태를 조작하는 API
+
+    def add_calendar(self, calendar_id: str) -> None:
+        with self._lock:
+            self.calendars.setdefault(calendar_id, {})
+
+    def fail_next(self, count: int = 1, status: int = 503) -> None:
+        with self._lock:
+            self._forced_failures.extend([status] * count)
+
+    def expire_sync_tokens(self) -> None:
+        """지금까지 발급한 syncToken 을 모두 만료시킨다. 이후 해당 토큰으로 조회하면 410."""
+        with self._lock:
+            self._sync_epoch += 1
+
+    def pop_notifications(self) -> list[FakeNotification]:
+        with self._lock:
+            notifications, self.notifications = self.notifications, []
+            return notifications
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calendars.clear()
+            self.channels.clear()
+            self.notifications.clear()
+            self.request_counts.clear()
+            self._event_seq.clear()
+            self._forced_failures.clear()
+            self._seq = 0
+            self._sync_epoch += 1
+            self._tokens = float(self.burst)
+
+    # 요청 처리
+
+    def dispatch(
+        self,
+        method: str,
+        target: str,
+        body: bytes | str | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> FakeResponse:
+        """HTTP 요청 한 건(배치 포함)을 처리해 응답을 돌려준다. 지연은 어댑터가 담당한다."""
+        url = urlsplit(target)
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+
+        if url.path == BATCH_PATH:
+            content_type = {key.lower(): value for key, value in (headers or {}).items()}.get("content-type", "")
+            return self._dispatch_batch(body or "", content_type)
+
+        status, payload = self.handle(method.upper(), url.path, parse_qs(url.query), body)
+        if payload is None:
+            return FakeResponse(status=status)
+        return FakeResponse(status=status, body=json.dumps(payload).encode("utf-8"))
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        query: Mapping[str, list[str]],
+        body: str | None,
+    ) -> tuple[int, dict | None]:
+        with self._lock:
+            if not path.startswith(SERVICE_PATH):
+                return _error(404, "notFound", f"Unknown path {path}")
+            parts = [unquote(part) for part in path[len(SERVICE_PATH):].strip("/").split("/")]
+            params = {key: values[-1] for key, values in query.items()}
+            data = json.loads(body) if body else {}
+
+            route = self._route(method, parts)
+            if route is None:
+                return _error(404, "notFound", f"Unknown route {method} {path}")
+            name, handler, args = route
+            self.request_counts[name] += 1
+
+            if failure := self._injected_failure():
+                return failure
+
+            status, payload = handler(*args, params, data)
+            if payload is not None and params.get("fields"):
+                payload = _apply_fields(payload, params["fields"])
+            return status, payload
+
+    def _route(self, method: str, parts: list[str]):
+        match method, parts:
+            case "POST", ["calendars", calendar_id, "events"]:
+                return "events.insert", self._insert_event, (calendar_id,)
+            case "GET", ["calendars", calendar_id, "events"]:
+                return "events.list", self._list_events, (calendar_id,)
+            case "GET", ["calendars", calendar_id, "events", event_id]:
+                return "events.get", self._get_event, (calendar_id, event_id)
+            case "PUT", ["calendars", calendar_id, "events", event_id]:
+                return "events.update", self._update_event, (calendar_id, event_id)
+            case "DELETE", ["calendars", calendar_id, "events", event_id]:
+                return "events.delete", self._delete_event, (calendar_id, event_id)
+            case "POST", ["calendars", calendar_id, "events", "watch"]:
+                return "events.watch", self._watch, (calendar_id,)
+            case "POST", ["channels", "stop"]:
+                return "channels.stop", self._stop_channel, ()
+            case "POST", ["freeBusy"]:
+                return "freebusy.query", self._freebusy, ()
+        return None
+
+    def _injected_failure(self) -> tuple[int, dict] | None:
+        if self._forced_failures:
+            return _error(self._forced_failures.pop(0), "backendError", "Injected failure")
+
+        if self.rate_limit is not None:
+            now = self.timer()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._refilled_at) * self.rate_limit)
+            self._refilled_at = now
+            if self._tokens < 1:
+                return _error(429, "rateLimitExceeded", "Rate Limit Exceeded")
+            self._tokens -= 1
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            return _error(self.error_status, "backendError", "Injected failure")
+        return None
+
+    def _calendar(self, calendar_id: str) -> dict[str, dict] | None:
+        if calendar_id not in self.calendars and self.strict_calendars:
+            return None
+        return self.calendars.setdefault(calendar_id, {})
+
+    def _touch(self, calendar_id: str, event: dict) -> None:
+        self._seq += 1
+        self._event_seq[(calendar_id, event["id"])] = self._seq
+        event["updated"] = _now_iso()
+        event["etag"] = f'"{self._seq}"'
+        for channel_id, channel in self.channels.items():
+            if channel["calendar_id"] == calendar_id and channel["expiration"] > time.time() * 1000:
+                self._notify(channel_id, "exists")
+
+    def _notify(self, channel_id: str, state: str) -> None:
+        channel = self.channels[channel_id]
+        channel["message_number"] += 1
+        headers = {
+            "X-Goog-Channel-ID": channel_id,
+            "X-Goog-Message-Number": str(channel["message_number"]),
+            "X-Goog-Resource-ID": channel["resourceId"],
+            "X-Goog-Resource-State": state,
+            "X-Goog-Resource-URI": channel["resourceUri"],
+            "X-Goog-Channel-Expiration": str(channel["expiration"]),
+        }
+        if channel.get("token"):
+            headers["X-Goog-Channel-Token"] = channel["token"]
+        self.notifications.append(FakeNotification(address=channel["address"], headers=headers))
+
+    def _watch(self, calendar_id: str, params: dict, data: dict) -> tuple[int, dict]:
+        if self._calendar(calendar_id) is None:
+            return _error(404, "notFound", "Not Found")
+        if data.get("type") != "web_hook" or not data.get("address"):
+            return _error(400, "invalid", "Invalid channel type or address")
+        if data.get("id") in self.channels:
+            return _error(400, "channelIdNotUnique", "Channel id not unique")
+
+        ttl = int((data.get("params") or {}).get("ttl", DEFAULT_CHANNEL_TTL))
+        channel = {
+            "kind": "api#channel",
+            "id": data["id"],
+            "resourceId": uuid.uuid5(uuid.NAMESPACE_URL, calendar_id).hex,
+            "resourceUri": f"https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events",
+            "token": data.get("token"),
+            "expiration": str(int((time.time() + ttl) * 1000)),
+        }
+        self.channels[data["id"]] = {
+            **channel,
+            "expiration": int(channel["expiration"]),
+            "calendar_id": calendar_id,
+            "address": data["address"],
+            "message_number": 0,
+        }
+        # 실제 Google 처럼 등록 직후 "sync" 알림을 한 번 보낸다.
+        self._notify(data["id"], "sync")
+        return 200, {key: value for key, value in channel.items() if value is not None}
+
+    def _stop_channel(self, params: dict, data: dict) -> tuple[int, dict | None]:
+        channel = self.channels.get(data.get("id"))
+        if channel is None or channel["resourceId"] != data.get("resourceId"):
+            return _error(404, "notFound", "Channel not found")
+        del self.channels[data["id"]]
+        return 204, None
+
+    def _insert_event(self, calendar_id: str, params: dict, data: dict) -> tuple[int, dict]:
+        events = self._calendar(calendar_id)
+        if events is None:
+            return _error(404, "notFound", "Not Found")
+        if "start" not in data or "end" not in data:
+            return _error(400, "required", "Missing time range")
+
+        event_id = data.get("id") or uuid.uuid4().hex
+        event = {
+            **data,
+            "kind": "calendar#event",
+            "id": event_id,
+            "status": "confirmed",
+            "htmlLink": f"https://www.google.com/calendar/event?eid={event_id}",
+            "created": _now_iso(),
+            "iCalUID": f"{event_id}@google.com",
+            "sequence": 0,
+            "organizer": {"email": calendar_id, "self": True},
+            "creator": {"email": calendar_id},
+        }
+        events[event_id] = event
+        self._touch(calendar_id, event)
+        return 200, event
+
+    def _get_event(self, calendar_id: str, event_id: str, params: dict, data: dict) -> tuple[int, dict]:
+        event = (self._calendar(calendar_id) or {}).get(event_id)
+        if event is None:
+            return _error(404, "notFound", "Not Found")
+        return 200, event
+
+    def _update_event(self, calendar_id: str, event_id: str, params: dict, data: dict) -> tuple[int, dict]:
+        events = self._calendar(calendar_id) or {}
+        event = events.get(event_id)
+        if event is None:
+            return _error(404, "notFound", "Not Found")
+
+        keep = {key: event[key] for key in ("kind", "id", "htmlLink", "created", "iCalUID", "organizer", "creator")}
+        updated = {**data, **keep, "status": data.get("status", "confirmed"), "sequence": event["sequence"] + 1}
+        events[event_id] = updated
+        self._touch(calendar_id, updated)
+        return 200, updated
+
+    def _delete_event(self, calendar_id: str, event_id: str, params: dict, data: dict) -> tuple[int, None]:
+        event = (self._calendar(calendar_id) or {}).get(event_id)
+        if event is None or event["status"] == "cancelled":
+            return _error(410 if event else 404, "deleted" if event else "notFound", "Resource has been deleted")
+        # 실제 API 처럼 삭제된 이벤트는 status=cancelled 로 남아 get 으로 조회할 수 있다.
+        event["status"] = "cancelled"
+        self._touch(calendar_id, event)
+        return 204, None
+
+    def _list_events(self, calendar_id: str, params: dict, data: dict) -> tuple[int, dict]:
+        events = self._calendar(calendar_id)
+        if events is None:
+            return _error(404, "notFound", "Not Found")
+
+        sync_token = params.get("syncToken")
+        if sync_token:
+            if any(key in params for key in ("timeMin", "timeMax", "orderBy")):
+                return _error(400, "invalid", "syncToken cannot be combined with timeMin, timeMax or orderBy")
+            since = _parse_sync_token(sync_token, self._sync_epoch)
+            if since is None:
+                return _error(410, "fullSyncRequired", "Sync token is no longer valid, a full sync is required.")
+            items = [
+                event for event_id, event in events.items()
+                if self._event_seq[(calendar_id, event_id)] > since
+            ]
+        else:
+            show_deleted = params.get("showDeleted") == "true"
+            time_min = _parse_datetime(params["timeMin"]) if "timeMin" in params else None
+            time_max = _parse_datetime(params["timeMax"]) if "timeMax" in params else None
+            items = [
+                event for event in events.values()
+                if (show_deleted or event["status"] != "cancelled")
+                and (time_min is None or _event_end(event) > time_min)
+                and (time_max is None or _event_start(event) < time_max)
+            ]
+            if params.get("orderBy") == "startTime":
+                items.sort(key=_event_start)
+            else:
+                items.sort(key=lambda event: event["updated"])
+
+        page_size = min(int(params.get("maxResults", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        offset = _parse_page_token(params.get("pageToken"))
+        if offset is None:
+            return _error(400, "invalid", "Invalid page token")
+
+        page = items[offset:offset + page_size]
+        result = {
+            "kind": "calendar#events",
+            "summary": calendar_id,
+            "updated": _now_iso(),
+            "items": page,
+        }
+        if offset + page_size < len(items):
+            result["nextPageToken"] = f"page-{offset + page_size}"
+        else:
+            result["nextSyncToken"] = f"sync-{self._sync_epoch}-{self._seq}"
+        return 200, result
+
+    def _freebusy(self, params: dict, data: dict) -> tuple[int, dict]:
+        items = data.get("items", [])
+        if len(items) > FREEBUSY_MAX_CALENDARS:
+            return _error(400, "tooManyCalendarsRequestedForTimeRange", "Too many calendars requested")
+
+        time_min = _parse_datetime(data["timeMin"])
+        time_max = _parse_datetime(data["timeMax"])
+        calendars = {}
+        for item in items:
+            events = self._calendar(item["id"])
+            if events is None:
+                calendars[item["id"]] = {"errors": [{"domain": "global", "reason": "notFound"}], "busy": []}
+                continue
+            busy = [
+                (max(_event_start(event), time_min), min(_event_end(event), time_max))
+                for event in events.values()
+                if event["status"] != "cancelled"
+                and event.get("transparency") != "transparent"
+                and _event_end(event) > time_min
+                and _event_start(event) < time_max
+            ]
+            calendars[item["id"]] = {
+                "busy": [{"start": _to_iso(start), "end": _to_iso(end)} for start, end in sorted(busy)],
+            }
+        return 200, {
+            "kind": "calendar#freeBusy",
+            "timeMin": data["timeMin"],
+            "timeMax": data["timeMax"],
+            "calendars": calendars,
+        }
+
+    def _dispatch_batch(self, body: str, content_type: str) -> FakeResponse:
+        parser = FeedParser()
+        parser.feed(f"content-type: {content_type}\r\n\r\n{body}")
+        message = parser.close()
+        if not message.is_multipart():
+            return FakeResponse(status=400, body=b"Invalid batch request")
+        self.request_counts["batch"] += 1
+
+        boundary = f"batch_{uuid.uuid4().hex}"
+        chunks = []
+        for part in message.get_payload():
+            request_line, raw = part.get_payload().split("\n", 1)
+            method, target, _ = request_line.split(" ", 2)
+            sub_parser = FeedParser()
+            sub_parser.feed(raw)
+            sub_body = sub_parser.close().get_payload() or None
+
+            url = urlsplit(target)
+            status, payload = self.handle(method, url.path, parse_qs(url.query), sub_body)
+
+            # googleapiclient 는 부분 응답의 헤더와 본문을 CRLF 빈 줄로 구분한다.
+            content = "" if payload is None else json.dumps(payload)
+            chunks.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{part['Content-ID'][1:]}\r\n\r\n"
+                f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n"
+                f"Content-Length: {len(content.encode('utf-8'))}\r\n\r\n"
+                f"{content}\r\n"
+            )
+        chunks.append(f"--{boundary}--\r\n")
+        return FakeResponse(
+            status=200,
+            body="".join(chunks).encode("utf-8"),
+            headers={"content-type": f"multipart/mixed; boundary={boundary}"},
+        )
+
+
+class FakeHttp:
+    """googleapiclient 가 httplib2.Http 처럼 쓰는 인프로세스 어댑터"""
+
+    def __init__(self, backend: FakeGoogleCalendarBackend):
+        self.backend = backend
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=None, connection_type=None):
+        if self.backend.latency:
+            time.sleep(self.backend.latency)
+        response = self.backend.dispatch(method, uri, body, headers)
+        return httplib2.Response({"status": response.status, **response.headers}), response.body
+
+
+def fake_httpx_transport(backend: FakeGoogleCalendarBackend) -> httpx.MockTransport:
+    """AsyncGoogleTransport 의 httpx.AsyncClient 에 꽂는 인프로세스 어댑터. 지연은 이벤트 루프를 막지 않는다."""
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        if backend.latency:
+            await asyncio.sleep(backend.latency)
+        response = backend.dispatch(request.method, str(request.url), await request.aread(), dict(request.headers))
+        return httpx.Response(response.status, headers=response.headers, content=response.body)
+
+    return httpx.MockTransport(_handler)
+
+
+class _FakeRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    backend: FakeGoogleCalendarBackend
+
+    def _handle(self):
+        length = int(self.headers.get("content-length") or 0)
+        body = self.rfile.read(length) if length else None
+        if self.backend.latency:
+            time.sleep(self.backend.latency)
+
+        response = self.backend.dispatch(self.command, self.path, body, dict(self.headers))
+        self.send_response(response.status)
+        for key, value in response.headers.items():
+            self.send_header(key, value)
+        self.send_header("content-length", str(len(response.body)))
+        self.end_headers()
+        self.wfile.write(response.body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # 기본값(5)이면 동시 연결이 몰릴 때 SYN 재전송으로 1초씩 지연된다.
+    request_queue_size = 1024
+
+
+class FakeGoogleCalendarServer:
+    """
+    localhost 에서 실제 HTTP(keep-alive)로 응답하는 가짜 서버
+
+    >>> with FakeGoogleCalendarServer(FakeGoogleCalendarBackend()) as server:
+    ...     server.root_url.startswith("http://127.0.0.1:")
+    True
+    """
+
+    def __init__(self, backend: FakeGoogleCalendarBackend, host: str = "127.0.0.1", port: int = 0):
+        self.backend = backend
+        handler = type("FakeRequestHandler", (_FakeRequestHandler,), {"backend": backend})
+        self.httpd = _FakeHTTPServer((host, port), handler)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def root_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "FakeGoogleCalendarServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeGoogleCalendarServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def build_fake_service(
+    backend: FakeGoogleCalendarBackend | None = None,
+    *,
+    root_url: str | None = None,
+    http: Any = None,
+) -> Any:
+    """
+    가짜 백엔드를 바라보는 googleapiclient Calendar v3 Resource 를 만든다.
+    `root_url` 을 주면 그 주소(FakeGoogleCalendarServer.root_url)로 실제 HTTP 요청을 보낸다.
+    """
+    document = json.loads(discovery_cache.get_static_doc("calendar", "v3"))
+    if root_url is not None:
+        document["rootUrl"] = root_url
+        document["baseUrl"] = root_url + document["servicePath"]
+        http = http or httplib2.Http()
+    else:
+        http = http or FakeHttp(backend or FakeGoogleCalendarBackend())
+    return build_from_document(document, http=http)
+
+
+def _error(status: int, reason: str, message: str) -> tuple[int, dict]:
+    return status, {
+        "error": {
+            "code": status,
+            "message": message,
+            "errors": [{"domain": "global", "reason": reason, "message": message}],
+        }
+    }
+
+
+def _apply_fields(payload: Any, fields: str) -> Any:
+    """partial response 의 `fields` 중 `a,b(c,d)` 형태를 지원한다."""
+    selection = _parse_fields(fields)
+    return _select(payload, selection)
+
+
+def _parse_fields(fields: str) -> dict[str, dict | None]:
+    selection: dict[str, dict | None] = {}
+    depth, start = 0, 0
+    for index, char in enumerate(fields + ","):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            token = fields[start:index].strip()
+            start = index + 1
+            if not token:
+                continue
+            if "(" in token:
+                name, inner = token.split("(", 1)
+                selection[name] = _parse_fields(inner[:-1])
+            else:
+                selection[token] = None
+    return selection
+
+
+def _select(payload: Any, selection: dict[str, dict | None]) -> Any:
+    if isinstance(payload, list):
+        return [_select(item, selection) for item in payload]
+    if not isinstance(payload, dict):
+        return payload
+    return {
+        key: payload[key] if sub is None else _select(payload[key], sub)
+        for key, sub in selection.items()
+        if key in payload
+    }
+
+
+def _parse_sync_token(token: str, epoch: int) -> int | None:
+    prefix, _, rest = token.partition("-")
+    token_epoch, _, seq = rest.partition("-")
+    if prefix != "sync" or token_epoch != str(epoch) or not seq.isdigit():
+        return None
+    return int(seq)
+
+
+def _parse_page_token(token: str | None) -> int | None:
+    if not token:
+        return 0
+    prefix, _, offset = token.partition("-")
+    if prefix != "page" or not offset.isdigit():
+        return None
+    return int(offset)
+
+
+def _parse_datetime(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _event_time(value: dict) -> datetime:
+    if "date" in value:
+        return datetime.combine(date.fromisoformat(value["date"]), datetime.min.time(), tzinfo=timezone.utc)
+    parsed = datetime.fromisoformat(value["dateTime"])
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=ZoneInfo(value.get("timeZone") or "UTC"))
+    return parsed
+
+
+def _event_start(event: dict) -> datetime:
+    return _event_time(event["start"])
+
+
+def _event_end(event: dict) -> datetime:
+    return _event_time(event["end"])
+
+
+def _to_iso(value: datetime) -> str:
+    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _now_iso() -> str:
+    return _to_iso(datetime.now(timezone.utc))
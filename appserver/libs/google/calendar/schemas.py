@@ -1,6 +1,7 @@
+from datetime import datetime
 from sqlmodel import SQLModel
 
-from typing import Literal, Optional, Sequence, TypedDict
+from typing import Literal, NamedTuple, Optional, Sequence, TypedDict
 
 
 class ReminderItem(SQLModel):
@@ -89,3 +90,8 @@ class CalendarEvent(SQLModel):
     status: Literal["confirmed", "tentative", "cancelled"]
     summary: str
     updated: str  # ISO 8601
+
+
+class BusyInterval(NamedTuple):
+    start: datetime
+    end: datetime
@@ -1,13 +1,24 @@
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Literal, Optional
+from typing import Any, AsyncIterator, Callable, Literal, Optional, Sequence
+import asyncio
 import os
+import threading
 
+import httplib2
+import httpx
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
-from .schemas import CalendarEvent, Reminder
+from .breaker import CircuitBreaker, CircuitOpenError
+from .cache import EventListCache, event_list_cache
+from .transport import AsyncGoogleTransport
+from appserver.libs.collections.sort import deduplicate_and_sort
+
+from .schemas import BusyInterval, CalendarEvent, Reminder
 
 
 BASE_DIR = Path(__file__).parent.parent.parent.parent.parent
@@ -19,16 +30,87 @@ GOOGLE_SERVICE_ACCOUNT_CREDENTIAL_PATH = Path(
     )
 )
 
+# GoogleCalendarEventOut 이 실제로 쓰는 필드만 받도록 하는 partial response 지정
+EVENT_OUT_FIELDS = "nextPageToken,items(id,start,end)"
+EVENT_LIST_PAGE_SIZE = 250
+# freebusy.query 한 번으로 조회할 수 있는 최대 캘린더 수 (API 제한)
+FREEBUSY_MAX_CALENDARS = 50
+# batch 요청 하나에 담을 수 있는 최대 요청 수 (Calendar API 제한)
+BATCH_MAX_REQUESTS = 50
+# Google 호출 한 번의 제한 시간(초). 서킷 브레이커와 스레드별 Http 의 소켓 타임아웃에 함께 쓴다.
+GOOGLE_CALENDAR_TIMEOUT = float(os.getenv("GOOGLE_CALENDAR_TIMEOUT", "3"))
+
+
+class GoogleCalendarUnavailableError(Exception):
+    """Google Calendar 가 실패·지연 중이거나 회로가 열려 있어 결과를 받지 못한 경우"""
+
+
+class SyncTokenExpiredError(Exception):
+    """sync token 이 만료되어(HTTP 410) 처음부터 다시 동기화해야 하는 경우"""
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    # 404 같은 4xx 는 요청 자체의 문제이므로 Google 장애로 집계하지 않는다.
+    if isinstance(exc, HttpError):
+        return exc.resp.status >= 500 or exc.resp.status == 429
+    return True
+
+
+def merge_busy_intervals(busy: Sequence[dict]) -> list[BusyInterval]:
+    intervals = sorted(
+        BusyInterval(datetime.fromisoformat(item["start"]), datetime.fromisoformat(item["end"]))
+        for item in busy
+    )
+    merged: list[BusyInterval] = []
+    for interval in intervals:
+        if merged and interval.start <= merged[-1].end:
+            merged[-1] = BusyInterval(merged[-1].start, max(merged[-1].end, interval.end))
+        else:
+            merged.append(interval)
+    return merged
+
+
+def build_thread_http() -> httplib2.Http:
+    """
+    스레드별 요청에 쓸 Http. `build()` 와 같은 `build_http()` 설정에 소켓 타임아웃만 GOOGLE_CALENDAR_TIMEOUT 으로 맞춘다.
+    브레이커의 타임아웃은 기다림만 멈추고 스레드는 멈추지 못하므로, 멈춘 연결은 소켓에서 끊어야 스레드가 풀려난다.
+    """
+    http = build_http()
+    http.timeout = GOOGLE_CALENDAR_TIMEOUT
+    return http
+
+
+google_calendar_breaker = CircuitBreaker(
+    failure_rate_threshold=float(os.getenv("GOOGLE_CALENDAR_BREAKER_FAILURE_RATE", "0.5")),
+    open_seconds=float(os.getenv("GOOGLE_CALENDAR_BREAKER_OPEN_SECONDS", "30")),
+    call_timeout=GOOGLE_CALENDAR_TIMEOUT,
+    is_failure=is_upstream_failure,
+)
+
 
 class GoogleCalendarService:
     def __init__(
         self,
         default_google_calendar_id: str,
         credentials_path: Optional[Path] = GOOGLE_SERVICE_ACCOUNT_CREDENTIAL_PATH,
+        event_cache: Optional[EventListCache] = event_list_cache,
+        service: Any = None,
+        breaker: Optional[CircuitBreaker] = google_calendar_breaker,
+        transport: Optional[AsyncGoogleTransport] = None,
+        http_factory: Optional[Callable[[], Any]] = None,
     ):
+        """
+        `transport` 를 주면 요청을 스레드 없이 httpx 연결 풀로 보내고, `service` 는 요청 객체를 만드는 데만 쓴다.
+        없으면 googleapiclient 의 httplib2 전송을 스레드에서 실행하며, `http_factory` 로 스레드별 Http 를 만든다.
+        """
         self.credentials_path = credentials_path
         self.default_google_calendar_id = default_google_calendar_id
-        self.service = self._get_authenticated_service(credentials_path)
+        self.event_cache = event_cache
+        self.breaker = breaker
+        self.transport = transport
+        self._http_factory = http_factory
+        self._local = threading.local()
+        self.service = service or self._get_authenticated_service(credentials_path)
 
     def _get_authenticated_service(self, credentials_path: Path) -> Any:
         credentials = service_account.Credentials.from_service_account_file(
@@ -38,8 +120,47 @@ class GoogleCalendarService:
                 "https://www.googleapis.com/auth/calendar.events",
             ],
         )
+        # httplib2.Http 는 스레드 안전하지 않으므로, 스레드에서 동시에 실행되는 요청은 스레드마다 따로 만든 Http 를 쓴다.
+        if self._http_factory is None:
+            self._http_factory = lambda: AuthorizedHttp(credentials, http=build_thread_http())
         return build("calendar", "v3", credentials=credentials)
 
+    def _thread_http(self) -> Any:
+        if self._http_factory is None:
+            return None
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = self._http_factory()
+        return http
+
+    def invalidate_events(self, google_calendar_id: str) -> None:
+        if self.event_cache is not None:
+            self.event_cache.invalidate(google_calendar_id)
+
+    async def _execute(self, request: Any) -> Any:
+        # googleapiclient 호출은 블로킹이므로 이벤트 루프 밖에서 실행하고, 서킷 브레이커로 감싼다.
+        def _run() -> Any:
+            http = self._thread_http()
+            if http is None:
+                return request.execute()
+            return request.execute(http=http)
+
+        def _call() -> Any:
+            if self.transport is not None:
+                return self.transport.execute(request)
+            return asyncio.to_thread(_run)
+
+        try:
+            if self.breaker is None:
+                return await _call()
+            return await self.breaker.call(_call)
+        except HttpError as exc:
+            if is_upstream_failure(exc):
+                raise GoogleCalendarUnavailableError(str(exc)) from exc
+            raise
+        except (CircuitOpenError, TimeoutError, OSError, httplib2.HttpLib2Error, httpx.TransportError) as exc:
+            raise GoogleCalendarUnavailableError(str(exc)) from exc
+
     def make_event_body(
         self,
         start_datetime: datetime,
@@ -106,23 +227,62 @@ class GoogleCalendarService:
 
         calendar_id = google_calendar_id or self.default_google_calendar_id
         try:
-            event = (
-                self.service.events()
-                .insert(
+            event = await self._execute(
+                self.service.events().insert(
                     calendarId=calendar_id,
                     body=event,
                     conferenceDataVersion=1,
                 )
-                .execute()
             )
-        except HttpError as e:
+        except (HttpError, GoogleCalendarUnavailableError) as e:
             print("create_calendar_event error", e)
             return None
 
+        self.invalidate_events(calendar_id)
         if event.get("htmlLink"):
             return event
         return None
 
+    async def create_events_batch(
+        self,
+        events: Sequence[tuple[Optional[str], dict]],
+    ) -> list[CalendarEvent | None]:
+        """
+        `(google_calendar_id, make_event_body 결과)` 목록을 batch 요청 하나로 생성한다.
+        결과는 입력과 같은 순서이며, 실패한 항목은 None 이다. 한 번에 BATCH_MAX_REQUESTS 개까지.
+        """
+        if len(events) > BATCH_MAX_REQUESTS:
+            raise ValueError(f"batch 요청은 최대 {BATCH_MAX_REQUESTS}개까지 담을 수 있습니다.")
+
+        results: list[CalendarEvent | None] = [None] * len(events)
+
+        def _callback(request_id: str, response: dict, exception: Exception | None) -> None:
+            if exception is not None:
+                print("create_events_batch error", request_id, exception)
+                return
+            if response.get("htmlLink"):
+                results[int(request_id)] = response
+
+        batch = self.service.new_batch_http_request(callback=_callback)
+        calendar_ids = set()
+        for index, (google_calendar_id, body) in enumerate(events):
+            calendar_id = google_calendar_id or self.default_google_calendar_id
+            calendar_ids.add(calendar_id)
+            batch.add(
+                self.service.events().insert(calendarId=calendar_id, body=body, conferenceDataVersion=1),
+                request_id=str(index),
+            )
+
+        try:
+            await self._execute(batch)
+        except (HttpError, GoogleCalendarUnavailableError) as e:
+            print("create_events_batch error", e)
+            return results
+
+        for calendar_id in calendar_ids:
+            self.invalidate_events(calendar_id)
+        return results
+
     async def event_list(
         self,
         time_min: datetime,
@@ -131,18 +291,90 @@ class GoogleCalendarService:
     ) -> list[CalendarEvent]:
         google_calendar_id = google_calendar_id or self.default_google_calendar_id
 
-        events_result = (
-            self.service.events()
-            .list(
+        async def _fetch() -> list[CalendarEvent]:
+            return await self._fetch_event_list(time_min, time_max, google_calendar_id)
+
+        if self.event_cache is None:
+            return await _fetch()
+
+        key = EventListCache.make_key(google_calendar_id, time_min, time_max)
+        return await self.event_cache.get_or_fetch(key, _fetch)
+
+    def cached_event_list(
+        self,
+        time_min: datetime,
+        time_max: datetime,
+        google_calendar_id: Optional[str] = None,
+    ) -> list[CalendarEvent] | None:
+        """업스트림을 호출하지 않고, TTL 이 지났더라도 캐시에 남아 있는 결과를 돌려준다."""
+        if self.event_cache is None:
+            return None
+        google_calendar_id = google_calendar_id or self.default_google_calendar_id
+        key = EventListCache.make_key(google_calendar_id, time_min, time_max)
+        return self.event_cache.get_stale(key)
+
+    async def _fetch_event_list(
+        self,
+        time_min: datetime,
+        time_max: datetime,
+        google_calendar_id: str,
+    ) -> list[CalendarEvent]:
+        events = []
+        async for page in self._iter_event_pages(time_min, time_max, google_calendar_id):
+            events.extend(page)
+        return events
+
+    async def iter_events(
+        self,
+        time_min: datetime,
+        time_max: datetime,
+        google_calendar_id: Optional[str] = None,
+        *,
+        page_size: int = EVENT_LIST_PAGE_SIZE,
+        fields: Optional[str] = EVENT_OUT_FIELDS,
+    ) -> AsyncIterator[CalendarEvent]:
+        """
+        nextPageToken 을 따라가며 페이지가 도착하는 대로 이벤트를 하나씩 내보낸다.
+        기본값으로 id/start/end 만 받으므로 GoogleCalendarEventOut 변환 용도로만 쓴다.
+        """
+        google_calendar_id = google_calendar_id or self.default_google_calendar_id
+        async for page in self._iter_event_pages(
+            time_min,
+            time_max,
+            google_calendar_id,
+            page_size=page_size,
+            fields=fields,
+        ):
+            for event in page:
+                yield event
+
+    async def _iter_event_pages(
+        self,
+        time_min: datetime,
+        time_max: datetime,
+        google_calendar_id: str,
+        *,
+        page_size: int = EVENT_LIST_PAGE_SIZE,
+        fields: Optional[str] = None,
+    ) -> AsyncIterator[list[CalendarEvent]]:
+        page_token = None
+        while True:
+            request = self.service.events().list(
                 calendarId=google_calendar_id,
                 timeMin=time_min.isoformat(),
                 timeMax=time_max.isoformat(),
                 singleEvents=True,
                 orderBy="startTime",
+                maxResults=page_size,
+                pageToken=page_token,
+                fields=fields,
             )
-            .execute()
-        )
-        return events_result.get("items", [])
+            events_result = await self._execute(request)
+            yield events_result.get("items", [])
+
+            page_token = events_result.get("nextPageToken")
+            if not page_token:
+                break
 
     async def delete_event(
         self,
@@ -151,11 +383,12 @@ class GoogleCalendarService:
     ) -> bool:
         google_calendar_id = google_calendar_id or self.default_google_calendar_id
         try:
-            self.service.events().delete(
-                calendarId=google_calendar_id, eventId=event_id
-            ).execute()
+            await self._execute(
+                self.service.events().delete(calendarId=google_calendar_id, eventId=event_id)
+            )
+            self.invalidate_events(google_calendar_id)
             return True
-        except HttpError as error:
+        except (HttpError, GoogleCalendarUnavailableError) as error:
             print(f"An error occurred: {error}")
             return False
 
@@ -188,13 +421,16 @@ class GoogleCalendarService:
        
         google_calendar_id = google_calendar_id or self.default_google_calendar_id
         try:
-            self.service.events().update(
-                calendarId=google_calendar_id,
-                eventId=event_id,
-                body=event,
-            ).execute()
+            await self._execute(
+                self.service.events().update(
+                    calendarId=google_calendar_id,
+                    eventId=event_id,
+                    body=event,
+                )
+            )
+            self.invalidate_events(google_calendar_id)
             return True
-        except HttpError as error:
+        except (HttpError, GoogleCalendarUnavailableError) as error:
             print(f"An error occurred: {error}")
             return False
 
@@ -205,9 +441,110 @@ class GoogleCalendarService:
     ) -> CalendarEvent | None:
         google_calendar_id = google_calendar_id or self.default_google_calendar_id
         try:
-            return self.service.events().get(
-                calendarId=google_calendar_id, eventId=event_id
-            ).execute()
-        except HttpError as error:
+            return await self._execute(
+                self.service.events().get(calendarId=google_calendar_id, eventId=event_id)
+            )
+        except (HttpError, GoogleCalendarUnavailableError) as error:
             print(f"An error occurred: {error}")
-            return None
\ No newline at end of file
+            return None
+
+    async def watch_events(
+        self,
+        channel_id: str,
+        address: str,
+        token: str,
+        google_calendar_id: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+    ) -> dict:
+        """캘린더 이벤트가 바뀌면 `address` 로 알림을 보내는 watch 채널을 등록하고 채널 리소스를 돌려준다."""
+        body = {
+            "id": channel_id,
+            "type": "web_hook",
+            "address": address,
+            "token": token,
+        }
+        if ttl_seconds is not None:
+            body["params"] = {"ttl": str(ttl_seconds)}
+        return await self._execute(
+            self.service.events().watch(
+                calendarId=google_calendar_id or self.default_google_calendar_id,
+                body=body,
+            )
+        )
+
+    async def stop_channel(self, channel_id: str, resource_id: str) -> bool:
+        try:
+            await self._execute(self.service.channels().stop(body={"id": channel_id, "resourceId": resource_id}))
+        except (HttpError, GoogleCalendarUnavailableError) as e:
+            print("stop_channel error", e)
+            return False
+        return True
+
+    async def sync_events(
+        self,
+        sync_token: Optional[str],
+        google_calendar_id: Optional[str] = None,
+    ) -> tuple[list[CalendarEvent], str]:
+        """
+        `sync_token` 이후 바뀐 이벤트(취소 포함)와 다음 sync token 을 돌려준다.
+        `sync_token` 이 없으면 이벤트 본문 없이 현재 시점의 sync token 만 받아온다.
+        sync token 이 만료되었으면 SyncTokenExpiredError.
+        """
+        google_calendar_id = google_calendar_id or self.default_google_calendar_id
+        params: dict[str, Any] = {"calendarId": google_calendar_id, "maxResults": 2500}
+        if sync_token is None:
+            params["fields"] = "nextPageToken,nextSyncToken"
+        else:
+            params["syncToken"] = sync_token
+
+        changes: list[CalendarEvent] = []
+        page_token = None
+        while True:
+            try:
+                result = await self._execute(self.service.events().list(**params, pageToken=page_token))
+            except HttpError as exc:
+                if exc.status_code == 410:
+                    raise SyncTokenExpiredError(str(exc)) from exc
+                raise
+            changes.extend(result.get("items", []))
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                return changes, result["nextSyncToken"]
+
+    async def freebusy(
+        self,
+        time_min: datetime,
+        time_max: datetime,
+        google_calendar_ids: Optional[Sequence[str]] = None,
+    ) -> dict[str, list[BusyInterval]]:
+        """
+        여러 캘린더의 바쁜 구간을 이벤트 본문 없이 조회한다.
+        캘린더 FREEBUSY_MAX_CALENDARS 개마다 업스트림 호출 한 번이며, 겹치는 구간은 합쳐서 돌려준다.
+        조회에 실패한 캘린더(권한 없음, 없는 캘린더 등)는 결과에서 빠진다.
+        """
+        calendar_ids = deduplicate_and_sort(list(google_calendar_ids or [self.default_google_calendar_id]))
+        chunks = [
+            calendar_ids[start:start + FREEBUSY_MAX_CALENDARS]
+            for start in range(0, len(calendar_ids), FREEBUSY_MAX_CALENDARS)
+        ]
+        responses = await asyncio.gather(*[
+            self._execute(
+                self.service.freebusy().query(
+                    body={
+                        "timeMin": time_min.isoformat(),
+                        "timeMax": time_max.isoformat(),
+                        "items": [{"id": calendar_id} for calendar_id in chunk],
+                    }
+                )
+            )
+            for chunk in chunks
+        ])
+
+        result: dict[str, list[BusyInterval]] = {}
+        for response in responses:
+            for calendar_id, calendar in response.get("calendars", {}).items():
+                if calendar.get("errors"):
+                    print(f"freebusy error for {calendar_id}: {calendar['errors']}")
+                    continue
+                result[calendar_id] = merge_busy_intervals(calendar.get("busy", []))
+        return result
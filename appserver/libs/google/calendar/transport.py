@@ -0,0 +1,195 @@
+"""
+httpx 기반 비동기 Google Calendar 전송 계층
+
+googleapiclient 는 요청을 만들고(HttpRequest, BatchHttpRequest) 응답을 해석(postproc)하는 데만 쓰고,
+실제 전송은 keep-alive 연결 풀을 가진 `httpx.AsyncClient` 가 맡는다.
+- 요청마다 스레드를 쓰지 않으므로 동시 호출 수가 스레드 풀 크기에 묶이지 않는다.
+- `h2` 가 설치되어 있으면 HTTP/2 로 연결 하나에 여러 요청을 다중화한다.
+- 서비스 계정 액세스 토큰은 만료 전까지 재사용하고, 갱신은 동시 호출 중 한 번만 한다.
+"""
+import asyncio
+import importlib.util
+import os
+import uuid
+from email.parser import FeedParser
+from pathlib import Path
+from typing import Any, Optional
+
+import httplib2
+import httpx
+from google.oauth2 import service_account
+from google_auth_httplib2 import Request as AuthRequest
+from googleapiclient.discovery import build
+from googleapiclient.errors import BatchError, HttpError
+from googleapiclient.http import BatchHttpRequest
+
+
+GOOGLE_CALENDAR_SCOPES = [
+    "https://www.googleapis.com/auth/calendar",
+    "https://www.googleapis.com/auth/calendar.events",
+]
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+GOOGLE_HTTP_MAX_CONNECTIONS = int(os.getenv("GOOGLE_HTTP_MAX_CONNECTIONS", "100"))
+GOOGLE_HTTP_MAX_KEEPALIVE = int(os.getenv("GOOGLE_HTTP_MAX_KEEPALIVE", "20"))
+
+
+class AsyncGoogleTransport:
+    """
+    googleapiclient 요청 객체를 httpx 로 보내는 전송 계층
+
+    >>> transport = AsyncGoogleTransport(http2=False)
+    >>> transport.http2
+    False
+    """
+
+    def __init__(
+        self,
+        credentials: Optional[Any] = None,
+        *,
+        client: Optional[httpx.AsyncClient] = None,
+        http2: Optional[bool] = None,
+        max_connections: int = GOOGLE_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = GOOGLE_HTTP_MAX_KEEPALIVE,
+        timeout: float = 10.0,
+    ):
+        self.credentials = credentials
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+                timeout=timeout,
+            )
+        self.client = client
+        self._refresh_lock = asyncio.Lock()
+
+    @classmethod
+    def from_service_account_file(cls, credentials_path: Path, **kwargs) -> "AsyncGoogleTransport":
+        credentials = service_account.Credentials.from_service_account_file(
+            credentials_path.as_posix(),
+            scopes=GOOGLE_CALENDAR_SCOPES,
+        )
+        return cls(credentials, **kwargs)
+
+    async def execute(self, request: Any) -> Any:
+        if isinstance(request, BatchHttpRequest):
+            return await self._execute_batch(request)
+
+        response = await self._send(request.method, request.uri, request.body, request.headers)
+        # HTTP 상태 확인과 JSON 해석은 googleapiclient 의 모델(postproc)에 맡긴다.
+        return request.postproc(_to_httplib2_response(response), response.content)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _send(self, method: str, uri: str, body: Any, headers: Optional[dict]) -> httpx.Response:
+        headers = dict(headers or {})
+        await self._apply_credentials(headers)
+        return await self.client.request(method, uri, content=body, headers=headers)
+
+    async def _apply_credentials(self, headers: dict) -> None:
+        if self.credentials is None:
+            return
+        if not self.credentials.valid:
+            async with self._refresh_lock:
+                # 락을 기다리는 동안 다른 호출이 이미 갱신했을 수 있다.
+                if not self.credentials.valid:
+                    await asyncio.to_thread(self.credentials.refresh, AuthRequest(httplib2.Http()))
+        self.credentials.apply(headers)
+
+    async def _execute_batch(self, batch: BatchHttpRequest) -> None:
+        # 요청 직렬화와 응답 해석은 BatchHttpRequest 의 것을 그대로 쓰고, 전송만 httpx 로 한다.
+        # 비공개 속성에 기대므로 google-api-python-client 버전을 pyproject.toml 에서 고정해 둔다.
+        if not batch._order:
+            return None
+
+        boundary = f"batch_{uuid.uuid4().hex}"
+        parts = [
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            "Content-Transfer-Encoding: binary\r\n"
+            f"Content-ID: {batch._id_to_header(request_id)}\r\n\r\n"
+            f"{batch._serialize_request(batch._requests[request_id])}\r\n"
+            for request_id in batch._order
+        ]
+        body = "".join(parts) + f"--{boundary}--\r\n"
+        response = await self._send(
+            "POST",
+            batch._batch_uri,
+            body.encode("utf-8"),
+            {"content-type": f"multipart/mixed; boundary={boundary}"},
+        )
+        if response.status_code >= 300:
+            raise HttpError(_to_httplib2_response(response), response.content, uri=batch._batch_uri)
+
+        parser = FeedParser()
+        parser.feed(f"content-type: {response.headers['content-type']}\r\n\r\n{response.text}")
+        message = parser.close()
+        if not message.is_multipart():
+            raise BatchError("Response not in multipart/mixed format.", resp=response, content=response.text)
+
+        responses = {}
+        for part in message.get_payload():
+            if part["Content-ID"] is None:
+                continue
+            resp, content = batch._deserialize_response(part.get_payload())
+            responses[batch._header_to_id(part["Content-ID"])] = (resp, content.encode("utf-8"))
+
+        for request_id in batch._order:
+            request = batch._requests[request_id]
+            result, exception = None, None
+            try:
+                # 응답에 이 요청의 part 가 빠졌으면 batch 전체가 아니라 이 요청만 실패로 돌려준다.
+                if request_id not in responses:
+                    raise BatchError(f"Missing response part for Content-ID {request_id}.")
+                resp, content = responses[request_id]
+                if resp.status >= 300:
+                    raise HttpError(resp, content, uri=request.uri)
+                result = request.postproc(resp, content)
+            except HttpError as e:
+                exception = e
+
+            if (callback := batch._callbacks[request_id]) is not None:
+                callback(request_id, result, exception)
+            if batch._callback is not None:
+                batch._callback(request_id, result, exception)
+        return None
+
+
+def build_request_builder() -> Any:
+    """
+    요청 객체를 만드는 용도의 Calendar v3 Resource. 전송은 AsyncGoogleTransport 가 하므로 인증 정보가 없다.
+    정적 discovery 문서를 쓰므로 네트워크 요청 없이 만들어진다.
+    """
+    return build("calendar", "v3", http=httplib2.Http(), static_discovery=True)
+
+
+def _to_httplib2_response(response: httpx.Response) -> httplib2.Response:
+    return httplib2.Response({"status": response.status_code, **response.headers})
+
+
+_shared_transport: Optional[AsyncGoogleTransport] = None
+_shared_request_builder: Any = None
+
+
+def get_shared_transport(credentials_path: Path) -> tuple[AsyncGoogleTransport, Any]:
+    """
+    프로세스 전체가 함께 쓰는 전송 계층과 요청 빌더.
+    요청마다 새로 만들면 연결 풀과 액세스 토큰을 재사용할 수 없으므로 한 번만 만든다.
+    """
+    global _shared_transport, _shared_request_builder
+    if _shared_transport is None:
+        _shared_transport = AsyncGoogleTransport.from_service_account_file(credentials_path)
+        _shared_request_builder = build_request_builder()
+    return _shared_transport, _shared_request_builder
+
+
+async def close_shared_transport() -> None:
+    global _shared_transport, _shared_request_builder
+    if _shared_transport is not None:
+        await _shared_transport.aclose()
+        _shared_transport = _shared_request_builder = None
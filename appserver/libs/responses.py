@@ -0,0 +1,54 @@
+"""
+미리 만든 직렬화기로 응답 본문을 바로 JSON bytes 로 만드는 응답
+
+FastAPI 는 `response_model` 로 응답을 검증한 뒤 직렬화하는데, 버전에 따라 dict 로 바꾼 다음 `json.dumps` 를 한 번 더 거친다.
+`TypedJSONResponse` 는 타입마다 한 번만 만든 TypeAdapter 로 ORM 객체를 검증하고, pydantic-core 에서 곧바로 bytes 로 직렬화한다.
+엔드포인트의 `response_model` 은 문서(OpenAPI)용으로 그대로 둔다.
+"""
+from functools import lru_cache
+from typing import Any, Mapping
+
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+
+@lru_cache(maxsize=None)
+def type_adapter(response_type: Any) -> TypeAdapter:
+    """
+    `response_type` 의 TypeAdapter. 스키마를 만드는 비용이 크므로 타입마다 한 번만 만든다.
+
+    >>> type_adapter(list[int]) is type_adapter(list[int])
+    True
+    """
+    return TypeAdapter(response_type)
+
+
+def dump_json(response_type: Any, content: Any) -> bytes:
+    """
+    `content` 를 `response_type` 으로 검증(ORM 객체는 속성에서 읽음)하고 JSON bytes 로 직렬화한다.
+
+    >>> dump_json(list[int], ["1", 2])
+    b'[1,2]'
+    """
+    adapter = type_adapter(response_type)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+class TypedJSONResponse(Response):
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        response_type: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        # Response.__init__ 이 render 를 부르므로 먼저 정해 둔다.
+        self.response_type = response_type
+        super().__init__(content, status_code, headers, background=background)
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(self.response_type, content)
@@ -0,0 +1,62 @@
+"""
+여러 비동기 이터레이터를 동시에 돌리며 도착하는 순서대로 내보내기
+"""
+import asyncio
+from typing import AsyncIterable, AsyncIterator, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _SourceError:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+async def interleave(*sources: AsyncIterable[T], maxsize: int = 64) -> AsyncIterator[T]:
+    """
+    `sources` 를 소스마다 태스크 하나로 동시에 읽고, 나온 항목을 도착한 순서대로 내보낸다.
+
+    항목은 크기 `maxsize` 인 큐를 거치므로 소비자가 느리면 소스도 그만큼 기다린다.
+    소스에서 난 예외는 그대로 다시 던지고, 소비자가 도중에 멈추면(취소·`aclose`) 남은 소스 태스크를 취소한다.
+
+    >>> async def numbers(*values):
+    ...     for value in values:
+    ...         yield value
+    >>> async def collect():
+    ...     return sorted([item async for item in interleave(numbers(1, 3), numbers(2))])
+    >>> asyncio.run(collect())
+    [1, 2, 3]
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    async def _drain(source: AsyncIterable[T]) -> None:
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as error:
+            await queue.put(_SourceError(error))
+        else:
+            await queue.put(_DONE)
+        finally:
+            # 취소돼도 소스(예: DB 커서를 연 async generator)를 바로 닫는다.
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    tasks = [asyncio.create_task(_drain(source)) for source in sources]
+    try:
+        running = len(tasks)
+        while running:
+            item = await queue.get()
+            if item is _DONE:
+                running -= 1
+            elif isinstance(item, _SourceError):
+                raise item.error
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,65 @@
+"""
+로더 프로필
+
+모델의 관계는 기본으로 읽지 않는다(`lazy="raise_on_sql"`). 이미 세션에 있는 인스턴스를 가리키는 다대일 관계는 쿼리 없이 따라갈 수 있지만,
+쿼리가 필요한 관계에 접근하면 예외가 나므로 async 세션에서 모르는 사이에 쿼리가 나가지 않는다.
+엔드포인트는 응답에 필요한 관계만 이름 붙인 프로필로 골라 읽는다.
+
+- `list`: 페이지 단위 부킹 목록(BookingOut). 부킹만 읽고 관계는 요청 로더(`appserver.loaders`)로 붙인다.
+- `detail`: 부킹 하나(BookingOut)는 타임슬롯 → 캘린더 → 호스트와 첨부파일까지, 사용자는 캘린더까지 읽는다.
+- `admin`: 관리자 화면. 모델의 `__str__` 이 따라가는 관계까지 읽는다. 관리자 세션이 쿼리마다 붙인다(`appserver.admin`).
+
+엔드포인트별 행 너비와 지연 시간 비교는 `python -m benchmarks.loader_profiles`.
+"""
+from sqlalchemy.orm import joinedload, noload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Booking, BookingFile, Calendar, TimeSlot
+
+
+_BOOKING_HOST = joinedload(Booking.time_slot).joinedload(TimeSlot.calendar).joinedload(Calendar.host)
+
+LOADER_PROFILES: dict[str, dict[type, tuple[ORMOption, ...]]] = {
+    "list": {
+        Booking: (noload(Booking.time_slot), noload(Booking.guest), noload(Booking.files)),
+    },
+    "detail": {
+        Booking: (_BOOKING_HOST, joinedload(Booking.files)),
+        User: (joinedload(User.calendar),),
+        Calendar: (joinedload(Calendar.host),),
+        TimeSlot: (joinedload(TimeSlot.calendar).joinedload(Calendar.host),),
+    },
+    # sqladmin 이 목록·폼에 나오는 관계를 selectinload 로 읽으므로, 같은 경로에 다른 방식을 쓰면 충돌한다. 모두 selectinload 로 맞춘다.
+    "admin": {
+        Booking: (
+            selectinload(Booking.time_slot).selectinload(TimeSlot.calendar).selectinload(Calendar.host),
+            selectinload(Booking.guest),
+            selectinload(Booking.files),
+        ),
+        BookingFile: (
+            selectinload(BookingFile.booking).selectinload(Booking.time_slot).selectinload(TimeSlot.calendar).selectinload(Calendar.host),
+        ),
+        User: (selectinload(User.calendar).selectinload(Calendar.host),),
+        Calendar: (selectinload(Calendar.host),),
+        TimeSlot: (selectinload(TimeSlot.calendar).selectinload(Calendar.host),),
+    },
+}
+
+
+def loader_options(profile: str, model: type) -> tuple[ORMOption, ...]:
+    """
+    `profile` 에서 `model` 을 읽을 때 붙일 옵션. 프로필에 없는 모델은 빈 튜플(관계를 읽지 않음)이다.
+
+    >>> loader_options("list", Calendar)
+    ()
+    >>> loader_options("summary", Booking)
+    Traceback (most recent call last):
+    ...
+    ValueError: 없는 로더 프로필입니다: summary
+    """
+    try:
+        options = LOADER_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"없는 로더 프로필입니다: {profile}") from None
+    return options.get(model, ())
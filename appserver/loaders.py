@@ -0,0 +1,112 @@
+"""
+요청 범위 로더
+
+한 요청 안에서 같은 행을 여러 번 읽지 않도록, 사용자·캘린더·타임슬롯·첨부파일을 id(또는 사용자 계정 ID)로 모아서
+`IN (...)` 쿼리 한 번으로 읽고 요청이 끝날 때까지 기억한다.
+
+- `LoadersDep` 는 요청마다 하나만 만들어지므로 인증 의존성과 엔드포인트가 같은 로더를 쓴다.
+  인증 의존성이 읽은 현재 사용자(와 캘린더)를 미리 넣어 두므로, 엔드포인트에서 같은 사용자를 다시 찾으면 쿼리가 나가지 않는다.
+- 로더가 돌려주는 인스턴스는 관계(타임슬롯 → 캘린더 → 호스트)를 모두 채운 상태다.
+  각 쿼리는 관계를 JOIN 하지 않고(`noload`) 다른 로더로 읽어서 붙인다.
+- 목록 엔드포인트는 `list` 프로필로 부킹만 읽은 뒤 `attach_bookings` 로 관계를 붙인다. 쪽 크기와 상관없이 쿼리 수가 일정하다.
+"""
+import asyncio
+from collections import defaultdict
+from typing import Annotated, Iterable
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import select
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Booking, BookingFile, Calendar, TimeSlot
+from appserver.db import DbSessionDep
+from appserver.libs.dataloader import DataLoader
+from appserver.loader_profiles import loader_options
+
+
+class RequestLoaders:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        # 로더마다 별도 태스크에서 쿼리하므로, 한 세션에서 쿼리가 겹치지 않게 한다.
+        self._lock = asyncio.Lock()
+        self.users_by_id: DataLoader[int, User] = DataLoader(self._load_users_by_id)
+        self.users_by_username: DataLoader[str, User] = DataLoader(self._load_users_by_username)
+        self.calendars_by_id: DataLoader[int, Calendar] = DataLoader(self._load_calendars_by_id)
+        self.time_slots_by_id: DataLoader[int, TimeSlot] = DataLoader(self._load_time_slots_by_id)
+        self.files_by_booking_id: DataLoader[int, list[BookingFile]] = DataLoader(self._load_files_by_booking_id)
+
+    def prime_user(self, user: User) -> None:
+        self.users_by_id.prime(user.id, user)
+        self.users_by_username.prime(user.username, user)
+        if user.calendar is not None:
+            set_committed_value(user.calendar, "host", user)
+            self.calendars_by_id.prime(user.calendar.id, user.calendar)
+
+    async def attach_bookings(self, bookings: Iterable[Booking]) -> None:
+        """`list` 프로필로 읽은 부킹에 타임슬롯(→ 캘린더 → 호스트), 게스트, 첨부파일을 붙인다."""
+        bookings = list(bookings)
+        time_slots, guests, files = await asyncio.gather(
+            self.time_slots_by_id.load_many(_unique(booking.time_slot_id for booking in bookings)),
+            self.users_by_id.load_many(_unique(booking.guest_id for booking in bookings)),
+            self.files_by_booking_id.load_many(booking.id for booking in bookings),
+        )
+        time_slots = {time_slot.id: time_slot for time_slot in time_slots if time_slot is not None}
+        guests = {guest.id: guest for guest in guests if guest is not None}
+        for booking, booking_files in zip(bookings, files):
+            set_committed_value(booking, "time_slot", time_slots.get(booking.time_slot_id))
+            set_committed_value(booking, "guest", guests.get(booking.guest_id))
+            set_committed_value(booking, "files", booking_files or [])
+
+    async def _execute(self, stmt) -> list:
+        async with self._lock:
+            result = await self.session.execute(stmt)
+            return result.unique().scalars().all()
+
+    async def _load_users_by_id(self, ids: list[int]) -> dict[int, User]:
+        users = await self._execute(select(User).options(*loader_options("detail", User)).where(User.id.in_(ids)))
+        for user in users:
+            self.prime_user(user)
+        return {user.id: user for user in users}
+
+    async def _load_users_by_username(self, usernames: list[str]) -> dict[str, User]:
+        users = await self._execute(select(User).options(*loader_options("detail", User)).where(User.username.in_(usernames)))
+        for user in users:
+            self.prime_user(user)
+        return {user.username: user for user in users}
+
+    async def _load_calendars_by_id(self, ids: list[int]) -> dict[int, Calendar]:
+        calendars = await self._execute(select(Calendar).options(noload(Calendar.host)).where(Calendar.id.in_(ids)))
+        hosts = await self.users_by_id.load_many(_unique(calendar.host_id for calendar in calendars))
+        hosts = {host.id: host for host in hosts if host is not None}
+        for calendar in calendars:
+            set_committed_value(calendar, "host", hosts.get(calendar.host_id))
+        return {calendar.id: calendar for calendar in calendars}
+
+    async def _load_time_slots_by_id(self, ids: list[int]) -> dict[int, TimeSlot]:
+        time_slots = await self._execute(select(TimeSlot).options(noload(TimeSlot.calendar)).where(TimeSlot.id.in_(ids)))
+        calendars = await self.calendars_by_id.load_many(_unique(time_slot.calendar_id for time_slot in time_slots))
+        calendars = {calendar.id: calendar for calendar in calendars if calendar is not None}
+        for time_slot in time_slots:
+            set_committed_value(time_slot, "calendar", calendars.get(time_slot.calendar_id))
+        return {time_slot.id: time_slot for time_slot in time_slots}
+
+    async def _load_files_by_booking_id(self, booking_ids: list[int]) -> dict[int, list[BookingFile]]:
+        files = await self._execute(select(BookingFile).where(BookingFile.booking_id.in_(booking_ids)).order_by(BookingFile.id))
+        by_booking_id: dict[int, list[BookingFile]] = defaultdict(list)
+        for file in files:
+            by_booking_id[file.booking_id].append(file)
+        return by_booking_id
+
+
+def _unique(values: Iterable[int]) -> list[int]:
+    return list(dict.fromkeys(values))
+
+
+def get_loaders(session: DbSessionDep) -> RequestLoaders:
+    return RequestLoaders(session)
+
+
+LoadersDep = Annotated[RequestLoaders, Depends(get_loaders)]
@@ -0,0 +1,105 @@
+"""
+월별 부킹 목록(SimpleBookingOut) 메모리 비교: ORM 엔티티 vs 컬럼 프로젝션
+
+한 호스트의 한 달 치 부킹을 세 가지로 읽어 응답 객체 목록까지 만들고, tracemalloc 으로 잰 메모리를 부킹 수로 나눈다.
+
+- orm joined: 예전처럼 모든 관계를 JOIN 한 Booking 엔티티를 검증
+- orm load_only: 필요한 컬럼과 타임슬롯만 읽은 Booking 엔티티를 검증
+- projection: `fetch_month_bookings` (컬럼 튜플 → SimpleBookingOut, 타임슬롯 공유)
+
+retained 는 응답 목록을 들고 있는 동안 남아 있는 메모리(세션 포함), peak 는 만드는 동안 가장 많이 쓴 메모리다.
+
+    python -m benchmarks.booking_projection --bookings 5000
+"""
+import argparse
+import asyncio
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only
+from sqlmodel import SQLModel
+
+from appserver.apps.calendar.endpoints import fetch_month_bookings
+from appserver.apps.calendar.models import Booking
+from appserver.apps.calendar.schemas import SimpleBookingOut
+from appserver.db import create_engine, create_session
+from benchmarks.loader_profiles import JOINED, MONTH, YEAR, load_host, monthly_stmt, seed
+
+
+async def orm_joined(session: AsyncSession, calendar_id: int) -> list[SimpleBookingOut]:
+    bookings = (await session.execute(monthly_stmt(calendar_id).options(*JOINED))).unique().scalars().all()
+    return [SimpleBookingOut.model_validate(booking) for booking in bookings]
+
+
+async def orm_load_only(session: AsyncSession, calendar_id: int) -> list[SimpleBookingOut]:
+    stmt = monthly_stmt(calendar_id).options(
+        load_only(Booking.id, Booking.when, Booking.time_slot_id),
+        joinedload(Booking.time_slot),
+    )
+    bookings = (await session.execute(stmt)).unique().scalars().all()
+    return [SimpleBookingOut.model_validate(booking) for booking in bookings]
+
+
+async def projection(session: AsyncSession, calendar_id: int) -> list[SimpleBookingOut]:
+    return await fetch_month_bookings(session, calendar_id, YEAR, MONTH)
+
+
+CASES = {"orm joined": orm_joined, "orm load_only": orm_load_only, "projection": projection}
+
+
+async def measure(session_factory, case, calendar_id: int) -> dict:
+    async with session_factory() as session:
+        # 워밍업: 쿼리 컴파일 캐시 등을 미리 채운다.
+        await case(session, calendar_id)
+    gc.collect()
+
+    async with session_factory() as session:
+        tracemalloc.start()
+        started_at = time.perf_counter()
+        items = await case(session, calendar_id)
+        elapsed = time.perf_counter() - started_at
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "rows": len(items),
+        "retained B/row": retained / len(items),
+        "peak B/row": peak / len(items),
+        "ms": elapsed * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bookings", type=int, default=5000)
+    parser.add_argument("--guests", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite+aiosqlite:///{Path(tmpdir) / 'bench.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        session_factory = create_session(engine)
+        await seed(session_factory, args.bookings, args.guests)
+        async with session_factory() as session:
+            calendar_id = (await load_host(session)).calendar.id
+
+        try:
+            for name, case in CASES.items():
+                result = await measure(session_factory, case, calendar_id)
+                metrics = " ".join(
+                    f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+                    for key, value in result.items()
+                )
+                print(f"{name:>14}: {metrics}")
+        finally:
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
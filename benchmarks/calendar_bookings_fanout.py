@@ -0,0 +1,134 @@
+"""
+월별 부킹 목록(GET /calendar/{host}/bookings) 지연 시간: 순차 조회 vs 동시 조회
+
+임시 SQLite 파일 DB 에 한 달 치 부킹을, 가짜 Google Calendar 백엔드에 같은 달 일정을 만들고
+Google 응답에 지연을 넣어 가며 엔드포인트 함수를 직접 부른다. Google 일정 캐시는 끄고 매번 조회한다.
+
+- sequential: 예전 방식. DB 부킹을 다 읽은 뒤에 Google 일정을 조회
+- concurrent: 지금 엔드포인트. TaskGroup 으로 동시에 조회하고 `--deadline` 이 지나면 끝난 쪽만으로 응답
+
+partial 은 마감 시간이 지나 일부만 응답한 횟수다.
+
+    python -m benchmarks.calendar_bookings_fanout --bookings 5000 --latency 0.05 0.2 0.5 --deadline 0.3
+"""
+import argparse
+import asyncio
+import calendar
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlmodel import SQLModel
+
+from appserver.apps.calendar import endpoints
+from appserver.apps.calendar.endpoints import fetch_month_bookings, host_calendar_bookings
+from appserver.apps.calendar.schemas import CalendarBookingOut, convert_event_list, event_out_cache
+from appserver.db import create_engine, create_session
+from appserver.libs.google.calendar.fake import FakeGoogleCalendarBackend, build_fake_service
+from appserver.libs.google.calendar.services import GoogleCalendarService
+from appserver.libs.responses import TypedJSONResponse
+from appserver.loaders import RequestLoaders
+from benchmarks.loader_profiles import MONTH, YEAR, load_host, percentile, seed
+
+
+GOOGLE_CALENDAR_ID = "bench@example.com"
+
+
+async def sequential(session_factory, session, service: GoogleCalendarService) -> TypedJSONResponse:
+    host = await load_host(session)
+    bookings = await fetch_month_bookings(session, host.calendar.id, YEAR, MONTH)
+    last_day = calendar.monthrange(YEAR, MONTH)[1]
+    events = await service.event_list(
+        time_min=datetime(YEAR, MONTH, 1).astimezone(timezone.utc),
+        time_max=datetime(YEAR, MONTH, last_day).astimezone(timezone.utc),
+        google_calendar_id=host.calendar.google_calendar_id,
+    )
+    bookings.extend(convert_event_list(events))
+    return TypedJSONResponse(bookings, list[CalendarBookingOut])
+
+
+async def concurrent(session_factory, session, service: GoogleCalendarService) -> TypedJSONResponse:
+    return await host_calendar_bookings("bench_host", session_factory, YEAR, MONTH, service, RequestLoaders(session))
+
+
+CASES = {"sequential": sequential, "concurrent": concurrent}
+
+
+async def seed_events(service: GoogleCalendarService, count: int) -> None:
+    for index in range(count):
+        start = datetime(YEAR, MONTH, 1, 9) + timedelta(days=index % 28, hours=index % 8)
+        await service.create_event(
+            summary=f"일정 {index}",
+            start_datetime=start,
+            end_datetime=start + timedelta(minutes=50),
+            google_calendar_id=GOOGLE_CALENDAR_ID,
+            send_update="none",
+        )
+
+
+async def measure(session_factory, service: GoogleCalendarService, case, repeat: int) -> dict:
+    latencies: list[float] = []
+    partial = 0
+    for index in range(repeat + 1):
+        event_out_cache.clear()
+        started_at = time.perf_counter()
+        async with session_factory() as session:
+            response = await case(session_factory, session, service)
+        # 첫 번째는 워밍업
+        if index:
+            latencies.append(time.perf_counter() - started_at)
+            partial += endpoints.PARTIAL_RESULT_HEADER in response.headers
+
+    return {
+        "p50 ms": statistics.median(latencies) * 1000,
+        "p95 ms": percentile(latencies, 0.95) * 1000,
+        "partial": partial,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bookings", type=int, default=5000)
+    parser.add_argument("--guests", type=int, default=50)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.05, 0.2, 0.5])
+    parser.add_argument("--deadline", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    endpoints.CALENDAR_BOOKINGS_DEADLINE = args.deadline
+    backend = FakeGoogleCalendarBackend()
+    service = GoogleCalendarService(
+        GOOGLE_CALENDAR_ID,
+        service=build_fake_service(backend),
+        event_cache=None,
+        breaker=None,
+    )
+    await seed_events(service, args.events)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite+aiosqlite:///{Path(tmpdir) / 'bench.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        session_factory = create_session(engine)
+        await seed(session_factory, args.bookings, args.guests)
+
+        try:
+            for latency in args.latency:
+                backend.latency = latency
+                print(f"Google latency={latency * 1000:.0f}ms deadline={args.deadline * 1000:.0f}ms")
+                for name, case in CASES.items():
+                    result = await measure(session_factory, service, case, args.repeat)
+                    metrics = " ".join(
+                        f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+                        for key, value in result.items()
+                    )
+                    print(f"  {name:>10}: {metrics}")
+        finally:
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+"""
+Google Calendar 전송 계층 비교: httplib2(스레드) vs httpx(비동기 연결 풀)
+
+localhost 가짜 서버(FakeGoogleCalendarServer)에 요청마다 지연을 주고,
+같은 수의 get_event 를 정해진 동시성으로 보내 처리량과 지연 분포를 잰다.
+
+    python -m benchmarks.google_calendar_transport --requests 500 --concurrency 50 --latency 0.02
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime
+
+import httplib2
+
+from appserver.libs.google.calendar.fake import (
+    FakeGoogleCalendarBackend,
+    FakeGoogleCalendarServer,
+    build_fake_service,
+)
+from appserver.libs.google.calendar.services import GoogleCalendarService
+from appserver.libs.google.calendar.transport import AsyncGoogleTransport
+
+
+CALENDAR_ID = "bench@example.com"
+
+
+async def run(service: GoogleCalendarService, event_id: str, requests: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def _one():
+        async with semaphore:
+            started_at = time.perf_counter()
+            event = await service.get_event(event_id)
+            latencies.append(time.perf_counter() - started_at)
+            assert event is not None
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*[_one() for _ in range(requests)])
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        "ops/s": requests / elapsed,
+        "p50 ms": statistics.median(latencies) * 1000,
+        "p95 ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02, help="가짜 서버의 요청당 지연(초)")
+    args = parser.parse_args()
+
+    backend = FakeGoogleCalendarBackend(latency=args.latency)
+    with FakeGoogleCalendarServer(backend) as server:
+        request_builder = build_fake_service(root_url=server.root_url)
+        event = request_builder.events().insert(
+            calendarId=CALENDAR_ID,
+            body={
+                "summary": "bench",
+                "start": {"dateTime": datetime(2026, 3, 2, 9).isoformat(), "timeZone": "Asia/Seoul"},
+                "end": {"dateTime": datetime(2026, 3, 2, 10).isoformat(), "timeZone": "Asia/Seoul"},
+            },
+        ).execute()
+
+        httplib2_service = GoogleCalendarService(
+            CALENDAR_ID,
+            service=request_builder,
+            http_factory=httplib2.Http,
+            event_cache=None,
+            breaker=None,
+        )
+        transport = AsyncGoogleTransport(max_keepalive_connections=args.concurrency)
+        httpx_service = GoogleCalendarService(
+            CALENDAR_ID,
+            service=request_builder,
+            transport=transport,
+            event_cache=None,
+            breaker=None,
+        )
+
+        print(f"requests={args.requests} concurrency={args.concurrency} latency={args.latency * 1000:.0f}ms")
+        for name, service in [("httplib2 + to_thread", httplib2_service), ("httpx AsyncClient", httpx_service)]:
+            result = await run(service, event["id"], args.requests, args.concurrency)
+            print(f"{name:22s} " + "  ".join(f"{key}={value:8.1f}" for key, value in result.items()))
+        await transport.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
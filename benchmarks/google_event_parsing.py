@@ -0,0 +1,133 @@
+"""
+Google Calendar 이벤트 변환 마이크로벤치마크 (한 달 1,000개)
+
+`event_list` 결과(dict 목록)를 GoogleCalendarEventOut 으로 바꾸고 JSON 으로 직렬화하는 데까지 잰다.
+
+- legacy: 예전 스키마. `time_slot`, `when` 이 각각 start/end 를 `fromisoformat` 으로 해석하고, 읽을 때마다 다시 해석한다.
+- per event: 지금 스키마를 이벤트마다 `model_validate`
+- bulk: `convert_event_list` 를 빈 캐시로 (미리 해석한 dict 를 TypeAdapter 한 번으로 검증)
+- bulk memo: `convert_event_list` 로 같은 달을 다시 변환 (이벤트 변환 캐시 적중)
+
+직렬화는 월별 목록 응답처럼 목록을 한 번에 `dump_json` 한다. 종일 일정이 1/10 섞여 있다.
+
+    python -m benchmarks.google_event_parsing --events 1000 --repeat 200
+"""
+import argparse
+import statistics
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Callable
+
+from pydantic import computed_field
+from sqlmodel import Field, SQLModel
+
+from appserver.apps.calendar.schemas import (
+    GoogleCalendarEventOut,
+    GoogleCalendarTimeSlot,
+    convert_event_list,
+    event_out_cache,
+)
+from appserver.libs.responses import type_adapter
+
+
+class LegacyGoogleCalendarEventOut(SQLModel):
+    id: str
+    start: dict = Field(exclude=True)
+    end: dict = Field(exclude=True)
+
+    @computed_field
+    @property
+    def time_slot(self) -> GoogleCalendarTimeSlot:
+        if start_date := self.start.get("date"):
+            start_time = dt_time(0, 0)
+            end_time = dt_time(23, 59)
+            start_date = date.fromisoformat(start_date)
+        else:
+            start = datetime.fromisoformat(self.start["dateTime"])
+            start_time = start.time()
+            start_date = start.date()
+            end_time = datetime.fromisoformat(self.end["dateTime"]).time()
+
+        return GoogleCalendarTimeSlot(start_time=start_time, end_time=end_time, weekdays=[start_date.weekday()])
+
+    @computed_field
+    @property
+    def when(self) -> date:
+        if start_date := self.start.get("date"):
+            return date.fromisoformat(start_date)
+        return datetime.fromisoformat(self.start.get("dateTime")).date()
+
+
+def make_events(count: int) -> list[dict]:
+    events = []
+    for index in range(count):
+        day = date(2026, 3, 1) + timedelta(days=index % 31)
+        if index % 10 == 0:
+            start, end = {"date": day.isoformat()}, {"date": (day + timedelta(days=1)).isoformat()}
+        else:
+            hour = 8 + index % 10
+            start = {"dateTime": f"{day.isoformat()}T{hour:02d}:00:00+09:00", "timeZone": "Asia/Seoul"}
+            end = {"dateTime": f"{day.isoformat()}T{hour:02d}:50:00+09:00", "timeZone": "Asia/Seoul"}
+        events.append({"id": f"event{index:05d}", "start": start, "end": end})
+    return events
+
+
+def legacy(events: list[dict]) -> bytes:
+    items = [LegacyGoogleCalendarEventOut.model_validate(event) for event in events]
+    return type_adapter(list[LegacyGoogleCalendarEventOut]).dump_json(items)
+
+
+def per_event(events: list[dict]) -> bytes:
+    items = [GoogleCalendarEventOut.model_validate(event) for event in events]
+    return type_adapter(list[GoogleCalendarEventOut]).dump_json(items)
+
+
+def bulk(events: list[dict]) -> bytes:
+    event_out_cache.clear()
+    return type_adapter(list[GoogleCalendarEventOut]).dump_json(convert_event_list(events))
+
+
+def bulk_memo(events: list[dict]) -> bytes:
+    return type_adapter(list[GoogleCalendarEventOut]).dump_json(convert_event_list(events))
+
+
+CASES: dict[str, Callable[[list[dict]], bytes]] = {
+    "legacy": legacy,
+    "per event": per_event,
+    "bulk": bulk,
+    "bulk memo": bulk_memo,
+}
+
+
+def measure(case: Callable[[list[dict]], bytes], events: list[dict], repeat: int) -> dict:
+    case(events)
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        case(events)
+        timings.append(time.perf_counter() - started_at)
+    median = statistics.median(timings)
+    return {
+        "ms/month": median * 1000,
+        "us/event": median / len(events) * 1_000_000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    events = make_events(args.events)
+    # 모든 방법이 같은 JSON 을 만드는지 먼저 확인한다.
+    assert len({case(events) for case in CASES.values()}) == 1, "변환 결과가 다릅니다"
+
+    for name, case in CASES.items():
+        result = measure(case, events, args.repeat)
+        metrics = " ".join(f"{key}={value:.2f}" for key, value in result.items())
+        print(f"{name:>10}: {metrics}")
+
+
+if __name__ == "__main__":
+    main()
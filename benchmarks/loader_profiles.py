@@ -0,0 +1,235 @@
+"""
+로더 프로필 효과: 엔드포인트별 부킹 조회의 행 너비와 지연 시간 비교
+
+임시 SQLite 파일 DB 에 호스트 한 명과 한 달 치 부킹을 만들고, 엔드포인트가 하는 조회를 두 가지로 실행한다.
+
+- joined: 예전 모델 기본값(`lazy="joined"`)처럼 타임슬롯 → 캘린더 → 호스트, 게스트 → 캘린더, 첨부파일을 모두 JOIN
+- profile: 지금 엔드포인트가 쓰는 방식. 월별 목록은 컬럼 프로젝션(`fetch_month_bookings`), 나머지는 로더 프로필(`list` + 요청 로더, `detail`)
+
+요청마다 새 세션을 쓰고, 응답 스키마로 검증하는 데까지 잰다.
+columns 는 실행한 SELECT 들의 컬럼 수 합(행 너비), objects 는 응답을 만드는 동안 세션에 올라간 ORM 인스턴스 수다.
+메모리는 `python -m benchmarks.booking_projection` 참고.
+
+    python -m benchmarks.loader_profiles --bookings 2000 --repeat 30
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import date, time as dt_time, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from sqlalchemy import event, extract
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlmodel import SQLModel, select
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.endpoints import fetch_month_bookings
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+from appserver.apps.calendar.schemas import BookingOut, SimpleBookingOut
+from appserver.db import create_engine, create_session
+from appserver.loader_profiles import loader_options
+from appserver.loaders import RequestLoaders
+
+
+YEAR, MONTH = 2026, 3
+PAGE_SIZE = 50
+
+# 예전 모델 기본값이 만들던 JOIN 과 같다.
+JOINED = (
+    joinedload(Booking.time_slot).joinedload(TimeSlot.calendar).joinedload(Calendar.host),
+    joinedload(Booking.guest).joinedload(User.calendar),
+    joinedload(Booking.files),
+)
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+async def load_host(session: AsyncSession) -> User:
+    stmt = select(User).options(*loader_options("detail", User)).where(User.username == "bench_host")
+    return (await session.execute(stmt)).unique().scalar_one()
+
+
+def monthly_stmt(calendar_id: int):
+    return (
+        select(Booking)
+        .where(Booking.time_slot.has(TimeSlot.calendar_id == calendar_id))
+        .where(extract("year", Booking.when) == YEAR)
+        .where(extract("month", Booking.when) == MONTH)
+        .order_by(Booking.when.desc())
+    )
+
+
+def page_stmt(calendar_id: int):
+    return (
+        select(Booking)
+        .where(Booking.time_slot.has(TimeSlot.calendar_id == calendar_id))
+        .order_by(Booking.when.desc())
+        .limit(PAGE_SIZE)
+    )
+
+
+async def monthly_joined(session: AsyncSession) -> list[Booking]:
+    host = await load_host(session)
+    bookings = (await session.execute(monthly_stmt(host.calendar.id).options(*JOINED))).unique().scalars().all()
+    [SimpleBookingOut.model_validate(booking) for booking in bookings]
+    return bookings
+
+
+async def monthly_profile(session: AsyncSession) -> list[SimpleBookingOut]:
+    host = await load_host(session)
+    return await fetch_month_bookings(session, host.calendar.id, YEAR, MONTH)
+
+
+async def page_joined(session: AsyncSession) -> list[Booking]:
+    host = await load_host(session)
+    bookings = (await session.execute(page_stmt(host.calendar.id).options(*JOINED))).unique().scalars().all()
+    [BookingOut.model_validate(booking) for booking in bookings]
+    return bookings
+
+
+async def page_profile(session: AsyncSession) -> list[Booking]:
+    loaders = RequestLoaders(session)
+    host = await load_host(session)
+    loaders.prime_user(host)
+    stmt = page_stmt(host.calendar.id).options(*loader_options("list", Booking))
+    bookings = (await session.execute(stmt)).scalars().all()
+    await loaders.attach_bookings(bookings)
+    [BookingOut.model_validate(booking) for booking in bookings]
+    return bookings
+
+
+async def detail_joined(session: AsyncSession) -> list[Booking]:
+    stmt = select(Booking).options(*JOINED).where(Booking.id == 1)
+    booking = (await session.execute(stmt)).unique().scalar_one()
+    BookingOut.model_validate(booking)
+    return [booking]
+
+
+async def detail_profile(session: AsyncSession) -> list[Booking]:
+    stmt = select(Booking).options(*loader_options("detail", Booking)).where(Booking.id == 1)
+    booking = (await session.execute(stmt)).unique().scalar_one()
+    BookingOut.model_validate(booking)
+    return [booking]
+
+
+SCENARIOS: dict[str, dict[str, Callable[[AsyncSession], Awaitable[list]]]] = {
+    "GET /calendar/{host}/bookings (한 달)": {"joined": monthly_joined, "profile": monthly_profile},
+    f"GET /bookings (page_size={PAGE_SIZE})": {"joined": page_joined, "profile": page_profile},
+    "GET /bookings/{id}": {"joined": detail_joined, "profile": detail_profile},
+}
+
+
+async def seed(session_factory, bookings: int, guests: int) -> None:
+    async with session_factory() as session:
+        host = User(
+            username="bench_host",
+            email="bench_host@example.com",
+            display_name="벤치마크 호스트",
+            hashed_password="-",
+            is_host=True,
+        )
+        session.add(host)
+        await session.flush()
+        calendar = Calendar(
+            host_id=host.id,
+            topics=["벤치마크"],
+            description="벤치마크 캘린더입니다. " * 20,
+            google_calendar_id="bench@example.com",
+        )
+        session.add(calendar)
+        await session.flush()
+        time_slots = [
+            TimeSlot(calendar_id=calendar.id, start_time=dt_time(9 + hour), end_time=dt_time(10 + hour), weekdays=list(range(5)))
+            for hour in range(8)
+        ]
+        guest_users = [
+            User(
+                username=f"bench_guest{index}",
+                email=f"bench_guest{index}@example.com",
+                display_name=f"게스트 {index}",
+                hashed_password="-",
+            )
+            for index in range(guests)
+        ]
+        session.add_all(time_slots + guest_users)
+        await session.flush()
+        for index in range(bookings):
+            session.add(Booking(
+                when=date(YEAR, MONTH, 1) + timedelta(days=index % 28),
+                topic=f"상담 {index}",
+                description="부킹 설명입니다. " * 30,
+                time_slot_id=time_slots[index % len(time_slots)].id,
+                guest_id=guest_users[index % len(guest_users)].id,
+            ))
+        await session.commit()
+
+
+async def measure(engine, session_factory, scenario: Callable[[AsyncSession], Awaitable[list]], repeat: int) -> dict:
+    columns: list[int] = []
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if cursor.description:
+            columns.append(len(cursor.description))
+
+    latencies: list[float] = []
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+    try:
+        for index in range(repeat + 1):
+            columns.clear()
+            started_at = time.perf_counter()
+            async with session_factory() as session:
+                bookings = await scenario(session)
+                rows, objects = len(bookings), len(session.identity_map)
+            # 첫 번째는 워밍업
+            if index:
+                latencies.append(time.perf_counter() - started_at)
+    finally:
+        event.remove(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+
+    return {
+        "rows": rows,
+        "queries": len(columns),
+        "columns": sum(columns),
+        "objects": objects,
+        "p50 ms": statistics.median(latencies) * 1000,
+        "p95 ms": percentile(latencies, 0.95) * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bookings", type=int, default=2000)
+    parser.add_argument("--guests", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite+aiosqlite:///{Path(tmpdir) / 'bench.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        session_factory = create_session(engine)
+        await seed(session_factory, args.bookings, args.guests)
+
+        try:
+            for name, cases in SCENARIOS.items():
+                print(name)
+                for case, scenario in cases.items():
+                    result = await measure(engine, session_factory, scenario, args.repeat)
+                    metrics = " ".join(
+                        f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+                        for key, value in result.items()
+                    )
+                    print(f"  {case:>8}: {metrics}")
+        finally:
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
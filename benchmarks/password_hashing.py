@@ -0,0 +1,122 @@
+"""
+로그인 비밀번호 검증 위치 비교: 이벤트 루프(inline) vs 스레드 풀 vs 프로세스 풀
+
+동시에 로그인 요청을 보내면서, 옆에서 5ms 마다 깨어나는 작업으로 이벤트 루프 지연(lag)을 잰다.
+inline 이면 argon2 검증이 도는 동안 루프가 멈추므로 lag 가 검증 시간만큼 커진다.
+
+    python -m benchmarks.password_hashing --requests 200 --concurrency 20 --workers 4
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from sqlmodel import SQLModel
+
+from appserver.app import include_routers
+from appserver.apps.account import utils as account_utils
+from appserver.apps.account.hashing import Argon2Params, PasswordHashingService
+from appserver.apps.account.models import User
+from appserver.db import create_engine, create_session, use_session
+
+
+LAG_INTERVAL = 0.005
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    values = sorted(values)
+    return values[max(int(len(values) * ratio) - 1, 0)]
+
+
+async def measure_lag(samples: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started_at = time.perf_counter()
+        await asyncio.sleep(LAG_INTERVAL)
+        samples.append(time.perf_counter() - started_at - LAG_INTERVAL)
+
+
+async def run(client: httpx.AsyncClient, requests: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    lags: list[float] = []
+    stop = asyncio.Event()
+
+    async def _one():
+        async with semaphore:
+            started_at = time.perf_counter()
+            response = await client.post("/account/login", json={"username": "bench_user", "password": "testtest"})
+            latencies.append(time.perf_counter() - started_at)
+            assert response.status_code == 200, response.text
+
+    monitor = asyncio.create_task(measure_lag(lags, stop))
+    started_at = time.perf_counter()
+    await asyncio.gather(*[_one() for _ in range(requests)])
+    elapsed = time.perf_counter() - started_at
+    stop.set()
+    await monitor
+
+    return {
+        "req/s": requests / elapsed,
+        "p50 ms": statistics.median(latencies) * 1000,
+        "p99 ms": percentile(latencies, 0.99) * 1000,
+        "lag p99 ms": percentile(lags, 0.99) * 1000,
+        "lag max ms": max(lags) * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--executors", default="inline,thread,process")
+    args = parser.parse_args()
+
+    params = Argon2Params.from_env()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite+aiosqlite:///{Path(tmpdir) / 'bench.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        session_factory = create_session(engine)
+
+        async with session_factory() as session:
+            session.add(User(
+                username="bench_user",
+                email="bench_user@example.com",
+                display_name="벤치마크 사용자",
+                hashed_password=PasswordHashingService(params, executor="inline").hash("testtest"),
+            ))
+            await session.commit()
+
+        app = FastAPI()
+        include_routers(app)
+
+        async def override_use_session():
+            async with session_factory() as session:
+                yield session
+
+        app.dependency_overrides[use_session] = override_use_session
+
+        original_hasher = account_utils.password_hasher
+        print(f"argon2 {params}")
+        try:
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+                for executor in args.executors.split(","):
+                    service = PasswordHashingService(params, executor=executor, max_workers=args.workers)
+                    account_utils.password_hasher = service
+                    await run(client, min(args.requests, 10), args.concurrency)  # 워밍업
+                    result = await run(client, args.requests, args.concurrency)
+                    service.shutdown()
+                    metrics = " ".join(f"{key}={value:.1f}" for key, value in result.items())
+                    print(f"{executor:>8}: {metrics}")
+        finally:
+            account_utils.password_hasher = original_hasher
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
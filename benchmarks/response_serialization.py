@@ -0,0 +1,170 @@
+"""
+부킹 목록 응답 직렬화 처리량 비교 (쪽 크기 50)
+
+DB 없이 메모리에 만든 ORM 객체 한 쪽을 응답 본문(bytes)까지 만드는 데 걸리는 시간을 잰다.
+
+- json.dumps: 검증 → `dump_python(mode="json")` 로 dict → JSONResponse(`json.dumps`). 예전 FastAPI 의 `response_model` 경로와 같다.
+- adapter per call: 요청마다 TypeAdapter 를 새로 만들고 `dump_json`
+- cached adapter: `TypedJSONResponse` (타입마다 한 번 만든 TypeAdapter 로 검증하고 바로 bytes)
+
+페이로드는 `GET /bookings`(list[BookingOut]), `GET /guest-calendar/bookings`(PaginatedBookingOut),
+`GET /calendar/{host}/bookings`(부킹 25개 + Google 이벤트 25개)와 같은 모양이다.
+
+이어서 `GET /bookings` 한 쪽을 기본 형식과 `?format=compact`(타임슬롯·호스트를 included 에 한 번씩)로 만들어 크기와 시간을 비교한다.
+
+    python -m benchmarks.response_serialization --repeat 2000
+"""
+import argparse
+import time
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from typing import Any, Callable
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.endpoints import compact_bookings
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+from appserver.apps.calendar.schemas import (
+    BookingOut,
+    CalendarBookingOut,
+    CompactBookingListOut,
+    GoogleCalendarEventOut,
+    PaginatedBookingOut,
+    SimpleBookingOut,
+    TimeSlotOut,
+)
+from appserver.libs.responses import TypedJSONResponse
+
+
+PAGE_SIZE = 50
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def make_bookings(count: int) -> list[Booking]:
+    host = User(id=1, username="bench_host", email="bench_host@example.com", display_name="벤치마크 호스트", hashed_password="-", is_host=True)
+    calendar = Calendar(id=1, host_id=host.id, host=host, topics=["벤치마크"], description="-", google_calendar_id="bench@example.com")
+    time_slots = [
+        TimeSlot(
+            id=hour + 1,
+            calendar_id=calendar.id,
+            calendar=calendar,
+            start_time=dt_time(9 + hour),
+            end_time=dt_time(10 + hour),
+            weekdays=list(range(5)),
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        for hour in range(8)
+    ]
+    return [
+        Booking(
+            id=index + 1,
+            when=date(2026, 3, 1) + timedelta(days=index % 28),
+            topic=f"상담 {index}",
+            description="부킹 설명입니다. " * 30,
+            time_slot_id=time_slots[index % len(time_slots)].id,
+            time_slot=time_slots[index % len(time_slots)],
+            guest_id=2,
+            files=[],
+            google_event_id=f"event{index}",
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        for index in range(count)
+    ]
+
+
+def make_calendar_items(count: int) -> list[CalendarBookingOut]:
+    bookings = [
+        SimpleBookingOut.model_construct(id=booking.id, when=booking.when, time_slot=TimeSlotOut.model_validate(booking.time_slot))
+        for booking in make_bookings(count // 2)
+    ]
+    events = [
+        GoogleCalendarEventOut.model_validate({
+            "id": f"event{index}",
+            "start": {"dateTime": f"2026-03-{index % 28 + 1:02d}T10:00:00+09:00"},
+            "end": {"dateTime": f"2026-03-{index % 28 + 1:02d}T11:00:00+09:00"},
+        })
+        for index in range(count - len(bookings))
+    ]
+    return bookings + events
+
+
+def json_dumps(content: Any, response_type: Any) -> bytes:
+    adapter = TypeAdapter(response_type)
+    value = adapter.validate_python(content, from_attributes=True)
+    return JSONResponse(adapter.dump_python(value, mode="json")).body
+
+
+def adapter_per_call(content: Any, response_type: Any) -> bytes:
+    adapter = TypeAdapter(response_type)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def cached_adapter(content: Any, response_type: Any) -> bytes:
+    return TypedJSONResponse(content, response_type).body
+
+
+CASES: dict[str, Callable[[Any, Any], bytes]] = {
+    "json.dumps": json_dumps,
+    "adapter per call": adapter_per_call,
+    "cached adapter": cached_adapter,
+}
+
+
+FORMATS: dict[str, Callable[[list[Booking]], bytes]] = {
+    "full": lambda bookings: cached_adapter(bookings, list[BookingOut]),
+    "compact": lambda bookings: cached_adapter(compact_bookings(bookings), CompactBookingListOut),
+}
+
+
+def measure(render: Callable[[], bytes], repeat: int) -> dict:
+    body = render()
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        render()
+    elapsed = time.perf_counter() - started_at
+    return {
+        "bytes": len(body),
+        "pages/s": repeat / elapsed,
+        "us/page": elapsed / repeat * 1_000_000,
+    }
+
+
+def format_metrics(result: dict) -> str:
+    return " ".join(
+        f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+        for key, value in result.items()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    bookings = make_bookings(PAGE_SIZE)
+    payloads = {
+        "list[BookingOut]": (bookings, list[BookingOut]),
+        "PaginatedBookingOut": ({"bookings": bookings, "total_count": 1234}, PaginatedBookingOut),
+        "list[SimpleBookingOut | GoogleCalendarEventOut]": (make_calendar_items(PAGE_SIZE), list[CalendarBookingOut]),
+    }
+
+    for name, (content, response_type) in payloads.items():
+        print(name)
+        # 세 방법이 같은 JSON 을 만드는지 먼저 확인한다.
+        bodies = {case(content, response_type) for case in CASES.values()}
+        assert len(bodies) == 1, f"{name}: 직렬화 결과가 다릅니다"
+        for case_name, case in CASES.items():
+            result = measure(lambda: case(content, response_type), args.repeat)
+            print(f"  {case_name:>16}: {format_metrics(result)}")
+
+    print("GET /bookings 형식 (cached adapter)")
+    for format_name, render in FORMATS.items():
+        result = measure(lambda: render(bookings), args.repeat)
+        print(f"  {format_name:>16}: {format_metrics(result)}")
+
+
+if __name__ == "__main__":
+    main()
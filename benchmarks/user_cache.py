@@ -0,0 +1,113 @@
+"""
+인증된 사용자 캐시 효과: 인증이 필요한 엔드포인트(`GET /account/@me`) 처리량 비교
+
+임시 SQLite 파일 DB 에 호스트와 캘린더를 만들고, 같은 토큰으로 요청을 정해진 동시성으로 보낸다.
+요청마다 새 세션을 쓰므로 운영 환경처럼 캐시가 없으면 매번 users JOIN calendars 조회가 나간다.
+
+    python -m benchmarks.user_cache --requests 2000 --concurrency 20
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from sqlmodel import SQLModel
+
+from appserver.app import include_routers
+from appserver.apps.account import deps as account_deps
+from appserver.apps.account.cache import UserCache
+from appserver.apps.account.models import User
+from appserver.apps.account.utils import create_access_token, hash_password
+from appserver.apps.calendar.models import Calendar
+from appserver.db import create_engine, create_session, use_session
+
+
+async def run(client: httpx.AsyncClient, requests: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def _one():
+        async with semaphore:
+            started_at = time.perf_counter()
+            response = await client.get("/account/@me")
+            latencies.append(time.perf_counter() - started_at)
+            assert response.status_code == 200, response.text
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*[_one() for _ in range(requests)])
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        "req/s": requests / elapsed,
+        "p50 ms": statistics.median(latencies) * 1000,
+        "p95 ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite+aiosqlite:///{Path(tmpdir) / 'bench.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        session_factory = create_session(engine)
+
+        async with session_factory() as session:
+            user = User(
+                username="bench_host",
+                email="bench_host@example.com",
+                display_name="벤치마크 호스트",
+                hashed_password=hash_password("testtest"),
+                is_host=True,
+            )
+            session.add(user)
+            await session.flush()
+            session.add(Calendar(
+                host_id=user.id,
+                topics=["벤치마크"],
+                description="벤치마크 캘린더입니다.",
+                google_calendar_id="bench@example.com",
+            ))
+            await session.commit()
+
+        app = FastAPI()
+        include_routers(app)
+
+        async def override_use_session():
+            async with session_factory() as session:
+                yield session
+
+        app.dependency_overrides[use_session] = override_use_session
+        token = create_access_token({"sub": "bench_host"})
+
+        original_cache = account_deps.user_cache
+        # ttl=0 인 캐시는 항상 미스라서 캐시가 없는 것과 같다.
+        cases = {"no cache": UserCache(ttl=0), "user cache": UserCache()}
+        try:
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://bench",
+                headers={"Authorization": f"Bearer {token}"},
+            ) as client:
+                for name, cache in cases.items():
+                    account_deps.user_cache = cache
+                    await run(client, min(args.requests, 100), args.concurrency)  # 워밍업
+                    result = await run(client, args.requests, args.concurrency)
+                    metrics = " ".join(f"{key}={value:.1f}" for key, value in result.items())
+                    print(f"{name:>10}: {metrics} hit_rate={cache.stats()['hit_rate']:.3f}")
+        finally:
+            account_deps.user_cache = original_cache
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
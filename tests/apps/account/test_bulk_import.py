@@ -0,0 +1,160 @@
+import io
+import json
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqladmin import Admin
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.apps.account.admin import UserImportAdmin
+from appserver.apps.account.bulk_import import import_users, read_binary_records, read_csv, read_ndjson
+from appserver.apps.account.cache import host_directory_cache
+from appserver.apps.account.hashing import Argon2Params, PasswordHashingService
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Calendar
+from appserver.db import create_session
+
+
+FAST_PARAMS = Argon2Params(time_cost=1, memory_cost=1024, parallelism=1)
+
+
+@pytest.fixture()
+def hasher():
+    service = PasswordHashingService(FAST_PARAMS, executor="inline")
+    yield service
+    service.shutdown()
+
+
+CSV_CONTENT = """username,email,display_name,password,is_host,calendar_topics,calendar_description,google_calendar_id
+import_host,import_host@example.com,가져온 호스트,testtest,true,회의|상담,가져온 호스트의 캘린더입니다.,import_host@gmail.com
+import_guest,import_guest@example.com,,testtest,false,,,
+"""
+
+
+async def test_CSV_파일로_사용자와_호스트_캘린더를_만든다(db_session: AsyncSession, hasher: PasswordHashingService):
+    report = await import_users(
+        db_session,
+        read_csv(io.StringIO(CSV_CONTENT)),
+        hasher=hasher,
+        create_calendars=True,
+    )
+
+    assert report.errors == []
+    assert (report.processed, report.created, report.calendars_created) == (2, 2, 1)
+    assert report.rows_per_second > 0
+
+    users = {user.username: user for user in (await db_session.execute(select(User))).scalars().unique()}
+    assert users["import_host"].is_host is True
+    assert users["import_guest"].display_name == "import_guest"
+    assert hasher.verify("testtest", users["import_guest"].hashed_password)
+
+    calendar = (await db_session.execute(select(Calendar))).scalar_one()
+    assert calendar.host_id == users["import_host"].id
+    assert calendar.topics == ["회의", "상담"]
+
+
+async def test_잘못된_행은_건너뛰고_줄_번호와_이유를_남긴다(
+    db_session: AsyncSession,
+    hasher: PasswordHashingService,
+    host_user: User,
+):
+    lines = [
+        json.dumps({"username": "valid_user1", "email": "valid_user1@example.com", "password": "testtest"}),
+        "{not json",
+        json.dumps({"username": "no_email", "password": "testtest"}),
+        json.dumps({"username": "valid_user1", "email": "other@example.com", "password": "testtest"}),
+        json.dumps({"username": host_user.username, "email": "new@example.com", "password": "testtest"}),
+        json.dumps({"username": "valid_user2", "email": "valid_user2@example.com", "password": "testtest"}),
+    ]
+
+    # 묶음 크기를 작게 해서 여러 묶음에 걸쳐 처리되게 한다.
+    report = await import_users(
+        db_session,
+        read_ndjson(io.StringIO("\n".join(lines))),
+        hasher=hasher,
+        batch_size=2,
+    )
+
+    assert (report.processed, report.created) == (6, 2)
+    assert [error.line for error in report.errors] == [2, 3, 4, 5]
+    assert report.errors[3].message == "이미 있는 사용자 계정 ID 입니다."
+
+    usernames = (await db_session.execute(select(User.username))).scalars().all()
+    assert {"valid_user1", "valid_user2"} <= set(usernames)
+
+
+async def test_UTF_8_이_아닌_줄은_그_행만_오류로_남기고_나머지는_가져온다(
+    db_session: AsyncSession,
+    hasher: PasswordHashingService,
+):
+    content = (
+        "\ufeffusername,email,display_name,password\n".encode()
+        + "valid_user1,valid_user1@example.com,첫째사용자,testtest\n".encode()
+        + "cp949_user,cp949_user@example.com,둘째사용자,testtest\n".encode("cp949")
+        + "valid_user2,valid_user2@example.com,셋째사용자,testtest\n".encode()
+    )
+
+    report = await import_users(db_session, read_binary_records(io.BytesIO(content), "csv"), hasher=hasher)
+
+    assert (report.processed, report.created) == (3, 2)
+    assert [(error.line, error.message) for error in report.errors] == [(3, "UTF-8 로 읽을 수 없는 줄입니다.")]
+    usernames = (await db_session.execute(select(User.username))).scalars().all()
+    assert {"valid_user1", "valid_user2"} <= set(usernames)
+
+
+@pytest.fixture()
+def admin_client(db_session: AsyncSession) -> TestClient:
+    app = FastAPI()
+    admin = Admin(app, session_maker=create_session(db_session.bind), templates_dir="appserver/templates")
+    admin.add_view(UserImportAdmin)
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.parametrize("files, data, message", [
+    (None, {"format": ""}, "가져올 파일을 선택해 주세요."),
+    ({"file": ("", b"")}, {"format": ""}, "가져올 파일을 선택해 주세요."),
+    ({"file": ("users.xml", b"x")}, {"format": "xml"}, "지원하지 않는 파일 형식입니다: xml"),
+])
+def test_관리자_화면에서_파일이_없거나_형식이_잘못되면_읽을_수_있는_오류를_보여준다(
+    admin_client: TestClient,
+    files,
+    data,
+    message,
+):
+    response = admin_client.post("/admin/users/import", files=files, data=data)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert message in response.text
+
+
+async def test_캘린더_정보가_잘못된_호스트는_만들지_않는다(db_session: AsyncSession, hasher: PasswordHashingService):
+    content = "username,email,password,is_host,google_calendar_id\nbad_host,bad_host@example.com,testtest,true,bad_host@gmail.com\n"
+
+    report = await import_users(db_session, read_csv(io.StringIO(content)), hasher=hasher, create_calendars=True)
+
+    assert report.created == 0
+    assert report.errors[0].line == 2
+    assert (await db_session.execute(select(User).where(User.username == "bad_host"))).first() is None
+
+
+async def test_가져오면_호스트_목록_캐시를_비운다(db_session: AsyncSession, hasher: PasswordHashingService):
+    generation = host_directory_cache.generation
+
+    await import_users(db_session, read_csv(io.StringIO(CSV_CONTENT)), hasher=hasher)
+
+    assert host_directory_cache.generation == generation + 1
+
+
+async def test_프로세스_풀에서_비밀번호를_해싱한다(db_session: AsyncSession):
+    service = PasswordHashingService(FAST_PARAMS, executor="process", max_workers=2)
+    try:
+        report = await import_users(db_session, read_csv(io.StringIO(CSV_CONTENT)), hasher=service)
+    finally:
+        service.shutdown()
+
+    assert report.created == 2
+    user = (await db_session.execute(select(User).where(User.username == "import_host"))).scalar_one()
+    assert service.verify("testtest", user.hashed_password)
@@ -0,0 +1,115 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.account.cache import host_directory_cache
+from appserver.apps.account.endpoints import NEXT_CURSOR_HEADER
+from appserver.apps.account.enums import AccountStatus
+from appserver.apps.account.models import User
+
+
+@pytest.fixture()
+async def hosts(db_session: AsyncSession) -> list[User]:
+    users = [
+        User(
+            username=f"host{index:02d}",
+            hashed_password="hashed",
+            email=f"host{index:02d}@example.com",
+            display_name=f"호스트 {index:02d}",
+            is_host=True,
+        )
+        for index in range(5)
+    ]
+    # 호스트가 아니거나 탈퇴한 사용자는 목록에 나오지 않는다.
+    users.append(User(
+        username="host_guest",
+        hashed_password="hashed",
+        email="host_guest@example.com",
+        display_name="게스트",
+        is_host=False,
+    ))
+    users.append(User(
+        username="host_withdrawn",
+        hashed_password="hashed",
+        email="host_withdrawn@example.com",
+        display_name="탈퇴 호스트",
+        is_host=True,
+        status=AccountStatus.WITHDRAWAL.value,
+    ))
+    db_session.add_all(users)
+    await db_session.commit()
+    return users
+
+
+def test_커서로_호스트_목록을_끝까지_넘겨_볼_수_있다(client_with_guest_auth: TestClient, hosts: list[User]):
+    usernames = []
+    params = {"limit": 2}
+    for _ in range(5):
+        response = client_with_guest_auth.get("/account/hosts", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) <= 2
+        usernames.extend(item["username"] for item in response.json())
+
+        next_cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if next_cursor is None:
+            break
+        params = {"limit": 2, "cursor": next_cursor}
+
+    assert usernames == [f"host{index:02d}" for index in range(5)]
+
+
+@pytest.mark.parametrize("q, expected", [
+    ("host0", [f"host{index:02d}" for index in range(5)]),
+    ("호스트 03", ["host03"]),
+    ("host_", []),
+    ("없음", []),
+])
+def test_사용자_계정_ID나_표시_이름_앞부분으로_호스트를_찾는다(
+    client_with_guest_auth: TestClient,
+    hosts: list[User],
+    q: str,
+    expected: list[str],
+):
+    response = client_with_guest_auth.get("/account/hosts", params={"q": q})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["username"] for item in response.json()] == expected
+
+
+def test_잘못된_커서는_422_응답을_한다(client_with_guest_auth: TestClient, hosts: list[User]):
+    response = client_with_guest_auth.get("/account/hosts", params={"cursor": "invalid"})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_같은_페이지는_캐시에서_돌려주고_호스트가_바뀌면_다시_읽는다(
+    client_with_guest_auth: TestClient,
+    hosts: list[User],
+    user_queries: list,
+):
+    first = client_with_guest_auth.get("/account/hosts")
+    second = client_with_guest_auth.get("/account/hosts")
+
+    assert first.json() == second.json()
+    assert len(user_queries) == 1
+
+    host_directory_cache.invalidate()
+    third = client_with_guest_auth.get("/account/hosts")
+
+    assert third.json() == first.json()
+    assert len(user_queries) == 2
+
+
+def test_호스트가_표시_이름을_바꾸면_목록에_바로_반영된다(
+    client_with_auth: TestClient,
+    host_user: User,
+):
+    response = client_with_auth.get("/account/hosts")
+    assert [item["display_name"] for item in response.json()] == ["푸딩캠프"]
+
+    response = client_with_auth.patch("/account/@me", json={"display_name": "새 이름의 캠프"})
+    assert response.status_code == status.HTTP_200_OK
+
+    response = client_with_auth.get("/account/hosts")
+    assert [item["display_name"] for item in response.json()] == ["새 이름의 캠프"]
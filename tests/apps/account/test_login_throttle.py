@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from appserver.apps.account import endpoints
+from appserver.apps.account.exceptions import TooManyLoginAttemptsError
+from appserver.apps.account.models import User
+from appserver.apps.account.throttle import (
+    BucketPolicy,
+    LoginThrottle,
+    MemoryTokenBucketStore,
+    SqliteTokenBucketStore,
+    USERNAME_POLICY,
+)
+
+
+def test_같은_계정으로_계속_틀리면_DB_조회_전에_429로_거절한다(
+    client: TestClient,
+    host_user: User,
+    user_queries: list,
+):
+    payload = {"username": host_user.username, "password": "wrong_password"}
+    for _ in range(int(USERNAME_POLICY.burst)):
+        response = client.post("/account/login", json=payload)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    queries_before = len(user_queries)
+
+    response = client.post("/account/login", json={"username": host_user.username, "password": "testtest"})
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) > 0
+    assert len(user_queries) == queries_before
+
+
+def test_로그인에_성공하면_계정_버킷을_쓰지_않는다(client: TestClient, host_user: User):
+    # 여러 기기에서 다시 로그인해도 계정 제한에 걸리지 않는다.
+    for _ in range(int(USERNAME_POLICY.burst) * 2):
+        response = client.post("/account/login", json={"username": host_user.username, "password": "testtest"})
+        assert response.status_code == status.HTTP_200_OK
+
+    # 틀린 시도는 여전히 계정 버킷을 쓴다.
+    payload = {"username": host_user.username, "password": "wrong_password"}
+    for _ in range(int(USERNAME_POLICY.burst)):
+        response = client.post("/account/login", json=payload)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = client.post("/account/login", json=payload)
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+
+def test_한_IP에서_여러_계정으로_시도해도_제한한다(client: TestClient, monkeypatch: pytest.MonkeyPatch):
+    throttle = LoginThrottle(
+        MemoryTokenBucketStore(),
+        username_policy=BucketPolicy(burst=5, rate=1),
+        ip_policy=BucketPolicy(burst=3, rate=0.01),
+    )
+    monkeypatch.setattr(endpoints, "login_throttle", throttle)
+
+    statuses = [
+        client.post("/account/login", json={"username": f"someone{index}", "password": "testtest"}).status_code
+        for index in range(4)
+    ]
+
+    assert statuses == [status.HTTP_404_NOT_FOUND] * 3 + [status.HTTP_429_TOO_MANY_REQUESTS]
+    assert throttle.rejected == 1
+
+
+async def test_SQLite_저장소는_워커들이_버킷을_함께_쓴다(tmp_path: Path):
+    path = (tmp_path / "throttle.sqlite3").as_posix()
+    policy = BucketPolicy(burst=2, rate=0.01)
+    worker_a = LoginThrottle(SqliteTokenBucketStore(path), username_policy=policy, timer=lambda: 1000.0)
+    worker_b = LoginThrottle(SqliteTokenBucketStore(path), username_policy=policy, timer=lambda: 1000.0)
+
+    await worker_a.check("puddingcamp", None)
+    await worker_b.check("puddingcamp", None)
+    with pytest.raises(TooManyLoginAttemptsError):
+        await worker_a.check("puddingcamp", None)
+
+
+async def test_SQLite_저장소도_성공한_로그인의_토큰을_돌려준다(tmp_path: Path):
+    path = (tmp_path / "throttle.sqlite3").as_posix()
+    policy = BucketPolicy(burst=1, rate=0.01)
+    throttle = LoginThrottle(SqliteTokenBucketStore(path), username_policy=policy, timer=lambda: 1000.0)
+
+    await throttle.check("puddingcamp", None)
+    await throttle.succeeded("puddingcamp")
+    await throttle.check("puddingcamp", None)
+    with pytest.raises(TooManyLoginAttemptsError):
+        await throttle.check("puddingcamp", None)
@@ -0,0 +1,47 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.account import utils
+from appserver.apps.account.hashing import Argon2Params, PasswordHashingService
+from appserver.apps.account.models import User
+
+
+FAST_PARAMS = Argon2Params(time_cost=1, memory_cost=1024, parallelism=1)
+
+
+@pytest.mark.parametrize("executor", ["inline", "thread", "process"])
+async def test_풀에서_해싱하고_검증한다(executor: str):
+    service = PasswordHashingService(FAST_PARAMS, executor=executor, max_workers=1)
+    try:
+        hashed = await service.ahash("testtest")
+
+        assert await service.averify("testtest", hashed) is True
+        assert await service.averify("wrong_password", hashed) is False
+    finally:
+        service.shutdown()
+
+
+def test_지원하지_않는_실행_방식이면_오류가_난다():
+    with pytest.raises(ValueError):
+        PasswordHashingService(FAST_PARAMS, executor="gpu")
+
+
+async def test_argon2_인자가_바뀌면_로그인할_때_새_인자로_다시_해싱한다(
+    client: TestClient,
+    host_user: User,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    before_password = host_user.hashed_password
+    service = PasswordHashingService(FAST_PARAMS, executor="inline")
+    monkeypatch.setattr(utils, "password_hasher", service)
+
+    response = client.post("/account/login", json={"username": host_user.username, "password": "testtest"})
+    assert response.status_code == status.HTTP_200_OK
+
+    await db_session.refresh(host_user)
+    assert host_user.hashed_password != before_password
+    assert "m=1024,t=1,p=1" in host_user.hashed_password
+    assert service.verify("testtest", host_user.hashed_password)
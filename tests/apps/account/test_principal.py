@@ -0,0 +1,60 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appserver.apps.account import principal
+from appserver.apps.account.cache import user_cache
+from appserver.apps.account.models import User
+
+
+GUEST_BOOKINGS_URL = "/guest-calendar/bookings?page=1&page_size=10"
+
+
+def test_신선한_토큰이면_사용자를_조회하지_않는다(client_with_guest_auth: TestClient, user_queries: list):
+    response = client_with_guest_auth.get(GUEST_BOOKINGS_URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert user_queries == []
+
+
+def test_오래된_토큰이면_사용자를_다시_읽는다(
+    client_with_guest_auth: TestClient,
+    user_queries: list,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(principal, "PRINCIPAL_MAX_STALENESS", -1)
+
+    response = client_with_guest_auth.get(GUEST_BOOKINGS_URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(user_queries) == 1
+
+
+def test_사용자가_바뀐_뒤에는_이전_토큰의_클레임을_믿지_않는다(
+    client_with_guest_auth: TestClient,
+    guest_user: User,
+    user_queries: list,
+):
+    user_cache.invalidate(guest_user.username)
+
+    response = client_with_guest_auth.get(GUEST_BOOKINGS_URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(user_queries) == 1
+
+
+async def test_토큰_버전이_올라가면_이전_토큰을_거부한다(
+    client_with_guest_auth: TestClient,
+    guest_user: User,
+    db_session: AsyncSession,
+):
+    guest_user.token_version += 1
+    await db_session.commit()
+    user_cache.invalidate(guest_user.username)
+
+    response = client_with_guest_auth.get(GUEST_BOOKINGS_URL)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = client_with_guest_auth.get("/account/@me")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,69 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI, status
+from sqlmodel import SQLModel, func, select
+
+from appserver.app import include_routers
+from appserver.apps.account.models import User
+from appserver.db import create_engine, create_session, use_session
+
+
+@pytest.fixture()
+async def concurrent_client(tmp_path):
+    # 요청마다 세션(연결)을 따로 써야 실제로 동시에 INSERT 한다. 테스트 공용 세션 대신 파일 DB 를 쓴다.
+    engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'signup.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session_factory = create_session(engine)
+
+    app = FastAPI()
+    include_routers(app)
+
+    async def override_use_session():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[use_session] = override_use_session
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client, session_factory
+    await engine.dispose()
+
+
+def make_payload(username: str, email: str) -> dict:
+    return {
+        "username": username,
+        "email": email,
+        "display_name": "동시 가입",
+        "password": "test테스트1234",
+        "password_again": "test테스트1234",
+    }
+
+
+@pytest.mark.parametrize("field, detail", [
+    ("username", "중복된 계정 ID입니다."),
+    ("email", "중복된 E-mail 주소입니다."),
+])
+async def test_같은_계정으로_동시에_가입하면_한_명만_성공한다(concurrent_client, field: str, detail: str):
+    client, session_factory = concurrent_client
+    payloads = [
+        make_payload(
+            "racer" if field == "username" else f"racer{index}",
+            "racer@example.com" if field == "email" else f"racer{index}@example.com",
+        )
+        for index in range(8)
+    ]
+
+    responses = await asyncio.gather(*(client.post("/account/signup", json=payload) for payload in payloads))
+
+    status_codes = sorted(response.status_code for response in responses)
+    assert status_codes == [status.HTTP_201_CREATED] + [status.HTTP_422_UNPROCESSABLE_ENTITY] * 7
+    assert {
+        response.json()["detail"]
+        for response in responses
+        if response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    } == {detail}
+
+    async with session_factory() as session:
+        assert (await session.execute(select(func.count()).select_from(User))).scalar_one() == 1
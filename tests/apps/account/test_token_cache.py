@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from appserver.apps.account import utils
+from appserver.apps.account.utils import create_access_token, decode_token, verified_token_cache
+
+
+@pytest.fixture()
+def jwt_decode_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls = []
+    original = utils.jwt.decode
+
+    def _decode(token, *args, **kwargs):
+        calls.append(token)
+        return original(token, *args, **kwargs)
+
+    monkeypatch.setattr(utils.jwt, "decode", _decode)
+    return calls
+
+
+def test_같은_토큰을_다시_디코드하면_서명_검증을_건너뛴다(jwt_decode_calls: list[str]):
+    token = create_access_token({"sub": "puddingcamp"})
+
+    assert decode_token(token)["sub"] == "puddingcamp"
+    assert decode_token(token)["sub"] == "puddingcamp"
+    assert len(jwt_decode_calls) == 1
+
+
+def test_디코드한_클레임을_고쳐도_캐시는_바뀌지_않는다():
+    token = create_access_token({"sub": "puddingcamp"})
+
+    decode_token(token)["sub"] = "someone_else"
+
+    assert decode_token(token)["sub"] == "puddingcamp"
+
+
+def test_만료된_토큰은_캐시하지_않는다(jwt_decode_calls: list[str]):
+    token = create_access_token({"sub": "puddingcamp"}, timedelta(hours=-1))
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            decode_token(token)
+    assert len(jwt_decode_calls) == 2
+    assert len(verified_token_cache) == 0
+
+
+def test_로그아웃하면_토큰이_캐시에서_빠진다(client_with_auth: TestClient):
+    response = client_with_auth.get("/account/@me")
+    assert response.status_code == status.HTTP_200_OK
+    assert len(verified_token_cache) == 1
+
+    response = client_with_auth.delete("/account/logout")
+    assert response.status_code == status.HTTP_200_OK
+    assert len(verified_token_cache) == 0
+
+
+def test_탈퇴한_사용자의_토큰은_캐시되어_있어도_거부된다(client_with_auth: TestClient):
+    token = client_with_auth.cookies.get("auth_token", domain="", path="/")
+    client_with_auth.get("/account/@me")
+
+    response = client_with_auth.delete("/account/unregister")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert len(verified_token_cache) == 0
+
+    # 탈퇴하면 토큰도 철회된다.
+    client_with_auth.cookies.set("auth_token", token)
+    response = client_with_auth.get("/account/@me")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
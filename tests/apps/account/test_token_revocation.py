@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.apps.account.models import RevokedToken
+from appserver.apps.account.revocation import RevocationList, purge_expired_revocations, revocation_list
+
+
+async def jtis(db_session: AsyncSession) -> set[str]:
+    return set((await db_session.execute(select(RevokedToken.jti))).scalars())
+
+
+def test_로그아웃한_토큰은_다시_쓸_수_없다(client_with_guest_auth: TestClient):
+    token = client_with_guest_auth.cookies.get("auth_token", domain="", path="/")
+
+    response = client_with_guest_auth.delete("/account/logout")
+    assert response.status_code == status.HTTP_200_OK
+
+    client_with_guest_auth.cookies.set("auth_token", token)
+    response = client_with_guest_auth.get("/account/@me")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = client_with_guest_auth.get("/guest-calendar/bookings?page=1&page_size=10")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_철회되지_않은_토큰은_철회_테이블을_조회하지_않는다(client_with_guest_auth: TestClient):
+    for _ in range(3):
+        response = client_with_guest_auth.get("/account/@me")
+        assert response.status_code == status.HTTP_200_OK
+
+    stats = revocation_list.stats()
+    assert stats["probes"] == 3
+    assert stats["lookups"] == 0
+
+
+async def test_다른_워커가_철회한_토큰은_갱신_주기_뒤에_반영된다(db_session: AsyncSession):
+    now = [0.0]
+    worker_a = RevocationList(capacity=1000, refresh_interval=5, timer=lambda: now[0])
+    worker_b = RevocationList(capacity=1000, refresh_interval=5, timer=lambda: now[0])
+    await worker_b.refresh(db_session)
+
+    await worker_a.revoke(db_session, "stolen-token", datetime.now(timezone.utc) + timedelta(minutes=30))
+
+    assert await worker_a.is_revoked("stolen-token", db_session) is True
+    assert await worker_b.is_revoked("stolen-token", db_session) is False
+
+    now[0] = 5
+    assert await worker_b.is_revoked("stolen-token", db_session) is True
+    assert await worker_b.is_revoked("other-token", db_session) is False
+
+
+async def test_필터를_다시_만들면_만료된_철회는_빠지고_요청_세션은_커밋하지_않는다(db_session: AsyncSession):
+    now = [0.0]
+    worker = RevocationList(capacity=1000, refresh_interval=5, rebuild_interval=60, timer=lambda: now[0])
+    await worker.revoke(db_session, "expired-token", datetime.now(timezone.utc) - timedelta(minutes=1))
+    await worker.revoke(db_session, "live-token", datetime.now(timezone.utc) + timedelta(minutes=30))
+
+    commits = []
+    event.listen(db_session.sync_session, "after_commit", commits.append)
+    now[0] = 60
+    await worker.refresh(db_session)
+
+    assert worker.stats()["size"] == 1
+    assert await worker.is_revoked("live-token", db_session) is True
+    assert await worker.is_revoked("expired-token", db_session) is False
+    # 인증 의존성에서 불리므로 요청 세션을 커밋하거나 행을 지우지 않는다.
+    assert commits == []
+    assert await jtis(db_session) == {"expired-token", "live-token"}
+
+
+async def test_만료된_철회_기록은_별도_세션에서_지운다(db_session: AsyncSession):
+    await revocation_list.revoke(db_session, "expired-token", datetime.now(timezone.utc) - timedelta(minutes=1))
+    await revocation_list.revoke(db_session, "live-token", datetime.now(timezone.utc) + timedelta(minutes=30))
+
+    assert await purge_expired_revocations(db_session) == 1
+    assert await jtis(db_session) == {"live-token"}
@@ -0,0 +1,64 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.apps.account.cache import user_cache
+from appserver.apps.account.models import User
+from appserver.apps.calendar.models import Calendar
+
+
+async def test_같은_토큰으로_다시_요청하면_캐시된_사용자를_쓴다(client_with_auth: TestClient):
+    for _ in range(3):
+        response = client_with_auth.get("/account/@me")
+        assert response.status_code == status.HTTP_200_OK
+
+    stats = user_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+    assert stats["hit_rate"] == 2 / 3
+
+
+async def test_캐시된_사용자는_세션에_다시_붙어서_변경이_반영된다(
+    client_with_auth: TestClient,
+    host_user_calendar: Calendar,
+    db_session: AsyncSession,
+):
+    response = client_with_auth.get("/account/@me")
+    assert response.status_code == status.HTTP_200_OK
+
+    # 다른 요청의 세션처럼 아무 인스턴스도 들고 있지 않은 상태를 만든다.
+    db_session.expunge_all()
+
+    response = client_with_auth.patch("/calendar", json={"description": "캐시에서 꺼낸 사용자로 바꾼 설명입니다."})
+    assert response.status_code == status.HTTP_200_OK
+    assert user_cache.stats()["hits"] == 1
+
+    db_session.expunge_all()
+    result = await db_session.execute(select(Calendar).where(Calendar.id == host_user_calendar.id))
+    assert result.scalar_one().description == "캐시에서 꺼낸 사용자로 바꾼 설명입니다."
+
+
+async def test_사용자_정보를_바꾸면_캐시가_무효화된다(client_with_auth: TestClient, host_user: User):
+    client_with_auth.get("/account/@me")
+    assert user_cache.stats()["size"] == 1
+
+    response = client_with_auth.patch("/account/@me", json={"display_name": "바뀐 표시 이름"})
+    assert response.status_code == status.HTTP_200_OK
+    assert user_cache.stats()["size"] == 0
+
+
+async def test_캘린더를_만들면_캐시가_무효화된다(client_with_auth: TestClient):
+    client_with_auth.get("/account/@me")
+    assert user_cache.stats()["size"] == 1
+
+    response = client_with_auth.post("/calendar", json={
+        "topics": ["푸딩캠프"],
+        "description": "캐시 무효화를 확인하는 캘린더입니다.",
+        "google_calendar_id": "cache-test@group.calendar.google.com",
+    })
+    assert response.status_code == status.HTTP_201_CREATED
+    assert user_cache.stats()["size"] == 0
+
+    response = client_with_auth.get("/account/@me")
+    assert response.status_code == status.HTTP_200_OK
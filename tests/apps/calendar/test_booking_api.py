@@ -1,30 +1,29 @@
+import asyncio
 import calendar
-from datetime import date
+from datetime import date, datetime, timezone
+import json
 import os
 
+import httplib2
 import pytest
+from googleapiclient.errors import HttpError
 from pytest_lazy_fixtures import lf
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from appserver.apps.calendar import endpoints
 from appserver.apps.calendar.enums import AttendanceStatus
 from appserver.apps.calendar.schemas import BookingOut
 from appserver.apps.account.models import User
 from appserver.apps.calendar.models import Booking, TimeSlot
 from appserver.libs.datetime.calendar import get_next_weekday
+from appserver.libs.google.calendar.breaker import CircuitBreaker
+from appserver.libs.google.calendar.cache import EventListCache
+from appserver.libs.google.calendar.deps import get_google_calendar_service
+from appserver.libs.google.calendar.fake import FakeGoogleCalendarBackend
 from appserver.libs.google.calendar.services import GoogleCalendarService
 
 
-@pytest.fixture()
-def calendar_id() -> str:
-    return os.getenv("GOOGLE_CALENDAR_ID")
-
-
-@pytest.fixture()
-def google_calendar_service(calendar_id: str) -> GoogleCalendarService:
-    return GoogleCalendarService(default_google_calendar_id=calendar_id)
-
-
 @pytest.fixture()
 def valid_booking_payload(time_slot_tuesday: TimeSlot):
     return {
@@ -189,6 +188,251 @@ async def test_게스트는_호스트의_캘린더의_예약_내역을_월_단
     assert all([item["when"] in booking_dates for item in data])
  
 
+class UnavailableCalendarResource:
+    def events(self):
+        return self
+
+    def list(self, **kwargs):
+        return self
+
+    def execute(self):
+        raise HttpError(httplib2.Response({"status": 503}), b"backend error")
+
+
+async def test_구글_캘린더가_응답하지_않으면_DB_부킹과_캐시된_일정만_오래된_데이터로_표시해_응답한다(
+    fastapi_app,
+    db_session,
+    client_with_guest_auth: TestClient,
+    host_user: User,
+    host_user_calendar,
+    time_slot_tuesday: TimeSlot,
+    guest_user: User,
+):
+    for when in [date(2026, 3, 3), date(2026, 3, 10)]:
+        db_session.add(Booking(
+            when=when,
+            topic="test",
+            description="test",
+            time_slot_id=time_slot_tuesday.id,
+            guest_id=guest_user.id,
+        ))
+    await db_session.commit()
+
+    event_cache = EventListCache()
+    time_min = datetime(2026, 3, 1).astimezone(timezone.utc)
+    time_max = datetime(2026, 3, 31).astimezone(timezone.utc)
+    cached_event = {
+        "id": "cached-event",
+        "start": {"dateTime": "2026-03-05T10:00:00+09:00"},
+        "end": {"dateTime": "2026-03-05T11:00:00+09:00"},
+    }
+    key = EventListCache.make_key(host_user_calendar.google_calendar_id, time_min, time_max)
+    event_cache._cache.set(key, [cached_event], ttl=0)
+
+    service = GoogleCalendarService(
+        default_google_calendar_id=host_user_calendar.google_calendar_id,
+        event_cache=event_cache,
+        service=UnavailableCalendarResource(),
+        breaker=CircuitBreaker(),
+    )
+    fastapi_app.dependency_overrides[get_google_calendar_service] = lambda: service
+
+    response = client_with_guest_auth.get(
+        f"/calendar/{host_user.username}/bookings",
+        params={"year": 2026, "month": 3},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Google-Calendar-Stale"] == "true"
+    data = response.json()
+    assert sorted(item["when"] for item in data) == ["2026-03-03", "2026-03-05", "2026-03-10"]
+    assert "cached-event" in [item["id"] for item in data]
+
+
+async def test_구글_캘린더가_마감_시간_안에_응답하지_않으면_DB_부킹만_부분_결과로_응답한다(
+    monkeypatch: pytest.MonkeyPatch,
+    db_session,
+    client_with_guest_auth: TestClient,
+    host_user: User,
+    time_slot_tuesday: TimeSlot,
+    guest_user: User,
+    fake_google_calendar: FakeGoogleCalendarBackend,
+):
+    booking = Booking(
+        when=date(2026, 3, 3),
+        topic="test",
+        description="test",
+        time_slot_id=time_slot_tuesday.id,
+        guest_id=guest_user.id,
+    )
+    db_session.add(booking)
+    await db_session.commit()
+    monkeypatch.setattr(endpoints, "CALENDAR_BOOKINGS_DEADLINE", 0.3)
+    fake_google_calendar.latency = 1
+
+    response = client_with_guest_auth.get(
+        f"/calendar/{host_user.username}/bookings",
+        params={"year": 2026, "month": 3},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Partial-Result"] == "google"
+    assert response.headers["X-Google-Calendar-Stale"] == "true"
+    assert [item["id"] for item in response.json()] == [booking.id]
+
+
+async def test_DB_부킹_조회가_마감_시간을_넘기면_요청_세션과_따로_취소하고_구글_일정만_응답한다(
+    monkeypatch: pytest.MonkeyPatch,
+    db_session,
+    client_with_guest_auth: TestClient,
+    host_user: User,
+    host_user_calendar,
+    google_calendar_service: GoogleCalendarService,
+):
+    event = await google_calendar_service.create_event(
+        summary="구글 일정",
+        start_datetime=datetime(2026, 3, 5, 10),
+        end_datetime=datetime(2026, 3, 5, 11),
+        google_calendar_id=host_user_calendar.google_calendar_id,
+    )
+    sessions = []
+
+    async def slow_fetch_month_bookings(session, *args):
+        sessions.append(session)
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(endpoints, "CALENDAR_BOOKINGS_DEADLINE", 0.3)
+    monkeypatch.setattr(endpoints, "fetch_month_bookings", slow_fetch_month_bookings)
+
+    response = client_with_guest_auth.get(
+        f"/calendar/{host_user.username}/bookings",
+        params={"year": 2026, "month": 3},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Partial-Result"] == "bookings"
+    assert [item["id"] for item in response.json()] == [event["id"]]
+    # 취소된 조회는 인증·로더가 쓰는 요청 세션이 아닌 자기 세션에서 돌았다.
+    assert len(sessions) == 1 and sessions[0] is not db_session
+
+
+async def test_구글_일정_조회가_예상하지_못한_오류로_실패해도_DB_부킹은_응답한다(
+    monkeypatch: pytest.MonkeyPatch,
+    db_session,
+    client_with_guest_auth: TestClient,
+    host_user: User,
+    time_slot_tuesday: TimeSlot,
+    guest_user: User,
+    google_calendar_service: GoogleCalendarService,
+):
+    booking = Booking(
+        when=date(2026, 3, 3),
+        topic="test",
+        description="test",
+        time_slot_id=time_slot_tuesday.id,
+        guest_id=guest_user.id,
+    )
+    db_session.add(booking)
+    await db_session.commit()
+
+    async def broken_event_list(*args, **kwargs):
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(google_calendar_service, "event_list", broken_event_list)
+
+    response = client_with_guest_auth.get(
+        f"/calendar/{host_user.username}/bookings",
+        params={"year": 2026, "month": 3},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Google-Calendar-Stale"] == "true"
+    assert "X-Partial-Result" not in response.headers
+    assert [item["id"] for item in response.json()] == [booking.id]
+
+
+async def test_DB_부킹_조회_오류는_ExceptionGroup_이_아닌_원래_예외로_올라간다(
+    monkeypatch: pytest.MonkeyPatch,
+    client_with_guest_auth: TestClient,
+    host_user: User,
+    host_user_calendar,
+):
+    class BookingsQueryError(Exception):
+        pass
+
+    async def broken_fetch_month_bookings(*args):
+        # 테스트 세션들은 연결 하나를 함께 쓰므로, 구글 쪽 채널 조회가 끝난 다음에 실패시킨다.
+        await asyncio.sleep(0.1)
+        raise BookingsQueryError()
+
+    monkeypatch.setattr(endpoints, "fetch_month_bookings", broken_fetch_month_bookings)
+
+    with pytest.raises(BookingsQueryError):
+        client_with_guest_auth.get(
+            f"/calendar/{host_user.username}/bookings",
+            params={"year": 2026, "month": 3},
+        )
+
+
+async def test_부킹_스트림은_구글_일정을_기다리지_않고_DB_부킹부터_보낸다(
+    monkeypatch: pytest.MonkeyPatch,
+    db_session,
+    client_with_guest_auth: TestClient,
+    host_user: User,
+    host_user_calendar,
+    time_slot_tuesday: TimeSlot,
+    guest_user: User,
+    google_calendar_service: GoogleCalendarService,
+):
+    bookings = [
+        Booking(
+            when=when,
+            topic="test",
+            description="test",
+            time_slot_id=time_slot_tuesday.id,
+            guest_id=guest_user.id,
+        )
+        for when in [date(2026, 3, 3), date(2026, 3, 10)]
+    ]
+    db_session.add_all(bookings)
+    await db_session.commit()
+    event = await google_calendar_service.create_event(
+        summary="구글 일정",
+        start_datetime=datetime(2026, 3, 5, 10),
+        end_datetime=datetime(2026, 3, 5, 11),
+        google_calendar_id=host_user_calendar.google_calendar_id,
+    )
+    stream_month_bookings = endpoints.stream_month_bookings
+    iter_events = google_calendar_service.iter_events
+    db_done = asyncio.Event()
+
+    async def stream_then_release_google(*args):
+        async for item in stream_month_bookings(*args):
+            yield item
+        db_done.set()
+
+    async def iter_events_after_db(**kwargs):
+        # Google 은 DB 부킹을 다 보낸 뒤에야 응답한다. 스트림이 Google 을 먼저 기다리면 여기서 시간 초과로 실패한다.
+        async with asyncio.timeout(5):
+            await db_done.wait()
+        async for event in iter_events(**kwargs):
+            yield event
+
+    monkeypatch.setattr(endpoints, "stream_month_bookings", stream_then_release_google)
+    monkeypatch.setattr(google_calendar_service, "iter_events", iter_events_after_db)
+
+    response = client_with_guest_auth.get(
+        f"/calendar/{host_user.username}/bookings/stream",
+        params={"year": 2026, "month": 3},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert [item["id"] for item in items] == [bookings[1].id, bookings[0].id, event["id"]]
+    assert items[-1]["when"] == "2026-03-05"
+
+
 async def test_게스트는_자신의_캘린더의_예약_내역을_페이지_단위로_받는다(
     client_with_guest_auth: TestClient,
     host_bookings: list[Booking],
@@ -0,0 +1,214 @@
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.apps.account.models import User
+from appserver.apps.calendar.endpoints import fetch_month_bookings
+from appserver.apps.calendar.models import Booking, Calendar, TimeSlot
+from appserver.apps.calendar.schemas import BookingOut
+from appserver.loader_profiles import loader_options
+
+
+@contextmanager
+def count_queries(db_session: AsyncSession):
+    queries: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture()
+async def many_bookings(
+    db_session: AsyncSession,
+    guest_user: User,
+    smart_guest_user: User,
+    time_slot_tuesday: TimeSlot,
+    time_slot_monday: TimeSlot,
+):
+    bookings = []
+    for index in range(12):
+        booking = Booking(
+            when=date(2024, 12, 2) + timedelta(days=index),
+            topic="test",
+            description="test",
+            time_slot_id=(time_slot_tuesday if index % 2 else time_slot_monday).id,
+            guest_id=(guest_user if index % 3 else smart_guest_user).id,
+        )
+        db_session.add(booking)
+        bookings.append(booking)
+    await db_session.commit()
+    return bookings
+
+
+@pytest.mark.usefixtures("many_bookings")
+@pytest.mark.parametrize("client_name, path", [
+    ("client_with_auth", "/bookings"),
+    ("client_with_guest_auth", "/guest-calendar/bookings"),
+])
+async def test_부킹_목록의_쿼리_수는_쪽_크기와_상관없이_같다(
+    request: pytest.FixtureRequest,
+    db_session: AsyncSession,
+    client_name: str,
+    path: str,
+):
+    client: TestClient = request.getfixturevalue(client_name)
+    # 인증 캐시 등을 미리 채워 둔다.
+    assert client.get(path, params={"page": 1, "page_size": 1}).status_code == status.HTTP_200_OK
+
+    counts = {}
+    for page_size in [1, 5, 12]:
+        db_session.expunge_all()
+        with count_queries(db_session) as queries:
+            response = client.get(path, params={"page": 1, "page_size": page_size})
+        assert response.status_code == status.HTTP_200_OK
+        counts[page_size] = len(queries)
+
+    assert len(set(counts.values())) == 1, counts
+
+
+async def test_부킹_목록은_관계를_모두_채워서_응답한다(
+    client_with_guest_auth: TestClient,
+    many_bookings: list[Booking],
+    guest_user: User,
+    host_user: User,
+):
+    response = client_with_guest_auth.get("/guest-calendar/bookings", params={"page": 1, "page_size": 50})
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    expected = [booking for booking in many_bookings if booking.guest_id == guest_user.id]
+    assert data["total_count"] == len(expected)
+    assert [item["id"] for item in data["bookings"]] == [booking.id for booking in reversed(expected)]
+    for item, booking in zip(data["bookings"], reversed(expected)):
+        assert item["time_slot"]["id"] == booking.time_slot_id
+        assert item["host"]["username"] == host_user.username
+        assert item["files"] == []
+
+
+async def test_부킹_목록은_응답_스키마로_직렬화한_것과_같은_JSON_을_내려준다(
+    client_with_auth: TestClient,
+    db_session: AsyncSession,
+    many_bookings: list[Booking],
+):
+    response = client_with_auth.get("/bookings", params={"page": 1, "page_size": 50})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/json"
+
+    db_session.expunge_all()
+    stmt = (
+        select(Booking)
+        .options(*loader_options("detail", Booking))
+        .where(Booking.id.in_([booking.id for booking in many_bookings]))
+        .order_by(Booking.when.desc())
+    )
+    bookings = (await db_session.execute(stmt)).unique().scalars().all()
+    assert response.json() == [BookingOut.model_validate(booking).model_dump(mode="json") for booking in bookings]
+
+
+@pytest.mark.usefixtures("many_bookings")
+@pytest.mark.parametrize("client_name, path, key", [
+    ("client_with_auth", "/bookings", None),
+    ("client_with_guest_auth", "/guest-calendar/bookings", "bookings"),
+])
+async def test_compact_형식은_관련_객체를_included_에_한_번씩만_담는다(
+    request: pytest.FixtureRequest,
+    client_name: str,
+    path: str,
+    key: str | None,
+):
+    client: TestClient = request.getfixturevalue(client_name)
+    params = {"page": 1, "page_size": 50}
+
+    full = client.get(path, params=params).json()
+    response = client.get(path, params={**params, "format": "compact"})
+
+    assert response.status_code == status.HTTP_200_OK
+    compact = response.json()
+    full_bookings = full[key] if key else full
+    if key:
+        assert compact["total_count"] == full["total_count"]
+
+    time_slots = {time_slot["id"]: time_slot for time_slot in compact["included"]["time_slots"]}
+    hosts = {host.pop("id"): host for host in compact["included"]["hosts"]}
+    assert len(time_slots) == len(compact["included"]["time_slots"])
+    assert len(hosts) == len(compact["included"]["hosts"])
+    assert len(time_slots) < len(compact["bookings"])
+
+    # 참조를 풀면 기본 형식과 같은 부킹이 된다.
+    resolved = []
+    for booking in compact["bookings"]:
+        booking["time_slot"] = time_slots[booking.pop("time_slot_id")]
+        booking["host"] = hosts[booking.pop("host_id")]
+        resolved.append(booking)
+    assert resolved == full_bookings
+
+
+async def test_부킹_목록_형식이_잘못되면_HTTP_422_응답을_한다(client_with_auth: TestClient):
+    response = client_with_auth.get("/bookings", params={"page": 1, "page_size": 10, "format": "tiny"})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_월별_부킹_목록은_부킹과_타임슬롯_컬럼만_읽는다(
+    client: TestClient,
+    db_session: AsyncSession,
+    host_user: User,
+    guest_user: User,
+    time_slot_tuesday: TimeSlot,
+):
+    bookings = [
+        Booking(
+            when=date(2026, 3, 3) + timedelta(weeks=index),
+            topic="긴 주제" * 50,
+            description="긴 설명" * 500,
+            time_slot_id=time_slot_tuesday.id,
+            guest_id=guest_user.id,
+        )
+        for index in range(3)
+    ]
+    db_session.add_all(bookings)
+    await db_session.commit()
+    db_session.expunge_all()
+
+    with count_queries(db_session) as queries:
+        response = client.get(f"/calendar/{host_user.username}/bookings", params={"year": 2026, "month": 3})
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["id"] for item in data] == [booking.id for booking in reversed(bookings)]
+    assert all(item["time_slot"]["id"] == time_slot_tuesday.id for item in data)
+
+    [booking_query] = [query for query in queries if "FROM bookings" in query]
+    assert "bookings.description" not in booking_query
+    assert "bookings.topic" not in booking_query
+    assert "users" not in booking_query
+
+
+async def test_월별_부킹은_ORM_인스턴스_없이_컬럼만_읽어서_만든다(
+    db_session: AsyncSession,
+    host_user_calendar: Calendar,
+    host_bookings: list[Booking],
+):
+    db_session.expunge_all()
+
+    items = await fetch_month_bookings(db_session, host_user_calendar.id, 2024, 12)
+
+    expected = sorted((booking for booking in host_bookings if booking.when.month == 12), key=lambda booking: booking.when, reverse=True)
+    assert [(item.id, item.when) for item in items] == [(booking.id, booking.when) for booking in expected]
+    assert not any(isinstance(instance, Booking) for instance in db_session.identity_map.values())
+    # 같은 타임슬롯의 부킹은 TimeSlotOut 하나를 같이 쓴다.
+    assert len({id(item.time_slot) for item in items}) == 1
@@ -5,6 +5,7 @@ from appserver.apps.calendar.models import Calendar
 from appserver.apps.calendar.schemas import CalendarDetailOut, CalendarOut
 from appserver.apps.calendar.endpoints import host_calendar_detail
 from appserver.apps.calendar.exceptions import HostNotFoundError, CalendarNotFoundError
+from appserver.loaders import RequestLoaders
 
 # 반복 제거
 @pytest.mark.parametrize("user_key, expected_type", [
@@ -31,7 +32,7 @@ async def test_use_host_username_calendar_info(
     # user = None   # 삭제
     # expected_type = CalendarOut   # 삭제
 
-    result = await host_calendar_detail(host_user.username, user, db_session)
+    result = await host_calendar_detail(host_user.username, user, db_session, RequestLoaders(db_session))
 
     assert isinstance(result, expected_type)
     result_keys = frozenset(result.model_dump().keys())
@@ -74,11 +75,11 @@ async def test_use_host_username_calendar_info(
 
 async def test_if_not_exist_user_search_calendar_info(db_session: AsyncSession,) -> None:
     with pytest.raises(HostNotFoundError):
-        await host_calendar_detail("not_exist_user", None, db_session)
+        await host_calendar_detail("not_exist_user", None, db_session, RequestLoaders(db_session))
 
 async def test_if_not_host_search_calendar_info(guest_user: User, db_session: AsyncSession) -> None:
     with pytest.raises(CalendarNotFoundError):
-        await host_calendar_detail(guest_user.username, None, db_session)
+        await host_calendar_detail(guest_user.username, None, db_session, RequestLoaders(db_session))
 
 
 
@@ -0,0 +1,192 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.apps.calendar.channels import register_channel, renew_channels, revalidate_event_cache
+from appserver.apps.calendar.models import Calendar, GoogleCalendarChannel
+from appserver.libs.google.calendar.cache import EventListCache
+from appserver.libs.google.calendar.fake import FakeGoogleCalendarBackend, build_fake_service
+from appserver.libs.google.calendar.services import GoogleCalendarService
+
+
+WEBHOOK_URL = "http://testserver/google-calendar/notifications"
+TIME_MIN = datetime(2026, 3, 1, tzinfo=timezone.utc)
+TIME_MAX = datetime(2026, 3, 31, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+async def channel(
+    db_session: AsyncSession,
+    host_user_calendar: Calendar,
+    google_calendar_service: GoogleCalendarService,
+    fake_google_calendar: FakeGoogleCalendarBackend,
+) -> GoogleCalendarChannel:
+    channel = await register_channel(
+        db_session,
+        google_calendar_service,
+        host_user_calendar.google_calendar_id,
+        WEBHOOK_URL,
+    )
+    fake_google_calendar.pop_notifications()
+    return channel
+
+
+def deliver(client: TestClient, backend: FakeGoogleCalendarBackend) -> list[int]:
+    return [
+        client.post(notification.address, headers=notification.headers).status_code
+        for notification in backend.pop_notifications()
+    ]
+
+
+def insert_event(backend: FakeGoogleCalendarBackend, google_calendar_id: str, summary: str) -> dict:
+    # 다른 클라이언트(예: 호스트가 Google Calendar 앱에서)가 일정을 바꾼 상황
+    return build_fake_service(backend).events().insert(
+        calendarId=google_calendar_id,
+        body={
+            "summary": summary,
+            "start": {"dateTime": "2026-03-10T09:00:00+09:00"},
+            "end": {"dateTime": "2026-03-10T10:00:00+09:00"},
+        },
+    ).execute()
+
+
+async def test_채널이_없는_캘린더에만_채널을_등록하고_만료가_가까우면_새_채널로_갈아탄다(
+    db_session: AsyncSession,
+    host_user_calendar: Calendar,
+    google_calendar_service: GoogleCalendarService,
+    fake_google_calendar: FakeGoogleCalendarBackend,
+):
+    report = await renew_channels(db_session, google_calendar_service, WEBHOOK_URL)
+    assert report.registered == 1
+
+    channel = (await db_session.execute(select(GoogleCalendarChannel))).scalar_one()
+    assert channel.google_calendar_id == host_user_calendar.google_calendar_id
+    assert channel.sync_token is not None
+    assert list(fake_google_calendar.channels) == [channel.channel_id]
+
+    report = await renew_channels(db_session, google_calendar_service, WEBHOOK_URL)
+    assert report.registered == 0
+    assert report.watching == 1
+
+    previous_channel_id = channel.channel_id
+    report = await renew_channels(
+        db_session,
+        google_calendar_service,
+        WEBHOOK_URL,
+        now=channel.expires_at - timedelta(hours=1),
+    )
+    assert report.registered == 1
+    assert channel.channel_id != previous_channel_id
+    assert list(fake_google_calendar.channels) == [channel.channel_id]
+
+
+async def test_변경_알림을_받으면_해당_캘린더의_캐시만_무효화하고_알림이_없으면_구글을_호출하지_않는다(
+    client: TestClient,
+    channel: GoogleCalendarChannel,
+    google_calendar_service: GoogleCalendarService,
+    fake_google_calendar: FakeGoogleCalendarBackend,
+):
+    google_calendar_id = channel.google_calendar_id
+    assert await google_calendar_service.event_list(TIME_MIN, TIME_MAX, google_calendar_id) == []
+    assert await google_calendar_service.event_list(TIME_MIN, TIME_MAX, google_calendar_id) == []
+    assert google_calendar_service.event_cache.stats()["misses"] == 1
+
+    insert_event(fake_google_calendar, google_calendar_id, "새 일정")
+    assert deliver(client, fake_google_calendar) == [status.HTTP_204_NO_CONTENT]
+
+    events = await google_calendar_service.event_list(TIME_MIN, TIME_MAX, google_calendar_id)
+    assert [event["summary"] for event in events] == ["새 일정"]
+    assert google_calendar_service.event_cache.stats()["misses"] == 2
+
+
+async def test_다른_워커가_받은_알림도_DB_의_sync_token_으로_알아채고_캐시를_버린다(
+    db_session: AsyncSession,
+    client: TestClient,
+    channel: GoogleCalendarChannel,
+    fake_google_calendar: FakeGoogleCalendarBackend,
+):
+    # 알림은 앱(워커 하나)으로 가고, 이 서비스는 캐시를 따로 가진 다른 워커다.
+    other_worker = GoogleCalendarService(
+        default_google_calendar_id=channel.google_calendar_id,
+        service=build_fake_service(fake_google_calendar),
+        event_cache=EventListCache(),
+        breaker=None,
+    )
+    google_calendar_id = channel.google_calendar_id
+    await revalidate_event_cache(db_session, other_worker, google_calendar_id)
+    assert await other_worker.event_list(TIME_MIN, TIME_MAX, google_calendar_id) == []
+
+    insert_event(fake_google_calendar, google_calendar_id, "새 일정")
+    assert deliver(client, fake_google_calendar) == [status.HTTP_204_NO_CONTENT]
+
+    await revalidate_event_cache(db_session, other_worker, google_calendar_id)
+    events = await other_worker.event_list(TIME_MIN, TIME_MAX, google_calendar_id)
+    assert [event["summary"] for event in events] == ["새 일정"]
+    assert other_worker.event_cache.stats()["misses"] == 2
+
+
+async def test_다른_프로세스가_먼저_채널을_갈아타면_방금_등록한_채널은_중지한다(
+    db_session: AsyncSession,
+    channel: GoogleCalendarChannel,
+    google_calendar_service: GoogleCalendarService,
+    fake_google_calendar: FakeGoogleCalendarBackend,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    watch_events = google_calendar_service.watch_events
+    racing = [True]
+
+    async def _racing_watch_events(**kwargs):
+        resource = await watch_events(**kwargs)
+        if racing:
+            # 이 프로세스가 새 채널을 등록하는 사이 다른 프로세스가 먼저 갈아탔다.
+            racing.pop()
+            await register_channel(db_session, google_calendar_service, channel.google_calendar_id, WEBHOOK_URL)
+        return resource
+
+    monkeypatch.setattr(google_calendar_service, "watch_events", _racing_watch_events)
+    saved = await register_channel(db_session, google_calendar_service, channel.google_calendar_id, WEBHOOK_URL)
+
+    assert list(fake_google_calendar.channels) == [saved.channel_id]
+    assert (await db_session.execute(select(GoogleCalendarChannel))).scalar_one().channel_id == saved.channel_id
+
+
+async def test_sync_token_이_만료되면_새로_받아_저장한다(
+    db_session: AsyncSession,
+    client: TestClient,
+    channel: GoogleCalendarChannel,
+    fake_google_calendar: FakeGoogleCalendarBackend,
+):
+    previous_sync_token = channel.sync_token
+    fake_google_calendar.expire_sync_tokens()
+
+    insert_event(fake_google_calendar, channel.google_calendar_id, "새 일정")
+    assert deliver(client, fake_google_calendar) == [status.HTTP_204_NO_CONTENT]
+
+    await db_session.refresh(channel)
+    assert channel.sync_token != previous_sync_token
+
+
+@pytest.mark.parametrize("headers, expected_status_code", [
+    ({"X-Goog-Channel-ID": "unknown", "X-Goog-Channel-Token": "token"}, status.HTTP_404_NOT_FOUND),
+    ({"X-Goog-Channel-Token": "wrong"}, status.HTTP_403_FORBIDDEN),
+    ({}, status.HTTP_403_FORBIDDEN),
+])
+async def test_등록되지_않은_채널이나_토큰이_다른_알림은_거부한다(
+    client: TestClient,
+    channel: GoogleCalendarChannel,
+    fake_google_calendar: FakeGoogleCalendarBackend,
+    headers: dict,
+    expected_status_code: int,
+):
+    fake_google_calendar.request_counts.clear()
+    response = client.post(
+        "/google-calendar/notifications",
+        headers={"X-Goog-Channel-ID": channel.channel_id, "X-Goog-Resource-State": "exists", **headers},
+    )
+
+    assert response.status_code == expected_status_code
+    assert fake_google_calendar.request_counts["events.list"] == 0
@@ -0,0 +1,84 @@
+from datetime import date, time
+
+import pytest
+
+from appserver.apps.calendar import schemas
+from appserver.apps.calendar.schemas import GoogleCalendarEventOut, convert_event_list, event_out_cache
+
+
+EVENTS = [
+    {
+        "id": "timed",
+        "start": {"dateTime": "2026-03-05T10:00:00+09:00"},
+        "end": {"dateTime": "2026-03-05T11:30:00+09:00"},
+    },
+    {
+        "id": "all-day",
+        "start": {"date": "2026-03-07"},
+        "end": {"date": "2026-03-08"},
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_event_out_cache():
+    event_out_cache.clear()
+    yield
+    event_out_cache.clear()
+
+
+def test_이벤트_목록을_한_번에_변환한다():
+    items = convert_event_list(EVENTS)
+
+    assert all(isinstance(item, GoogleCalendarEventOut) for item in items)
+    assert [item.model_dump(mode="json") for item in items] == [
+        {
+            "id": "timed",
+            "time_slot": {"start_time": "10:00:00", "end_time": "11:30:00", "weekdays": [3]},
+            "when": "2026-03-05",
+        },
+        {
+            "id": "all-day",
+            "time_slot": {"start_time": "00:00:00", "end_time": "23:59:00", "weekdays": [5]},
+            "when": "2026-03-07",
+        },
+    ]
+
+
+def test_이벤트의_시작_종료는_한_번만_해석한다(monkeypatch: pytest.MonkeyPatch):
+    calls = []
+    parse_event_span = schemas.parse_event_span
+
+    def counting_parse_event_span(start: dict, end: dict):
+        calls.append(start)
+        return parse_event_span(start, end)
+
+    monkeypatch.setattr(schemas, "parse_event_span", counting_parse_event_span)
+
+    item = GoogleCalendarEventOut.model_validate(EVENTS[0])
+    item.model_dump_json()
+    item.model_dump()
+
+    assert item.when == date(2026, 3, 5)
+    assert item.time_slot.start_time == time(10, 0)
+    assert len(calls) == 1
+
+
+def test_같은_이벤트는_다시_변환하지_않는다(monkeypatch: pytest.MonkeyPatch):
+    calls = []
+    parse_event_span = schemas.parse_event_span
+
+    def counting_parse_event_span(start: dict, end: dict):
+        calls.append(start)
+        return parse_event_span(start, end)
+
+    monkeypatch.setattr(schemas, "parse_event_span", counting_parse_event_span)
+
+    first = convert_event_list(EVENTS)
+    moved = {**EVENTS[0], "start": {"dateTime": "2026-03-05T14:00:00+09:00"}, "end": {"dateTime": "2026-03-05T15:00:00+09:00"}}
+    second = convert_event_list([moved, EVENTS[1]])
+
+    assert len(calls) == 3
+    assert second[1] is first[1]
+    # 시간이 바뀐 이벤트는 새로 변환한다.
+    assert second[0].time_slot.start_time == time(14, 0)
@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.admin import AdminSession
+from appserver.apps.calendar.models import Booking
+from appserver.loader_profiles import loader_options
+
+
+async def test_프로필_없이_읽은_부킹의_관계에_접근하면_쿼리_대신_예외가_난다(
+    db_session: AsyncSession,
+    host_bookings: list[Booking],
+):
+    db_session.expunge_all()
+    booking = (await db_session.execute(select(Booking).where(Booking.id == host_bookings[0].id))).scalar_one()
+
+    with pytest.raises(InvalidRequestError):
+        booking.files
+    with pytest.raises(InvalidRequestError):
+        booking.time_slot
+
+
+async def test_detail_프로필은_응답에_필요한_관계를_모두_읽는다(
+    db_session: AsyncSession,
+    host_bookings: list[Booking],
+):
+    db_session.expunge_all()
+    stmt = select(Booking).options(*loader_options("detail", Booking)).where(Booking.id == host_bookings[0].id)
+    booking = (await db_session.execute(stmt)).unique().scalar_one()
+
+    assert booking.host.username == "puddingcamp"
+    assert booking.files == []
+
+
+async def test_관리자_세션은_admin_프로필을_붙여서_읽는다(
+    db_session: AsyncSession,
+    host_bookings: list[Booking],
+):
+    async with AsyncSession(db_session.bind, sync_session_class=AdminSession) as session:
+        bookings = (await session.execute(select(Booking).order_by(Booking.id))).scalars().all()
+        ids = (await session.execute(select(Booking.id))).scalars().all()
+
+    # 세션을 닫은 뒤에도 관리자 화면이 보여 주는 관계(`__str__`)를 쓸 수 있다.
+    assert [str(booking) for booking in bookings] == [str(booking) for booking in host_bookings]
+    assert bookings[0].guest.id == host_bookings[0].guest_id
+    assert len(ids) == len(host_bookings)
@@ -0,0 +1,170 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from appserver.apps.calendar.enums import AttendanceStatus
+from appserver.apps.calendar.models import Booking
+from appserver.apps.calendar.reconcile import reconcile_missing_events
+from appserver.libs.datetime.datetime import utcnow
+from appserver.libs.google.calendar.fake import FakeGoogleCalendarBackend
+from appserver.libs.google.calendar.services import GoogleCalendarService
+
+
+SINCE = date(2024, 12, 5)
+
+
+async def google_event_ids(db_session: AsyncSession) -> dict[date, str | None]:
+    result = await db_session.execute(select(Booking.when, Booking.google_event_id).order_by(Booking.id))
+    return dict(result.all())
+
+
+@pytest.fixture(autouse=True)
+async def settled_bookings(db_session: AsyncSession, host_bookings: list[Booking]) -> list[Booking]:
+    # 보정 작업은 백그라운드 작업이 끝났을 만큼 오래된 부킹만 훑는다.
+    await db_session.execute(update(Booking).values(created_at=utcnow() - timedelta(hours=1)))
+    await db_session.commit()
+    return host_bookings
+
+
+@pytest.mark.parametrize("batch_size", [1, 200])
+async def test_예정된_부킹_중_구글_일정이_없는_부킹만_일정을_만들고_ID를_기록한다(
+    db_session: AsyncSession,
+    host_bookings: list[Booking],
+    google_calendar_service: GoogleCalendarService,
+    fake_google_calendar: FakeGoogleCalendarBackend,
+    batch_size: int,
+):
+    host_bookings[1].google_event_id = "already-synced"
+    host_bookings[2].attendance_status = AttendanceStatus.CANCELLED
+    await db_session.commit()
+
+    report = await reconcile_missing_events(
+        db_session,
+        google_calendar_service,
+        since=SINCE,
+        batch_size=batch_size,
+    )
+
+    assert report.scanned == 1
+    assert report.created == 1
+    assert report.failed == 0
+
+    ids = await google_event_ids(db_session)
+    assert ids[date(2024, 12, 3)] is None
+    assert ids[date(2024, 12, 10)] == "already-synced"
+    assert ids[date(2024, 12, 17)] is None
+    assert ids[date(2025, 1, 7)] is not None
+    assert fake_google_calendar.request_counts["events.insert"] == 1
+
+
+async def test_일정_생성에_실패한_부킹은_보고하고_다음_실행에서_다시_시도한다(
+    db_session: AsyncSession,
+    host_bookings: list[Booking],
+    google_calendar_service: GoogleCalendarService,
+    fake_google_calendar: FakeGoogleCalendarBackend,
+):
+    fake_google_calendar.fail_next(1, status=500)
+
+    report = await reconcile_missing_events(db_session, google_calendar_service, since=SINCE)
+
+    assert report.scanned == 3
+    assert report.created == 2
+    assert report.failed_booking_ids == [host_bookings[1].id]
+
+    report = await reconcile_missing_events(db_session, google_calendar_service, since=SINCE)
+
+    assert report.scanned == 1
+    assert report.created == 1
+    ids = await google_event_ids(db_session)
+    assert all(ids[when] is not None for when in [date(2024, 12, 10), date(2024, 12, 17), date(2025, 1, 7)])
+
+
+async def test_방금_만든_부킹은_백그라운드_작업에_맡기고_건너뛴다(
+    db_session: AsyncSession,
+    host_bookings: list[Booking],
+    google_calendar_service: GoogleCalendarService,
+    fake_google_calendar: FakeGoogleCalendarBackend,
+):
+    host_bookings[3].created_at = utcnow()
+    await db_session.commit()
+
+    report = await reconcile_missing_events(db_session, google_calendar_service, since=SINCE)
+
+    assert report.scanned == 2
+    ids = await google_event_ids(db_session)
+    assert ids[date(2025, 1, 7)] is None
+    assert fake_google_calendar.request_counts["events.insert"] == 2
+
+
+async def test_그사이_먼저_기록된_부킹의_일정은_덮어쓰지_않고_지운다(
+    db_session: AsyncSession,
+    host_bookings: list[Booking],
+    google_calendar_service: GoogleCalendarService,
+    fake_google_calendar: FakeGoogleCalendarBackend,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    create_events_batch = google_calendar_service.create_events_batch
+
+    async def racing_create_events_batch(events):
+        results = await create_events_batch(events)
+        # 보정 작업이 일정을 만드는 사이 백그라운드 작업이 먼저 기록한 경우
+        await db_session.execute(
+            update(Booking).where(Booking.id == host_bookings[3].id).values(google_event_id="from-background")
+        )
+        await db_session.commit()
+        return results
+
+    monkeypatch.setattr(google_calendar_service, "create_events_batch", racing_create_events_batch)
+
+    report = await reconcile_missing_events(db_session, google_calendar_service, since=SINCE)
+
+    assert report.scanned == 3
+    assert report.created == 2
+    assert report.duplicated == 1
+    ids = await google_event_ids(db_session)
+    assert ids[date(2025, 1, 7)] == "from-background"
+    assert fake_google_calendar.request_counts["events.delete"] == 1
+    events = fake_google_calendar.calendars[google_calendar_service.default_google_calendar_id]
+    remaining = {event_id for event_id, event in events.items() if event["status"] != "cancelled"}
+    assert remaining == {ids[date(2024, 12, 10)], ids[date(2024, 12, 17)]}
+
+
+async def test_중복_일정_하나를_지우지_못해도_나머지를_지우고_보고한다(
+    db_session: AsyncSession,
+    google_calendar_service: GoogleCalendarService,
+    fake_google_calendar: FakeGoogleCalendarBackend,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    create_events_batch = google_calendar_service.create_events_batch
+    delete_event = google_calendar_service.delete_event
+    failing = []
+
+    async def racing_create_events_batch(events):
+        results = await create_events_batch(events)
+        # 보정 작업이 일정을 만드는 사이 백그라운드 작업이 모두 먼저 기록한 경우
+        await db_session.execute(
+            update(Booking).where(Booking.google_event_id.is_(None)).values(google_event_id="from-background")
+        )
+        await db_session.commit()
+        return results
+
+    async def flaky_delete_event(event_id, google_calendar_id=None):
+        if not failing:
+            failing.append(event_id)
+            raise RuntimeError("delete failed")
+        return await delete_event(event_id, google_calendar_id)
+
+    monkeypatch.setattr(google_calendar_service, "create_events_batch", racing_create_events_batch)
+    monkeypatch.setattr(google_calendar_service, "delete_event", flaky_delete_event)
+
+    report = await reconcile_missing_events(db_session, google_calendar_service, since=SINCE)
+
+    assert report.scanned == 3
+    assert report.duplicated == 3
+    assert report.undeleted_event_ids == failing
+    assert fake_google_calendar.request_counts["events.delete"] == 2
+    events = fake_google_calendar.calendars[google_calendar_service.default_google_calendar_id]
+    assert {event_id for event_id, event in events.items() if event["status"] != "cancelled"} == set(failing)
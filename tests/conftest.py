@@ -5,16 +5,27 @@ import os
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import SQLModel
 
-from appserver.db import create_engine, create_session, use_session
+from appserver.db import create_engine, create_session, use_session, use_session_factory
 from appserver.app import include_routers
 from appserver.apps.account import models as account_models
+from appserver.apps.account.cache import host_directory_cache, user_cache
 from appserver.apps.calendar import models as calendar_models
-from appserver.apps.account.utils import hash_password
+from appserver.apps.account.utils import hash_password, verified_token_cache
 from appserver.apps.account.schemas import LoginPayload
+from appserver.apps.account.throttle import login_throttle
+from appserver.apps.account.revocation import revocation_list
 from appserver.libs.datetime.datetime import utcnow
+from appserver.libs.google.calendar.cache import EventListCache
+from appserver.libs.google.calendar.deps import get_google_calendar_service
+from appserver.libs.google.calendar.fake import FakeGoogleCalendarBackend, build_fake_service
+from appserver.libs.google.calendar.services import (
+    GOOGLE_SERVICE_ACCOUNT_CREDENTIAL_PATH,
+    GoogleCalendarService,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -37,7 +48,68 @@ async def db_session():
 
 
 @pytest.fixture()
-def fastapi_app(db_session: AsyncSession):
+def record_queries(db_session: AsyncSession):
+    """`record_queries("users")` 처럼 테이블을 주면, 이후 그 테이블을 읽는 SELECT 를 담을 목록을 돌려준다."""
+    listeners = []
+
+    def _start(table: str) -> list:
+        queries = []
+
+        def _record(orm_execute_state):
+            if orm_execute_state.is_select and f"FROM {table}" in str(orm_execute_state.statement):
+                queries.append(orm_execute_state.statement)
+
+        event.listen(db_session.sync_session, "do_orm_execute", _record)
+        listeners.append(_record)
+        return queries
+
+    yield _start
+    for listener in listeners:
+        event.remove(db_session.sync_session, "do_orm_execute", listener)
+
+
+@pytest.fixture()
+def user_queries(record_queries) -> list:
+    return record_queries("users")
+
+
+@pytest.fixture(autouse=True)
+def clear_account_caches():
+    user_cache.clear()
+    host_directory_cache.clear()
+    verified_token_cache.clear()
+    login_throttle.reset()
+    revocation_list.reset()
+    yield
+    user_cache.clear()
+    host_directory_cache.clear()
+    verified_token_cache.clear()
+    login_throttle.reset()
+    revocation_list.reset()
+
+
+@pytest.fixture()
+def fake_google_calendar() -> FakeGoogleCalendarBackend:
+    return FakeGoogleCalendarBackend()
+
+
+@pytest.fixture()
+def google_calendar_service(fake_google_calendar: FakeGoogleCalendarBackend) -> GoogleCalendarService:
+    # 서비스 계정 자격 증명이 없으면 가짜 Google Calendar 로 대신한다.
+    calendar_id = os.getenv("GOOGLE_CALENDAR_ID") or "test-calendar@example.com"
+    if GOOGLE_SERVICE_ACCOUNT_CREDENTIAL_PATH.exists():
+        return GoogleCalendarService(default_google_calendar_id=calendar_id)
+
+    return GoogleCalendarService(
+        default_google_calendar_id=calendar_id,
+        service=build_fake_service(fake_google_calendar),
+        event_cache=EventListCache(),
+        breaker=None,
+    )
+
+
+@pytest.fixture()
+def fastapi_app(db_session: AsyncSession, google_calendar_service: GoogleCalendarService):
     app = FastAPI()
     include_routers(app)
 
@@ -48,7 +120,9 @@ def fastapi_app(db_session: AsyncSession):
         return utcnow().replace(year=2024, month=12, day=5)
 
     app.dependency_overrides[use_session] = override_use_session
+    app.dependency_overrides[use_session_factory] = lambda: create_session(db_session.bind)
     app.dependency_overrides[utcnow] = override_utcnow
+    app.dependency_overrides[get_google_calendar_service] = lambda: google_calendar_service
     return app
 
 
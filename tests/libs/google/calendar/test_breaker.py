@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from appserver.libs.google.calendar.breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from appserver.libs.google.calendar.services import build_thread_http, google_calendar_breaker
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture()
+def breaker(clock: Clock) -> CircuitBreaker:
+    return CircuitBreaker(
+        failure_rate_threshold=0.5,
+        window_size=4,
+        minimum_calls=4,
+        open_seconds=10,
+        call_timeout=0.05,
+        timer=clock,
+    )
+
+
+async def succeed():
+    return "ok"
+
+
+async def fail():
+    raise ConnectionError("upstream down")
+
+
+async def hang():
+    await asyncio.sleep(1)
+
+
+async def trip(breaker: CircuitBreaker):
+    for _ in range(4):
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail)
+
+
+async def test_circuit_opens_when_failure_rate_reaches_threshold(breaker: CircuitBreaker):
+    await breaker.call(succeed)
+    await breaker.call(succeed)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail)
+
+    assert breaker.state == CircuitState.OPEN
+
+
+async def test_open_circuit_rejects_without_calling_upstream(breaker: CircuitBreaker):
+    await trip(breaker)
+    calls = []
+
+    async def _tracked():
+        calls.append(1)
+
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(_tracked)
+    assert calls == []
+
+
+async def test_timeout_counts_as_failure(breaker: CircuitBreaker):
+    for _ in range(4):
+        with pytest.raises(TimeoutError):
+            await breaker.call(hang)
+
+    assert breaker.state == CircuitState.OPEN
+
+
+async def test_half_open_probe_success_closes_circuit(breaker: CircuitBreaker, clock: Clock):
+    await trip(breaker)
+    clock.now += 10
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert await breaker.call(succeed) == "ok"
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_half_open_probe_failure_reopens_circuit(breaker: CircuitBreaker, clock: Clock):
+    await trip(breaker)
+    clock.now += 10
+
+    with pytest.raises(ConnectionError):
+        await breaker.call(fail)
+    assert breaker.state == CircuitState.OPEN
+
+
+async def test_half_open_allows_limited_concurrent_probes(breaker: CircuitBreaker, clock: Clock):
+    await trip(breaker)
+    clock.now += 10
+
+    async def _slow_success():
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    results = await asyncio.gather(
+        breaker.call(_slow_success),
+        breaker.call(_slow_success),
+        return_exceptions=True,
+    )
+
+    assert results[0] == "ok"
+    assert isinstance(results[1], CircuitOpenError)
+
+
+async def test_errors_not_classified_as_failure_keep_circuit_closed(clock: Clock):
+    breaker = CircuitBreaker(
+        minimum_calls=2,
+        window_size=2,
+        is_failure=lambda exc: not isinstance(exc, LookupError),
+        timer=clock,
+    )
+
+    async def _not_found():
+        raise LookupError("not found")
+
+    for _ in range(4):
+        with pytest.raises(LookupError):
+            await breaker.call(_not_found)
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_thread_http_times_out_with_the_breaker():
+    http = build_thread_http()
+
+    # 브레이커가 기다림을 멈춘 뒤에도 스레드가 멈춘 연결에 묶여 있지 않도록 소켓에도 같은 제한 시간을 둔다.
+    assert http.timeout == google_calendar_breaker.call_timeout
+    assert 308 not in http.redirect_codes
@@ -7,13 +7,8 @@ from appserver.libs.google.calendar.services import GoogleCalendarService
 
 
 @pytest.fixture()
-def calendar_id() -> str:
-    return os.getenv("GOOGLE_CALENDAR_ID")
-
-
-@pytest.fixture()
-def service(calendar_id: str) -> GoogleCalendarService:
-    return GoogleCalendarService(default_google_calendar_id=calendar_id)
+def service(google_calendar_service: GoogleCalendarService) -> GoogleCalendarService:
+    return google_calendar_service
 
 
 @pytest.mark.skipif(
@@ -0,0 +1,178 @@
+import asyncio
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from appserver.libs.google.calendar.cache import EventListCache
+from appserver.libs.google.calendar.fake import FakeGoogleCalendarBackend, FakeHttp, build_fake_service
+from appserver.libs.google.calendar.services import GoogleCalendarService
+
+
+TIME_MIN = datetime(2026, 3, 1, tzinfo=timezone.utc)
+TIME_MAX = datetime(2026, 3, 31, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def cache() -> EventListCache:
+    return EventListCache(maxsize=2, ttl=60)
+
+
+def make_fetch(calls: list, events: list | None = None, delay: float = 0):
+    async def _fetch():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return events if events is not None else [{"id": f"event-{len(calls)}"}]
+
+    return _fetch
+
+
+async def test_cached_result_is_returned_without_upstream_call(cache: EventListCache):
+    calls = []
+    key = EventListCache.make_key("host@example.com", TIME_MIN, TIME_MAX)
+
+    first = await cache.get_or_fetch(key, make_fetch(calls))
+    second = await cache.get_or_fetch(key, make_fetch(calls))
+
+    assert first == second
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+async def test_concurrent_misses_share_one_upstream_call(cache: EventListCache):
+    calls = []
+    key = EventListCache.make_key("host@example.com", TIME_MIN, TIME_MAX)
+    fetch = make_fetch(calls, delay=0.05)
+
+    results = await asyncio.gather(*[cache.get_or_fetch(key, fetch) for _ in range(10)])
+
+    assert len(calls) == 1
+    assert all(result == results[0] for result in results)
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["coalesced"] == 9
+
+
+async def test_failed_fetch_is_not_cached(cache: EventListCache):
+    key = EventListCache.make_key("host@example.com", TIME_MIN, TIME_MAX)
+
+    async def _broken():
+        raise RuntimeError("upstream error")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch(key, _broken)
+
+    calls = []
+    await cache.get_or_fetch(key, make_fetch(calls))
+    assert len(calls) == 1
+
+
+async def test_invalidate_drops_only_the_given_calendar(cache: EventListCache):
+    calls = []
+    host_key = EventListCache.make_key("host@example.com", TIME_MIN, TIME_MAX)
+    other_key = EventListCache.make_key("other@example.com", TIME_MIN, TIME_MAX)
+    await cache.get_or_fetch(host_key, make_fetch(calls))
+    await cache.get_or_fetch(other_key, make_fetch(calls))
+
+    assert cache.invalidate("host@example.com") == 1
+
+    await cache.get_or_fetch(host_key, make_fetch(calls))
+    await cache.get_or_fetch(other_key, make_fetch(calls))
+    assert len(calls) == 3
+
+
+async def test_invalidate_during_fetch_does_not_store_stale_result(cache: EventListCache):
+    calls = []
+    key = EventListCache.make_key("host@example.com", TIME_MIN, TIME_MAX)
+
+    pending = asyncio.create_task(cache.get_or_fetch(key, make_fetch(calls, delay=0.05)))
+    await asyncio.sleep(0)
+    cache.invalidate("host@example.com")
+    await pending
+
+    await cache.get_or_fetch(key, make_fetch(calls))
+    assert len(calls) == 2
+
+
+async def test_least_recently_used_window_is_evicted(cache: EventListCache):
+    calls = []
+    keys = [
+        EventListCache.make_key("host@example.com", TIME_MIN.replace(month=month), TIME_MAX.replace(month=month))
+        for month in (3, 5, 7)
+    ]
+    for key in keys:
+        await cache.get_or_fetch(key, make_fetch(calls))
+
+    await cache.get_or_fetch(keys[0], make_fetch(calls))
+    assert len(calls) == 4
+    assert cache.stats()["size"] == 2
+
+
+async def test_request_after_invalidate_does_not_join_stale_fetch(cache: EventListCache):
+    calls = []
+    key = EventListCache.make_key("host@example.com", TIME_MIN, TIME_MAX)
+
+    pending = asyncio.create_task(cache.get_or_fetch(key, make_fetch(calls, [{"id": "old"}], delay=0.05)))
+    await asyncio.sleep(0)
+    cache.invalidate("host@example.com")
+    fresh = await cache.get_or_fetch(key, make_fetch(calls, [{"id": "new"}]))
+    stale = await pending
+
+    assert len(calls) == 2
+    assert fresh != stale
+    assert await cache.get_or_fetch(key, make_fetch(calls)) == fresh
+
+
+async def test_watched_calendar_uses_longer_ttl():
+    cache = EventListCache(ttl=0, watched_ttl=60)
+    cache.watch("watched@example.com")
+    calls = []
+
+    for calendar_id in ["watched@example.com", "polled@example.com"]:
+        key = EventListCache.make_key(calendar_id, TIME_MIN, TIME_MAX)
+        await cache.get_or_fetch(key, make_fetch(calls))
+        await cache.get_or_fetch(key, make_fetch(calls))
+
+    assert len(calls) == 3
+
+
+async def test_watch_with_new_version_invalidates_calendar():
+    cache = EventListCache(ttl=0, watched_ttl=60)
+    key = EventListCache.make_key("watched@example.com", TIME_MIN, TIME_MAX)
+    calls = []
+
+    for version in ["sync-1", "sync-1", "sync-2"]:
+        cache.watch("watched@example.com", version)
+        await cache.get_or_fetch(key, make_fetch(calls))
+
+    assert len(calls) == 2
+
+
+async def test_concurrent_misses_for_different_calendars_use_per_thread_http():
+    backend = FakeGoogleCalendarBackend(latency=0.05)
+    used: dict[int, set[int]] = {}
+    lock = threading.Lock()
+
+    class RecordingHttp(FakeHttp):
+        def request(self, *args, **kwargs):
+            with lock:
+                used.setdefault(id(self), set()).add(threading.get_ident())
+            return super().request(*args, **kwargs)
+
+    service = GoogleCalendarService(
+        default_google_calendar_id="host@example.com",
+        event_cache=EventListCache(ttl=60),
+        service=build_fake_service(backend),
+        breaker=None,
+        http_factory=lambda: RecordingHttp(backend),
+    )
+
+    await asyncio.gather(*[
+        service.event_list(TIME_MIN, TIME_MAX, google_calendar_id=f"host{index}@example.com")
+        for index in range(4)
+    ])
+
+    # 캐시 미스는 키마다 하나씩 동시에 나가지만, 하나의 Http 를 여러 스레드가 함께 쓰지 않는다.
+    assert backend.request_counts["events.list"] == 4
+    assert len(used) > 1
+    assert all(len(threads) == 1 for threads in used.values())
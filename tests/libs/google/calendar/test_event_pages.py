@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from appserver.libs.google.calendar.fake import FakeGoogleCalendarBackend, build_fake_service
+from appserver.libs.google.calendar.services import GoogleCalendarService
+
+
+TIME_MIN = datetime(2026, 3, 1, tzinfo=timezone.utc)
+TIME_MAX = datetime(2026, 3, 31, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def backend() -> FakeGoogleCalendarBackend:
+    backend = FakeGoogleCalendarBackend()
+    service = build_fake_service(backend)
+    start = datetime(2026, 3, 2, 9, tzinfo=timezone.utc)
+    for index in range(7):
+        service.events().insert(
+            calendarId="host@example.com",
+            body={
+                "id": f"event-{index}",
+                "summary": f"event {index}",
+                "start": {"dateTime": (start + timedelta(hours=index)).isoformat()},
+                "end": {"dateTime": (start + timedelta(hours=index + 1)).isoformat()},
+            },
+        ).execute()
+    backend.request_counts.clear()
+    return backend
+
+
+@pytest.fixture()
+def service(backend: FakeGoogleCalendarBackend) -> GoogleCalendarService:
+    return GoogleCalendarService(
+        default_google_calendar_id="host@example.com",
+        event_cache=None,
+        service=build_fake_service(backend),
+        breaker=None,
+    )
+
+
+async def test_iter_events_follows_page_tokens(
+    service: GoogleCalendarService,
+    backend: FakeGoogleCalendarBackend,
+):
+    result = [event async for event in service.iter_events(TIME_MIN, TIME_MAX, page_size=3)]
+
+    assert [event["id"] for event in result] == [f"event-{index}" for index in range(7)]
+    assert backend.request_counts["events.list"] == 3
+
+
+async def test_iter_events_requests_only_fields_it_needs(service: GoogleCalendarService):
+    result = [event async for event in service.iter_events(TIME_MIN, TIME_MAX, page_size=3)]
+
+    assert all(set(event) == {"id", "start", "end"} for event in result)
+
+
+async def test_iter_events_yields_before_next_page_is_requested(
+    service: GoogleCalendarService,
+    backend: FakeGoogleCalendarBackend,
+):
+    iterator = service.iter_events(TIME_MIN, TIME_MAX, page_size=3)
+
+    first = await anext(iterator)
+
+    assert first["id"] == "event-0"
+    assert backend.request_counts["events.list"] == 1
+    await iterator.aclose()
+
+
+async def test_event_list_returns_every_page(service: GoogleCalendarService):
+    result = await service.event_list(TIME_MIN, TIME_MAX)
+
+    assert len(result) == 7
+    assert result[0]["summary"] == "event 0"
@@ -0,0 +1,147 @@
+from datetime import datetime, timezone
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from appserver.libs.google.calendar.fake import (
+    FakeGoogleCalendarBackend,
+    FakeGoogleCalendarServer,
+    build_fake_service,
+)
+from appserver.libs.google.calendar.services import GoogleCalendarService, GoogleCalendarUnavailableError
+
+
+CALENDAR_ID = "host@example.com"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def event_body(day: int) -> dict:
+    return {
+        "summary": f"event {day}",
+        "start": {"dateTime": f"2026-03-{day:02d}T09:00:00+09:00"},
+        "end": {"dateTime": f"2026-03-{day:02d}T10:00:00+09:00"},
+    }
+
+
+@pytest.fixture()
+def backend() -> FakeGoogleCalendarBackend:
+    return FakeGoogleCalendarBackend()
+
+
+@pytest.fixture()
+def resource(backend: FakeGoogleCalendarBackend):
+    return build_fake_service(backend)
+
+
+def test_list_filters_by_time_range(resource):
+    for day in (1, 10, 20):
+        resource.events().insert(calendarId=CALENDAR_ID, body=event_body(day)).execute()
+
+    result = resource.events().list(
+        calendarId=CALENDAR_ID,
+        timeMin="2026-03-05T00:00:00Z",
+        timeMax="2026-03-15T00:00:00Z",
+        singleEvents=True,
+        orderBy="startTime",
+    ).execute()
+
+    assert [event["summary"] for event in result["items"]] == ["event 10"]
+
+
+def test_sync_token_returns_only_changes(resource, backend: FakeGoogleCalendarBackend):
+    first = resource.events().insert(calendarId=CALENDAR_ID, body=event_body(1)).execute()
+    sync_token = resource.events().list(calendarId=CALENDAR_ID).execute()["nextSyncToken"]
+
+    resource.events().delete(calendarId=CALENDAR_ID, eventId=first["id"]).execute()
+    second = resource.events().insert(calendarId=CALENDAR_ID, body=event_body(2)).execute()
+    changes = resource.events().list(calendarId=CALENDAR_ID, syncToken=sync_token).execute()
+
+    assert {(event["id"], event["status"]) for event in changes["items"]} == {
+        (first["id"], "cancelled"),
+        (second["id"], "confirmed"),
+    }
+
+    backend.expire_sync_tokens()
+    with pytest.raises(HttpError) as exc_info:
+        resource.events().list(calendarId=CALENDAR_ID, syncToken=changes["nextSyncToken"]).execute()
+    assert exc_info.value.status_code == 410
+
+
+def test_batch_runs_every_request(resource, backend: FakeGoogleCalendarBackend):
+    results = {}
+
+    def _callback(request_id, response, exception):
+        results[request_id] = exception or response["summary"]
+
+    batch = resource.new_batch_http_request(callback=_callback)
+    batch.add(resource.events().insert(calendarId=CALENDAR_ID, body=event_body(1)), request_id="a")
+    batch.add(resource.events().insert(calendarId=CALENDAR_ID, body=event_body(2)), request_id="b")
+    batch.add(resource.events().get(calendarId=CALENDAR_ID, eventId="missing"), request_id="c")
+    batch.execute()
+
+    assert results["a"] == "event 1"
+    assert results["b"] == "event 2"
+    assert results["c"].status_code == 404
+    assert backend.request_counts["batch"] == 1
+    assert backend.request_counts["events.insert"] == 2
+
+
+def test_fail_next_injects_errors(resource, backend: FakeGoogleCalendarBackend):
+    backend.fail_next(2, status=503)
+
+    for _ in range(2):
+        with pytest.raises(HttpError) as exc_info:
+            resource.events().list(calendarId=CALENDAR_ID).execute()
+        assert exc_info.value.status_code == 503
+    assert resource.events().list(calendarId=CALENDAR_ID).execute()["items"] == []
+
+
+def test_rate_limit_rejects_requests_over_budget():
+    clock = Clock()
+    backend = FakeGoogleCalendarBackend(rate_limit=1, burst=2, timer=clock)
+    resource = build_fake_service(backend)
+
+    resource.events().list(calendarId=CALENDAR_ID).execute()
+    resource.events().list(calendarId=CALENDAR_ID).execute()
+    with pytest.raises(HttpError) as exc_info:
+        resource.events().list(calendarId=CALENDAR_ID).execute()
+    assert exc_info.value.status_code == 429
+
+    clock.now += 1
+    resource.events().list(calendarId=CALENDAR_ID).execute()
+
+
+async def test_service_reports_injected_outage_as_unavailable(resource, backend: FakeGoogleCalendarBackend):
+    service = GoogleCalendarService(CALENDAR_ID, service=resource, event_cache=None, breaker=None)
+    backend.fail_next(status=503)
+
+    with pytest.raises(GoogleCalendarUnavailableError):
+        await service.event_list(
+            datetime(2026, 3, 1, tzinfo=timezone.utc),
+            datetime(2026, 3, 31, tzinfo=timezone.utc),
+        )
+
+
+async def test_service_works_over_localhost_server(backend: FakeGoogleCalendarBackend):
+    with FakeGoogleCalendarServer(backend) as server:
+        service = GoogleCalendarService(
+            CALENDAR_ID,
+            service=build_fake_service(root_url=server.root_url),
+            event_cache=None,
+            breaker=None,
+        )
+        event = await service.create_event(
+            summary="회의",
+            start_datetime=datetime(2026, 3, 2, 9),
+            end_datetime=datetime(2026, 3, 2, 10),
+        )
+        fetched = await service.get_event(event["id"])
+
+    assert fetched["summary"] == "회의"
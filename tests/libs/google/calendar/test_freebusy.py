@@ -0,0 +1,83 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from appserver.libs.google.calendar.fake import FakeGoogleCalendarBackend, build_fake_service
+from appserver.libs.google.calendar.schemas import BusyInterval
+from appserver.libs.google.calendar.services import FREEBUSY_MAX_CALENDARS, GoogleCalendarService
+
+
+TIME_MIN = datetime(2026, 3, 1, tzinfo=timezone.utc)
+TIME_MAX = datetime(2026, 3, 31, tzinfo=timezone.utc)
+CALENDAR_IDS = [f"host-{index}@example.com" for index in range(FREEBUSY_MAX_CALENDARS + 10)]
+
+
+def busy(start: str, end: str) -> dict:
+    return {
+        "start": {"dateTime": f"2026-03-{start}:00+00:00"},
+        "end": {"dateTime": f"2026-03-{end}:00+00:00"},
+    }
+
+
+@pytest.fixture()
+def backend() -> FakeGoogleCalendarBackend:
+    backend = FakeGoogleCalendarBackend(strict_calendars=True)
+    service = build_fake_service(backend)
+    events_by_calendar = {
+        calendar_id: [busy(f"02T{9 + index % 5:02d}:00", f"02T{10 + index % 5:02d}:00")]
+        for index, calendar_id in enumerate(CALENDAR_IDS)
+    }
+    events_by_calendar["host-0@example.com"] = [
+        busy("03T10:00", "03T11:00"),
+        busy("02T09:00", "02T10:00"),
+        busy("02T09:30", "02T10:30"),
+    ]
+    for calendar_id, events in events_by_calendar.items():
+        backend.add_calendar(calendar_id)
+        for event in events:
+            service.events().insert(calendarId=calendar_id, body=event).execute()
+    backend.request_counts.clear()
+    return backend
+
+
+@pytest.fixture()
+def service(backend: FakeGoogleCalendarBackend) -> GoogleCalendarService:
+    return GoogleCalendarService(
+        default_google_calendar_id="host-0@example.com",
+        event_cache=None,
+        service=build_fake_service(backend),
+        breaker=None,
+    )
+
+
+async def test_freebusy_returns_merged_busy_intervals(service: GoogleCalendarService):
+    result = await service.freebusy(TIME_MIN, TIME_MAX)
+
+    assert result == {
+        "host-0@example.com": [
+            BusyInterval(
+                datetime(2026, 3, 2, 9, tzinfo=timezone.utc),
+                datetime(2026, 3, 2, 10, 30, tzinfo=timezone.utc),
+            ),
+            BusyInterval(
+                datetime(2026, 3, 3, 10, tzinfo=timezone.utc),
+                datetime(2026, 3, 3, 11, tzinfo=timezone.utc),
+            ),
+        ],
+    }
+
+
+async def test_freebusy_queries_many_calendars_per_upstream_call(
+    service: GoogleCalendarService,
+    backend: FakeGoogleCalendarBackend,
+):
+    result = await service.freebusy(TIME_MIN, TIME_MAX, CALENDAR_IDS)
+
+    assert set(result) == set(CALENDAR_IDS)
+    assert backend.request_counts["freebusy.query"] == 2
+
+
+async def test_freebusy_skips_calendars_with_errors(service: GoogleCalendarService):
+    result = await service.freebusy(TIME_MIN, TIME_MAX, ["host-1@example.com", "unknown@example.com"])
+
+    assert list(result) == ["host-1@example.com"]
@@ -0,0 +1,161 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from appserver.libs.google.calendar.fake import (
+    FakeGoogleCalendarBackend,
+    build_fake_service,
+    fake_httpx_transport,
+)
+from appserver.libs.google.calendar.services import GoogleCalendarService, GoogleCalendarUnavailableError
+from appserver.libs.google.calendar.transport import AsyncGoogleTransport
+
+
+CALENDAR_ID = "host@example.com"
+
+
+class FakeCredentials:
+    def __init__(self):
+        self.token = None
+        self.refreshed = 0
+
+    @property
+    def valid(self) -> bool:
+        return self.token is not None
+
+    def refresh(self, request):
+        time.sleep(0.01)
+        self.refreshed += 1
+        self.token = f"token-{self.refreshed}"
+
+    def apply(self, headers: dict):
+        headers["authorization"] = f"Bearer {self.token}"
+
+
+@pytest.fixture()
+def backend() -> FakeGoogleCalendarBackend:
+    return FakeGoogleCalendarBackend()
+
+
+@pytest.fixture()
+async def transport(backend: FakeGoogleCalendarBackend):
+    transport = AsyncGoogleTransport(client=httpx.AsyncClient(transport=fake_httpx_transport(backend)))
+    yield transport
+    await transport.aclose()
+
+
+@pytest.fixture()
+def service(backend: FakeGoogleCalendarBackend, transport: AsyncGoogleTransport) -> GoogleCalendarService:
+    return GoogleCalendarService(
+        CALENDAR_ID,
+        service=build_fake_service(backend),
+        transport=transport,
+        event_cache=None,
+        breaker=None,
+    )
+
+
+async def create(service: GoogleCalendarService, day: int) -> dict:
+    return await service.create_event(
+        summary=f"event {day}",
+        start_datetime=datetime(2026, 3, day, 9),
+        end_datetime=datetime(2026, 3, day, 10),
+    )
+
+
+async def test_event_round_trip(service: GoogleCalendarService):
+    event = await create(service, 2)
+
+    assert (await service.get_event(event["id"]))["summary"] == "event 2"
+    assert await service.update_event(
+        event["id"],
+        summary="changed",
+        start_datetime=datetime(2026, 3, 2, 9),
+        end_datetime=datetime(2026, 3, 2, 10),
+    )
+    assert (await service.get_event(event["id"]))["summary"] == "changed"
+    assert await service.delete_event(event["id"]) is True
+    assert await service.get_event("missing") is None
+
+
+async def test_batch_is_sent_as_one_request(service: GoogleCalendarService, backend: FakeGoogleCalendarBackend):
+    body = service.make_event_body(datetime(2026, 3, 2, 9), datetime(2026, 3, 2, 10), summary="batch")
+
+    results = await service.create_events_batch([(CALENDAR_ID, body), ("other@example.com", body)])
+
+    assert [event["summary"] for event in results] == ["batch", "batch"]
+    assert backend.request_counts["batch"] == 1
+
+
+async def test_batch_part_missing_from_response_fails_only_that_request(backend: FakeGoogleCalendarBackend):
+    async def _drop_last_part(request: httpx.Request) -> httpx.Response:
+        response = backend.dispatch(request.method, str(request.url), await request.aread(), dict(request.headers))
+        boundary = response.headers["content-type"].split("boundary=")[1]
+        parts = response.body.decode("utf-8").split(f"--{boundary}")
+        del parts[-2]
+        return httpx.Response(response.status, headers=response.headers, content=f"--{boundary}".join(parts).encode())
+
+    transport = AsyncGoogleTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(_drop_last_part)))
+    service = GoogleCalendarService(
+        CALENDAR_ID,
+        service=build_fake_service(backend),
+        transport=transport,
+        event_cache=None,
+        breaker=None,
+    )
+    body = service.make_event_body(datetime(2026, 3, 2, 9), datetime(2026, 3, 2, 10), summary="batch")
+
+    try:
+        results = await service.create_events_batch([(CALENDAR_ID, body), ("other@example.com", body)])
+    finally:
+        await transport.aclose()
+
+    assert results[0]["summary"] == "batch"
+    assert results[1] is None
+
+
+async def test_upstream_failure_is_reported_as_unavailable(
+    service: GoogleCalendarService,
+    backend: FakeGoogleCalendarBackend,
+):
+    backend.fail_next(status=503)
+
+    with pytest.raises(GoogleCalendarUnavailableError):
+        await service.event_list(
+            datetime(2026, 3, 1, tzinfo=timezone.utc),
+            datetime(2026, 3, 31, tzinfo=timezone.utc),
+        )
+
+
+async def test_concurrent_calls_do_not_wait_for_each_other(service: GoogleCalendarService, backend: FakeGoogleCalendarBackend):
+    event = await create(service, 2)
+    backend.latency = 0.1
+
+    started_at = time.perf_counter()
+    results = await asyncio.gather(*[service.get_event(event["id"]) for _ in range(50)])
+
+    assert all(result["id"] == event["id"] for result in results)
+    assert time.perf_counter() - started_at < 1.0
+
+
+async def test_access_token_is_refreshed_once_and_reused(backend: FakeGoogleCalendarBackend):
+    credentials = FakeCredentials()
+    transport = AsyncGoogleTransport(
+        credentials,
+        client=httpx.AsyncClient(transport=fake_httpx_transport(backend)),
+    )
+    service = GoogleCalendarService(
+        CALENDAR_ID,
+        service=build_fake_service(backend),
+        transport=transport,
+        event_cache=None,
+        breaker=None,
+    )
+
+    await asyncio.gather(*[service.get_event("missing") for _ in range(10)])
+    await transport.aclose()
+
+    assert credentials.refreshed == 1
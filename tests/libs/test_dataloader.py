@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from appserver.libs.dataloader import DataLoader
+
+
+class RecordingBatchLoad:
+    def __init__(self, fail: bool = False):
+        self.calls: list[list[int]] = []
+        self.fail = fail
+
+    async def __call__(self, keys: list[int]) -> dict[int, str]:
+        self.calls.append(list(keys))
+        if self.fail:
+            raise RuntimeError("boom")
+        return {key: f"value-{key}" for key in keys if key >= 0}
+
+
+async def test_batches_keys_requested_in_the_same_tick():
+    batch_load = RecordingBatchLoad()
+    loader = DataLoader(batch_load)
+
+    values = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load(-1))
+
+    assert values == ["value-1", "value-2", "value-1", None]
+    assert batch_load.calls == [[1, 2, -1]]
+    assert loader.batches == 1
+
+
+async def test_memoizes_loaded_and_missing_keys():
+    batch_load = RecordingBatchLoad()
+    loader = DataLoader(batch_load)
+
+    await loader.load_many([1, -1])
+    assert await loader.load_many([1, -1, 2]) == ["value-1", None, "value-2"]
+
+    assert batch_load.calls == [[1, -1], [2]]
+
+
+async def test_primed_keys_are_not_loaded():
+    batch_load = RecordingBatchLoad()
+    loader = DataLoader(batch_load)
+
+    loader.prime(1, "primed")
+    loader.prime(1, "ignored")
+
+    assert await loader.load(1) == "primed"
+    assert batch_load.calls == []
+
+
+async def test_clear_forgets_keys():
+    batch_load = RecordingBatchLoad()
+    loader = DataLoader(batch_load)
+
+    await loader.load(1)
+    loader.clear(1)
+    await loader.load(1)
+
+    assert batch_load.calls == [[1], [1]]
+
+
+async def test_failed_batches_are_not_memoized():
+    batch_load = RecordingBatchLoad(fail=True)
+    loader = DataLoader(batch_load)
+
+    with pytest.raises(RuntimeError):
+        await loader.load(1)
+
+    batch_load.fail = False
+    assert await loader.load(1) == "value-1"
+    assert batch_load.calls == [[1], [1]]
+
+
+async def test_nested_loads_from_batch_load_are_batched_separately():
+    inner_calls: list[list[int]] = []
+
+    async def inner_batch_load(keys: list[int]) -> dict[int, int]:
+        inner_calls.append(list(keys))
+        return {key: key * 10 for key in keys}
+
+    inner = DataLoader(inner_batch_load)
+
+    async def outer_batch_load(keys: list[int]) -> dict[int, int]:
+        values = await inner.load_many(key % 2 for key in keys)
+        return dict(zip(keys, values))
+
+    outer = DataLoader(outer_batch_load)
+
+    assert await outer.load_many([1, 2, 3]) == [10, 0, 10]
+    assert inner_calls == [[1, 0]]
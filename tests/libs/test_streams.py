@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from appserver.libs.streams import interleave
+
+
+async def delayed(values: list[int], delay: float, log: list[str] | None = None):
+    try:
+        for value in values:
+            await asyncio.sleep(delay)
+            yield value
+    finally:
+        if log is not None:
+            log.append("closed")
+
+
+async def test_items_are_emitted_in_arrival_order():
+    items = [item async for item in interleave(delayed([10, 20], 0.05), delayed([1, 2, 3], 0.01))]
+
+    assert items == [1, 2, 3, 10, 20]
+
+
+async def test_producers_wait_when_the_buffer_is_full():
+    produced: list[int] = []
+
+    async def counting():
+        for value in range(10):
+            produced.append(value)
+            yield value
+
+    items = interleave(counting(), maxsize=2)
+    assert await anext(items) == 0
+    await asyncio.sleep(0.01)
+
+    # 하나는 소비자가 가져갔고, 큐에 둘, put 에서 기다리는 하나까지만 만든다.
+    assert len(produced) == 4
+    await items.aclose()
+
+
+async def test_source_errors_are_raised_and_other_sources_are_cancelled():
+    log: list[str] = []
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+        yield
+
+    with pytest.raises(RuntimeError, match="boom"):
+        [item async for item in interleave(failing(), delayed([1, 2, 3], 1, log))]
+
+    assert log == ["closed"]
+
+
+async def test_closing_early_cancels_and_closes_sources():
+    log: list[str] = []
+    items = interleave(delayed([1], 0), delayed([1, 2], 10, log))
+
+    assert await anext(items) == 1
+    await items.aclose()
+
+    assert log == ["closed"]